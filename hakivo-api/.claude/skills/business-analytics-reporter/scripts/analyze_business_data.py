@@ -6,18 +6,110 @@ This script analyzes business sales and revenue data from CSV files and generate
 comprehensive reports with insights on areas of weakness and improvement strategies.
 """
 
-import pandas as pd
-import numpy as np
+# pandas, numpy and numba are imported inside the functions that use them so
+# the CLI's usage and missing-file paths don't pay their import cost.
 import json
+import math
+import re
 import sys
+import warnings
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Column-name keyword patterns used to detect the shape of the dataset
+_STRUCTURE_PATTERNS = {
+    'has_revenue': re.compile(r'revenue|sales|amount|price|total'),
+    'has_date': re.compile(r'date|time|month|year|period'),
+    'has_category': re.compile(r'category|product|region|department|type'),
+    'has_quantity': re.compile(r'quantity|units|count|volume'),
+    'has_customer': re.compile(r'customer|client|user'),
+}
+
+# Column-name keywords used to pick the key revenue/date/category columns
+_REVENUE_KEYWORDS = ('revenue', 'sales', 'amount', 'total', 'price', 'value')
+_DATE_KEYWORDS = ('date', 'time')
+_CATEGORY_KEYWORDS = ('category', 'product', 'region', 'type', 'department')
+
+
+def _growth_stats_loop(values):
+    """Fused period-over-period growth: (sum of growth %, valid periods, declining periods).
+
+    Matches the pandas ``(cur - prev) / prev * 100`` column it replaces:
+    growth from a zero value is +/-inf, and periods that are NaN on either
+    side (or stay at zero) have no growth rate and are skipped.
+    """
+    growth_sum = 0.0
+    growth_count = 0
+    declining = 0
+    for i in range(1, values.shape[0]):
+        prev = values[i - 1]
+        cur = values[i]
+        if math.isnan(prev) or math.isnan(cur):
+            continue
+        if prev == 0.0:
+            if cur == 0.0:
+                continue
+            growth = math.inf if cur > 0.0 else -math.inf
+        else:
+            growth = (cur - prev) / prev * 100.0
+        growth_sum += growth
+        growth_count += 1
+        if growth < 0.0:
+            declining += 1
+    return growth_sum, growth_count, declining
+
+
+def _growth_stats_numpy(values):
+    """NumPy equivalent of _growth_stats_loop for when Numba is unavailable."""
+    import numpy as np
+
+    prev = values[:-1]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        growth = (values[1:] - prev) / prev * 100.0
+        growth = growth[~np.isnan(growth)]
+        growth_sum = float(growth.sum())
+    return growth_sum, int(growth.size), int(np.count_nonzero(growth < 0))
+
+
+@lru_cache(maxsize=1)
+def _growth_stats_kernel():
+    """Return the growth-stats kernel, JIT-compiled with Numba when installed."""
+    try:
+        from numba import njit
+    except ImportError:
+        return _growth_stats_numpy
+    return njit(cache=True)(_growth_stats_loop)
+
+
+def _growth_stats(values):
+    """Compute (growth sum, valid periods, declining periods) for a float64 array."""
+    return _growth_stats_kernel()(values)
+
+
+def _average_growth(growth_sum, growth_count):
+    """Mean growth rate; 0 when undefined (no periods, or +inf and -inf both seen)."""
+    if not growth_count or math.isnan(growth_sum):
+        return 0
+    return growth_sum / growth_count
+
 
 def load_and_validate_data(csv_path):
     """Load CSV data and perform basic validation."""
+    import pandas as pd
+
     try:
-        df = pd.read_csv(csv_path)
+        try:
+            # Arrow's multithreaded reader is much faster on large files
+            df = pd.read_csv(csv_path, engine='pyarrow')
+        except (ImportError, ValueError):
+            # pyarrow not installed, or the file needs the C parser
+            df = pd.read_csv(csv_path)
         print(f"✓ Loaded data: {len(df)} rows, {len(df.columns)} columns")
         return df
     except Exception as e:
@@ -27,21 +119,62 @@ def load_and_validate_data(csv_path):
 
 def detect_data_structure(df):
     """Detect what type of business data we're working with."""
-    columns_lower = [col.lower() for col in df.columns]
-
-    data_type = {
-        'has_revenue': any(key in ' '.join(columns_lower) for key in ['revenue', 'sales', 'amount', 'price', 'total']),
-        'has_date': any(key in ' '.join(columns_lower) for key in ['date', 'time', 'month', 'year', 'period']),
-        'has_category': any(key in ' '.join(columns_lower) for key in ['category', 'product', 'region', 'department', 'type']),
-        'has_quantity': any(key in ' '.join(columns_lower) for key in ['quantity', 'units', 'count', 'volume']),
-        'has_customer': any(key in ' '.join(columns_lower) for key in ['customer', 'client', 'user'])
-    }
+    joined = ' '.join(str(col).lower() for col in df.columns)
+
+    data_type = {key: bool(pattern.search(joined)) for key, pattern in _STRUCTURE_PATTERNS.items()}
 
     return data_type
 
 
-def calculate_basic_stats(df, revenue_col=None):
+def _has_any(text, keywords):
+    """Return True if any keyword is a substring of text.
+
+    A plain loop avoids the generator frame that any(...) sets up per call.
+    """
+    for keyword in keywords:
+        if keyword in text:
+            return True
+    return False
+
+
+def _classify_columns(df):
+    """Pick the revenue, date and category columns in a single pass over the columns."""
+    import numpy as np
+
+    roles = {'revenue': None, 'date': None, 'category': None}
+
+    for col in df.columns:
+        low = str(col).lower()
+        if roles['revenue'] is None and _has_any(low, _REVENUE_KEYWORDS):
+            # Any int/uint/float width, including nullable and Arrow-backed dtypes
+            if df[col].dtype.kind in 'iuf':
+                roles['revenue'] = col
+        if roles['date'] is None and _has_any(low, _DATE_KEYWORDS):
+            roles['date'] = col
+        if roles['category'] is None and _has_any(low, _CATEGORY_KEYWORDS):
+            roles['category'] = col
+
+    # Fallback: use the first numeric column as revenue
+    if roles['revenue'] is None:
+        numeric_cols = df.select_dtypes(include=[np.number]).columns
+        roles['revenue'] = numeric_cols[0] if len(numeric_cols) > 0 else None
+
+    return roles
+
+
+def _ensure_datetime(df, col):
+    """Parse a column to datetime in place, unless it has already been parsed."""
+    import pandas as pd
+
+    if not pd.api.types.is_datetime64_any_dtype(df[col]):
+        df[col] = pd.to_datetime(df[col], errors='coerce')
+
+
+def calculate_basic_stats(df, revenue_col=None, date_col=None):
     """Calculate basic statistical metrics."""
+    import numpy as np
+    import pandas as pd
+
     stats = {
         'total_rows': len(df),
         'date_range': None,
@@ -49,27 +182,39 @@ def calculate_basic_stats(df, revenue_col=None):
     }
 
     # Detect date column
-    date_cols = [col for col in df.columns if any(x in col.lower() for x in ['date', 'time'])]
-    if date_cols:
+    if date_col is None:
+        date_col = _classify_columns(df)['date']
+    if date_col is not None:
         try:
-            df[date_cols[0]] = pd.to_datetime(df[date_cols[0]], errors='coerce')
+            _ensure_datetime(df, date_col)
+            start, end = df[date_col].min(), df[date_col].max()
             stats['date_range'] = {
-                'start': df[date_cols[0]].min().strftime('%Y-%m-%d') if pd.notna(df[date_cols[0]].min()) else None,
-                'end': df[date_cols[0]].max().strftime('%Y-%m-%d') if pd.notna(df[date_cols[0]].max()) else None
+                'start': start.strftime('%Y-%m-%d') if pd.notna(start) else None,
+                'end': end.strftime('%Y-%m-%d') if pd.notna(end) else None
             }
         except:
             pass
 
-    # Calculate stats for numeric columns
-    numeric_cols = df.select_dtypes(include=[np.number]).columns
-    for col in numeric_cols:
-        stats['basic_stats'][col] = {
-            'mean': float(df[col].mean()),
-            'median': float(df[col].median()),
-            'std': float(df[col].std()),
-            'min': float(df[col].min()),
-            'max': float(df[col].max()),
-            'total': float(df[col].sum())
+    # Calculate stats for numeric columns directly on one float64 matrix
+    numeric = df.select_dtypes(include=[np.number])
+    if not numeric.columns.empty:
+        matrix = numeric.to_numpy(dtype=np.float64, na_value=np.nan)
+        with warnings.catch_warnings():
+            # All-NaN columns yield NaN, matching pandas' skipna reductions
+            warnings.simplefilter('ignore', RuntimeWarning)
+            columns = zip(
+                numeric.columns,
+                np.nanmean(matrix, axis=0).tolist(),
+                np.nanmedian(matrix, axis=0).tolist(),
+                np.nanstd(matrix, axis=0, ddof=1).tolist(),
+                np.nanmin(matrix, axis=0).tolist(),
+                np.nanmax(matrix, axis=0).tolist(),
+                np.nansum(matrix, axis=0).tolist(),
+            )
+        stats['basic_stats'] = {
+            col: {'mean': mean, 'median': median, 'std': std,
+                  'min': min_, 'max': max_, 'total': total}
+            for col, mean, median, std, min_, max_, total in columns
         }
 
     return stats
@@ -77,39 +222,36 @@ def calculate_basic_stats(df, revenue_col=None):
 
 def identify_revenue_column(df):
     """Automatically identify the revenue/sales column."""
-    revenue_keywords = ['revenue', 'sales', 'amount', 'total', 'price', 'value']
+    return _classify_columns(df)['revenue']
 
-    for col in df.columns:
-        if any(keyword in col.lower() for keyword in revenue_keywords):
-            if df[col].dtype in [np.float64, np.int64]:
-                return col
 
-    # Fallback: return first numeric column
-    numeric_cols = df.select_dtypes(include=[np.number]).columns
-    return numeric_cols[0] if len(numeric_cols) > 0 else None
+def analyze_trends(df, date_col=None, value_col=None, values=None):
+    """Analyze trends over time.
 
+    ``values`` may carry the value column already extracted as a float64
+    array, to avoid re-materializing it from the DataFrame.
+    """
+    import numpy as np
 
-def analyze_trends(df, date_col=None, value_col=None):
-    """Analyze trends over time."""
     if date_col is None or value_col is None:
         return None
 
     try:
-        df_sorted = df.sort_values(date_col)
-
-        # Calculate period-over-period growth
-        df_sorted['prev_value'] = df_sorted[value_col].shift(1)
-        df_sorted['growth_rate'] = ((df_sorted[value_col] - df_sorted['prev_value']) / df_sorted['prev_value'] * 100)
+        if values is None:
+            values = df[value_col].to_numpy(dtype=np.float64, na_value=np.nan)
 
-        avg_growth = df_sorted['growth_rate'].mean()
+        # Order only the value array by date instead of sorting the whole frame
+        order = np.argsort(df[date_col].to_numpy())
+        values = values[order]
 
-        # Identify declining periods
-        declining_periods = df_sorted[df_sorted['growth_rate'] < 0]
+        # Period-over-period growth in a single pass, without temporary columns
+        growth_sum, growth_count, declining = _growth_stats(values)
+        avg_growth = _average_growth(growth_sum, growth_count)
 
         return {
-            'average_growth_rate': float(avg_growth) if pd.notna(avg_growth) else 0,
-            'declining_period_count': len(declining_periods),
-            'declining_percentage': (len(declining_periods) / len(df_sorted) * 100) if len(df_sorted) > 0 else 0
+            'average_growth_rate': float(avg_growth),
+            'declining_period_count': int(declining),
+            'declining_percentage': (declining / len(values) * 100) if len(values) > 0 else 0
         }
     except:
         return None
@@ -121,46 +263,75 @@ def analyze_categories(df, category_col=None, value_col=None):
         return None
 
     try:
-        category_stats = df.groupby(category_col)[value_col].agg([
-            ('total', 'sum'),
-            ('average', 'mean'),
-            ('count', 'count')
-        ]).round(2)
+        grouped = df.groupby(category_col, observed=True)[value_col]
+        return _summarize_categories(grouped.agg(total='sum', average='mean', count='count'))
+    except:
+        return None
 
-        # Calculate percentage contribution
-        category_stats['percentage'] = (category_stats['total'] / category_stats['total'].sum() * 100).round(2)
 
-        # Identify underperforming categories (bottom 25%)
-        threshold = category_stats['average'].quantile(0.25)
-        underperforming = category_stats[category_stats['average'] <= threshold]
+def _summarize_categories(category_stats):
+    """Derive shares and under/over-performers from per-category total/average/count."""
+    import numpy as np
 
-        return {
-            'categories': category_stats.to_dict('index'),
-            'underperforming_categories': list(underperforming.index),
-            'top_category': category_stats['total'].idxmax(),
-            'bottom_category': category_stats['total'].idxmin()
-        }
-    except:
-        return None
+    category_stats = category_stats.round(2)
+
+    # Work on the underlying arrays to avoid intermediate Series
+    totals = category_stats['total'].to_numpy()
+    averages = category_stats['average'].to_numpy()
+
+    # Calculate percentage contribution
+    category_stats['percentage'] = (totals / totals.sum() * 100).round(2)
+
+    # Identify underperforming categories (bottom 25%)
+    threshold = np.nanquantile(averages, 0.25)
+
+    return {
+        'categories': category_stats.to_dict('index'),
+        'underperforming_categories': category_stats.index[averages <= threshold].tolist(),
+        'top_category': category_stats.index[totals.argmax()],
+        'bottom_category': category_stats.index[totals.argmin()]
+    }
 
 
 def calculate_variability(df, value_col):
     """Calculate coefficient of variation to assess stability."""
+    import numpy as np
+
     try:
-        mean_val = df[value_col].mean()
-        std_val = df[value_col].std()
-        cv = (std_val / mean_val * 100) if mean_val != 0 else 0
+        values = df[value_col].to_numpy(dtype=np.float64, na_value=np.nan)
+    except:
+        return None
+    return _variability(values)
 
-        return {
-            'coefficient_of_variation': float(cv),
-            'stability_assessment': 'High volatility' if cv > 50 else 'Moderate volatility' if cv > 25 else 'Stable'
-        }
+
+def _variability(values):
+    """calculate_variability for the value column as a float64 array; NaNs are ignored."""
+    import numpy as np
+
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)
+            mean_val = np.nanmean(values)
+            std_val = np.nanstd(values, ddof=1)
+        return _assess_variability(mean_val, std_val)
     except:
         return None
 
 
+def _assess_variability(mean_val, std_val):
+    """Turn a mean and standard deviation into a coefficient-of-variation finding."""
+    cv = (std_val / mean_val * 100) if mean_val != 0 else 0
+
+    return {
+        'coefficient_of_variation': float(cv),
+        'stability_assessment': 'High volatility' if cv > 50 else 'Moderate volatility' if cv > 25 else 'Stable'
+    }
+
+
 def generate_analysis_report(df):
     """Generate comprehensive analysis report."""
+    import numpy as np
+
     report = {
         'metadata': {
             'analysis_date': datetime.now().isoformat(),
@@ -172,11 +343,17 @@ def generate_analysis_report(df):
     }
 
     # Identify key columns
-    revenue_col = identify_revenue_column(df)
-    date_cols = [col for col in df.columns if any(x in col.lower() for x in ['date', 'time'])]
-    date_col = date_cols[0] if date_cols else None
-    category_cols = [col for col in df.columns if any(x in col.lower() for x in ['category', 'product', 'region', 'type', 'department'])]
-    category_col = category_cols[0] if category_cols else None
+    key_columns = _classify_columns(df)
+    revenue_col = key_columns['revenue']
+    date_col = key_columns['date']
+    category_col = key_columns['category']
+
+    # Parse the date column once; basic stats and trends reuse the parsed values
+    if date_col is not None:
+        try:
+            _ensure_datetime(df, date_col)
+        except Exception:
+            pass
 
     report['key_columns'] = {
         'revenue_column': revenue_col,
@@ -184,14 +361,18 @@ def generate_analysis_report(df):
         'category_column': category_col
     }
 
+    # Extract the revenue column once as a contiguous float64 array
+    revenue = None
+    if revenue_col:
+        revenue = df[revenue_col].to_numpy(dtype=np.float64, na_value=np.nan)
+
     # Basic statistics
-    report['findings']['basic_statistics'] = calculate_basic_stats(df, revenue_col)
+    report['findings']['basic_statistics'] = calculate_basic_stats(df, revenue_col, date_col)
 
     # Trend analysis
     if date_col and revenue_col:
         try:
-            df[date_col] = pd.to_datetime(df[date_col], errors='coerce')
-            report['findings']['trend_analysis'] = analyze_trends(df, date_col, revenue_col)
+            report['findings']['trend_analysis'] = analyze_trends(df, date_col, revenue_col, revenue)
         except:
             report['findings']['trend_analysis'] = None
 
@@ -201,7 +382,192 @@ def generate_analysis_report(df):
 
     # Variability analysis
     if revenue_col:
-        report['findings']['variability'] = calculate_variability(df, revenue_col)
+        report['findings']['variability'] = _variability(revenue)
+
+    return report
+
+
+class _RunningStats:
+    """Mergeable per-column count/mean/M2/min/max/total over streamed chunks."""
+
+    def __init__(self, width):
+        import numpy as np
+
+        self.count = np.zeros(width)
+        self.mean = np.zeros(width)
+        self.m2 = np.zeros(width)
+        self.total = np.zeros(width)
+        self.min = np.full(width, np.inf)
+        self.max = np.full(width, -np.inf)
+
+    def update(self, matrix):
+        """Fold a (rows, width) float64 chunk in with Chan's parallel variance update."""
+        import numpy as np
+
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)
+            chunk_count = np.count_nonzero(~np.isnan(matrix), axis=0).astype(np.float64)
+            chunk_total = np.nansum(matrix, axis=0)
+            chunk_mean = chunk_total / np.maximum(chunk_count, 1)
+            chunk_m2 = np.nansum((matrix - chunk_mean) ** 2, axis=0)
+            self.min = np.fmin(self.min, np.nanmin(matrix, axis=0))
+            self.max = np.fmax(self.max, np.nanmax(matrix, axis=0))
+
+        count = self.count + chunk_count
+        safe_count = np.maximum(count, 1)
+        delta = chunk_mean - self.mean
+        self.mean = self.mean + delta * chunk_count / safe_count
+        self.m2 = self.m2 + chunk_m2 + delta ** 2 * self.count * chunk_count / safe_count
+        self.count = count
+        self.total = self.total + chunk_total
+
+    def std(self):
+        """Sample standard deviation (ddof=1), NaN where fewer than two values."""
+        import numpy as np
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(self.count > 1, np.sqrt(self.m2 / (self.count - 1)), np.nan)
+
+
+def generate_streaming_report(csv_path, chunksize=200_000, sample_size=100_000):
+    """Generate the analysis report by streaming the CSV in chunks.
+
+    Instead of the full DataFrame, only running aggregates are kept: per-column
+    moments, per-category totals, a fixed-size uniform row sample used for
+    (approximate) medians, and the (date, revenue) pairs needed to order the
+    trend analysis.
+    """
+    import numpy as np
+    import pandas as pd
+
+    rng = np.random.default_rng(0)
+    rows = 0
+    first_chunk = None
+    dates, revenues = [], []
+    category_totals = category_counts = None
+
+    for chunk in pd.read_csv(csv_path, chunksize=chunksize):
+        if first_chunk is None:
+            first_chunk = chunk
+            key_columns = _classify_columns(chunk)
+            revenue_col = key_columns['revenue']
+            date_col = key_columns['date']
+            category_col = key_columns['category']
+            numeric_cols = list(chunk.select_dtypes(include=[np.number]).columns)
+            running = _RunningStats(len(numeric_cols))
+            sample = np.empty((0, len(numeric_cols)))
+            sample_keys = np.empty(0)
+
+        rows += len(chunk)
+        numeric = chunk[numeric_cols].apply(pd.to_numeric, errors='coerce')
+        matrix = numeric.to_numpy(dtype=np.float64, na_value=np.nan)
+        running.update(matrix)
+
+        # Bottom-k on random keys keeps a uniform row sample of bounded size
+        sample_keys = np.concatenate([sample_keys, rng.random(len(matrix))])
+        sample = np.concatenate([sample, matrix])
+        if len(sample_keys) > sample_size:
+            keep = np.argpartition(sample_keys, sample_size)[:sample_size]
+            sample_keys, sample = sample_keys[keep], sample[keep]
+
+        revenue = None
+        if revenue_col is not None:
+            revenue = pd.to_numeric(chunk[revenue_col], errors='coerce').to_numpy(
+                dtype=np.float64, na_value=np.nan)
+
+        if date_col is not None:
+            parsed = pd.to_datetime(chunk[date_col], errors='coerce')
+            dates.append(parsed.to_numpy(dtype='datetime64[ns]'))
+            if revenue is not None:
+                revenues.append(revenue)
+
+        if category_col is not None and revenue is not None:
+            grouped = pd.Series(revenue, index=chunk.index).groupby(
+                chunk[category_col], observed=True)
+            sums, counts = grouped.sum(), grouped.count()
+            if category_totals is None:
+                category_totals, category_counts = sums, counts
+            else:
+                category_totals = category_totals.add(sums, fill_value=0)
+                category_counts = category_counts.add(counts, fill_value=0)
+
+    if first_chunk is None:
+        # Header-only file: nothing to stream
+        return generate_analysis_report(pd.read_csv(csv_path))
+
+    report = {
+        'metadata': {
+            'analysis_date': datetime.now().isoformat(),
+            'data_shape': {'rows': rows, 'columns': len(first_chunk.columns)},
+            'columns': list(first_chunk.columns),
+            'streaming': True
+        },
+        'data_structure': detect_data_structure(first_chunk),
+        'key_columns': {
+            'revenue_column': revenue_col,
+            'date_column': date_col,
+            'category_column': category_col
+        },
+        'findings': {}
+    }
+
+    # Basic statistics (medians are estimated from the row sample)
+    stats = {'total_rows': rows, 'date_range': None, 'basic_stats': {}}
+    all_dates = np.concatenate(dates) if dates else np.empty(0, dtype='datetime64[ns]')
+    valid_dates = all_dates[~np.isnat(all_dates)]
+    if date_col is not None:
+        stats['date_range'] = {
+            'start': str(valid_dates.min().astype('datetime64[D]')) if valid_dates.size else None,
+            'end': str(valid_dates.max().astype('datetime64[D]')) if valid_dates.size else None
+        }
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)
+        medians = np.nanmedian(sample, axis=0) if len(sample) else np.full(len(numeric_cols), np.nan)
+    means = np.where(running.count > 0, running.mean, np.nan)
+    stds = running.std()
+    mins = np.where(np.isinf(running.min), np.nan, running.min)
+    maxs = np.where(np.isinf(running.max), np.nan, running.max)
+    columns = zip(means.tolist(), medians.tolist(), stds.tolist(),
+                  mins.tolist(), maxs.tolist(), running.total.tolist())
+    stats['basic_stats'] = {
+        col: {'mean': mean, 'median': median, 'std': std, 'min': lo, 'max': hi, 'total': total}
+        for col, (mean, median, std, lo, hi, total) in zip(numeric_cols, columns)
+    }
+    report['findings']['basic_statistics'] = stats
+
+    revenue_idx = numeric_cols.index(revenue_col) if revenue_col in numeric_cols else None
+
+    # Trend analysis: order the collected revenue values by date
+    if date_col and revenue_col:
+        try:
+            values = np.concatenate(revenues)[np.argsort(all_dates)]
+            growth_sum, growth_count, declining = _growth_stats(values)
+            avg_growth = _average_growth(growth_sum, growth_count)
+            report['findings']['trend_analysis'] = {
+                'average_growth_rate': float(avg_growth),
+                'declining_period_count': int(declining),
+                'declining_percentage': (declining / len(values) * 100) if len(values) > 0 else 0
+            }
+        except Exception:
+            report['findings']['trend_analysis'] = None
+
+    # Category analysis from the accumulated per-category sums and counts
+    if category_col and revenue_col:
+        try:
+            with np.errstate(divide='ignore', invalid='ignore'):
+                category_stats = pd.DataFrame({
+                    'total': category_totals,
+                    'average': category_totals / category_counts.where(category_counts > 0),
+                    'count': category_counts.astype(np.int64)
+                })
+            report['findings']['category_analysis'] = _summarize_categories(category_stats)
+        except Exception:
+            report['findings']['category_analysis'] = None
+
+    # Variability analysis from the running moments
+    if revenue_idx is not None:
+        report['findings']['variability'] = _assess_variability(means[revenue_idx], stds[revenue_idx])
 
     return report
 
@@ -337,24 +703,62 @@ def generate_improvement_strategies(weak_areas, report):
     return strategies
 
 
+def _json_default(obj):
+    """Convert NumPy scalars/arrays for the stdlib json fallback."""
+    if hasattr(obj, 'tolist'):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def write_report(report, output_path):
+    """Write the report as indented JSON, using orjson when available"""
+    if orjson is not None:
+        with open(output_path, 'wb') as f:
+            f.write(orjson.dumps(
+                report,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+            ))
+    else:
+        with open(output_path, 'w') as f:
+            json.dump(report, f, indent=2, default=_json_default)
+
+
 def main():
-    if len(sys.argv) < 2:
-        print("Usage: python analyze_business_data.py <path_to_csv> [output_json]")
+    streaming = '--streaming' in sys.argv[1:]
+    args = [arg for arg in sys.argv[1:] if arg != '--streaming']
+
+    if len(args) < 1:
+        print("Usage: python analyze_business_data.py <path_to_csv> [output_json] [--streaming]")
         sys.exit(1)
 
-    csv_path = sys.argv[1]
-    output_path = sys.argv[2] if len(sys.argv) > 2 else "business_analysis_report.json"
+    csv_path = args[0]
+    output_path = args[1] if len(args) > 1 else "business_analysis_report.json"
+
+    # Fail fast on a missing file before importing pandas
+    if not Path(csv_path).is_file():
+        print(f"✗ Error loading CSV: file not found: {csv_path}", file=sys.stderr)
+        sys.exit(1)
 
     print(f"\n📊 Business Data Analysis Report Generator")
     print(f"{'=' * 60}\n")
 
-    # Load data
-    print(f"Loading data from: {csv_path}")
-    df = load_and_validate_data(csv_path)
-
-    # Generate analysis
-    print("\nAnalyzing business data...")
-    report = generate_analysis_report(df)
+    if streaming:
+        # Aggregate chunk by chunk without holding the whole file in memory
+        print(f"Streaming data from: {csv_path}")
+        print("\nAnalyzing business data...")
+        try:
+            report = generate_streaming_report(csv_path)
+        except Exception as e:
+            print(f"✗ Error loading CSV: {e}", file=sys.stderr)
+            sys.exit(1)
+    else:
+        # Load data
+        print(f"Loading data from: {csv_path}")
+        df = load_and_validate_data(csv_path)
+
+        # Generate analysis
+        print("\nAnalyzing business data...")
+        report = generate_analysis_report(df)
 
     # Identify weak areas
     print("Identifying areas of weakness...")
@@ -367,8 +771,7 @@ def main():
     report['improvement_strategies'] = strategies
 
     # Save report
-    with open(output_path, 'w') as f:
-        json.dump(report, f, indent=2)
+    write_report(report, output_path)
 
     print(f"\n✓ Analysis complete! Report saved to: {output_path}")
     print(f"\nKey Findings:")
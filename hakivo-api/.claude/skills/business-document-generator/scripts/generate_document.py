@@ -6,24 +6,50 @@ This script generates professional business documents (Proposals, Business Plans
 by filling in PDF templates with user-provided data.
 """
 
+import io
 import json
 import sys
 import os
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
 try:
-    from pypdf import PdfReader, PdfWriter
-    from reportlab.pdfgen import canvas
-    from reportlab.lib.pagesizes import letter
-    from reportlab.pdfbase import pdfmetrics
-    from reportlab.pdfbase.ttfonts import TTFont
-    from reportlab.lib.colors import HexColor
-    import io
+    import orjson
 except ImportError:
-    print("ERROR: Required packages not installed.")
-    print("Please run: pip install pypdf reportlab")
-    sys.exit(1)
+    orjson = None
+
+# PDF libraries are bound by _import_pdf_libs() on first generation, so
+# importing this module or running --help doesn't pay reportlab's import cost
+PdfReader = PdfWriter = canvas = letter = HexColor = pikepdf = None
+
+
+def _import_pdf_libs():
+    """Import pypdf/reportlab (and optional pikepdf) on first use"""
+    global PdfReader, PdfWriter, canvas, letter, HexColor, pikepdf
+    if PdfReader is not None:
+        return
+
+    try:
+        from pypdf import PdfReader, PdfWriter
+        from reportlab.pdfgen import canvas
+        from reportlab.lib.pagesizes import letter
+        from reportlab.lib.colors import HexColor
+    except ImportError:
+        print("ERROR: Required packages not installed.")
+        print("Please run: pip install pypdf reportlab")
+        sys.exit(1)
+
+    try:
+        import pikepdf
+    except ImportError:
+        pikepdf = None
+
+
+@lru_cache(maxsize=None)
+def _color(hex_value):
+    """Parse a hex color once; the Color objects are reused across canvases"""
+    return HexColor(hex_value)
 
 
 class DocumentGenerator:
@@ -35,11 +61,133 @@ class DocumentGenerator:
         'budget': 'Annual Budget Plan Template.pdf'
     }
 
+    # Static (data-independent) cover page drawing per document type
+    STATIC_LAYERS = {
+        'proposal': '_draw_proposal_static',
+        'budget': '_draw_budget_static'
+    }
+
+    # Data fields drawn onto each document type's cover page
+    DYNAMIC_FIELDS = {
+        'proposal': ('title', 'subtitle', 'client_org', 'client_contact',
+                     'company_name', 'contact_info', 'date'),
+        'business_plan': ('company_name', 'date'),
+        'budget': ('fiscal_year', 'company_name', 'date')
+    }
+
+    # Raw template bytes keyed by path, shared by all generators in the process
+    _TEMPLATE_CACHE = {}
+
+    # Template bytes with the static layer stamped on, keyed by (type, path)
+    _BASE_CACHE = {}
+
+    # Last placeholder-only rendering per (type, path), valid for one date
+    _DEFAULT_CACHE = {}
+
+    # Parsed JSON data files keyed by path, revalidated by mtime and size
+    _DATA_CACHE = {}
+
     def __init__(self, templates_dir, output_dir=None):
         self.templates_dir = Path(templates_dir)
         self.output_dir = Path(output_dir) if output_dir else Path.cwd()
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
+    def _template_bytes(self, template_path):
+        """
+        Return a template's raw bytes, reading the file only once
+
+        The bytes are cached per path and revalidated against the file's
+        mtime and size, so edited templates are picked up.
+        """
+        stat = template_path.stat()
+        key = (stat.st_mtime_ns, stat.st_size)
+        cached = self._TEMPLATE_CACHE.get(template_path)
+        if cached is None or cached[0] != key:
+            cached = (key, template_path.read_bytes())
+            self._TEMPLATE_CACHE[template_path] = cached
+        return cached[1]
+
+    def _load_template(self, document_type, template_path):
+        """
+        Return template bytes with the document type's static layer applied
+
+        The static labels/shapes for the document type are merged onto the
+        cover page once and the result is cached, so each generation only
+        has to draw and merge the data-dependent text.
+        """
+        raw = self._template_bytes(template_path)
+        draw_static = self.STATIC_LAYERS.get(document_type)
+        if draw_static is None:
+            return raw
+
+        key = (document_type, template_path)
+        cached = self._BASE_CACHE.get(key)
+        if cached is None or cached[0] is not raw:
+            packet = io.BytesIO()
+            can = canvas.Canvas(packet, pagesize=letter)
+            getattr(self, draw_static)(can)
+            can.showPage()
+            can.save()
+
+            stamped = io.BytesIO()
+            self._merge_overlay(raw, packet.getvalue(), stamped)
+            cached = (raw, stamped.getvalue())
+            self._BASE_CACHE[key] = cached
+        return cached[1]
+
+    @staticmethod
+    def _merge_overlay(base_bytes, overlay_bytes, output):
+        """
+        Stamp each overlay page onto the matching base page and save to output
+
+        Uses pikepdf (qpdf) when installed, which merges at native speed
+        without re-encoding content streams; otherwise falls back to pypdf.
+        File paths are written with a single write of the finished bytes.
+        """
+        if isinstance(output, (str, Path)):
+            buffer = io.BytesIO()
+            DocumentGenerator._merge_overlay(base_bytes, overlay_bytes, buffer)
+            Path(output).write_bytes(buffer.getvalue())
+            return
+
+        if pikepdf is not None:
+            with pikepdf.Pdf.open(io.BytesIO(base_bytes)) as pdf, \
+                    pikepdf.Pdf.open(io.BytesIO(overlay_bytes)) as overlay:
+                for page, overlay_page in zip(pdf.pages, overlay.pages):
+                    # Place the overlay at its own size from the origin, as
+                    # pypdf's merge_page does, rather than scaling it to fit
+                    pikepdf.Page(page).add_overlay(
+                        overlay_page, pikepdf.Rectangle(overlay_page.mediabox)
+                    )
+                pdf.save(output)
+            return
+
+        # Clone the base document once and stamp only the overlaid pages,
+        # instead of copying every page through add_page
+        writer = PdfWriter(clone_from=io.BytesIO(base_bytes))
+        overlay = PdfReader(io.BytesIO(overlay_bytes))
+
+        for page, overlay_page in zip(writer.pages, overlay.pages):
+            page.merge_page(overlay_page)
+
+        writer.write(output)
+
+    @staticmethod
+    def _draw_proposal_static(can):
+        """Draw the proposal cover labels that don't depend on data"""
+        can.setFillColor(_color("#1e3a5f"))
+        can.setFont("Helvetica-Bold", 12)
+        can.drawCentredString(306, 520, "Prepared For:")
+        can.drawCentredString(306, 440, "Prepared By:")
+
+    @staticmethod
+    def _draw_budget_static(can):
+        """Draw white rectangles that cover the budget template's placeholder text"""
+        can.setFillColor(_color("#FFFFFF"))
+        can.rect(200, 655, 220, 30, fill=1, stroke=0)  # Cover "Fiscal Year [YYYY]"
+        can.rect(200, 625, 220, 25, fill=1, stroke=0)  # Cover "Your Company Name"
+        can.rect(200, 595, 220, 25, fill=1, stroke=0)  # Cover date
+
     def generate_from_json(self, document_type, data_file, output_filename=None):
         """
         Generate a document from a template and JSON data file
@@ -52,11 +200,25 @@ class DocumentGenerator:
         Returns:
             Path to generated PDF file
         """
-        # Load data
-        with open(data_file, 'r') as f:
-            data = json.load(f)
+        return self.generate(document_type, self._load_data(data_file), output_filename)
+
+    def _load_data(self, data_file):
+        """
+        Load a JSON data file, parsing each version of the file only once
 
-        return self.generate(document_type, data, output_filename)
+        Callers that already hold the data as a dict should use generate()
+        directly and skip the file entirely.
+        """
+        data_path = Path(data_file)
+        stat = data_path.stat()
+        key = (stat.st_mtime_ns, stat.st_size)
+        cached = self._DATA_CACHE.get(data_path)
+        if cached is None or cached[0] != key:
+            raw = data_path.read_bytes()
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+            cached = (key, data)
+            self._DATA_CACHE[data_path] = cached
+        return cached[1]
 
     def generate(self, document_type, data, output_filename=None):
         """
@@ -70,6 +232,8 @@ class DocumentGenerator:
         Returns:
             Path to generated PDF file
         """
+        _import_pdf_libs()
+
         if document_type not in self.TEMPLATE_MAP:
             raise ValueError(f"Invalid document type: {document_type}. "
                            f"Must be one of: {list(self.TEMPLATE_MAP.keys())}")
@@ -87,6 +251,11 @@ class DocumentGenerator:
 
         output_path = self.output_dir / output_filename
 
+        # No cover fields supplied: every such document is identical for the day
+        if not any(field in data for field in self.DYNAMIC_FIELDS[document_type]):
+            self._generate_default(document_type, template_path, output_path)
+            return output_path
+
         # Generate the document based on type
         if document_type == 'proposal':
             self._generate_proposal(template_path, data, output_path)
@@ -97,11 +266,30 @@ class DocumentGenerator:
 
         return output_path
 
+    def _generate_default(self, document_type, template_path, output_path):
+        """
+        Write a document that only shows placeholder values
+
+        The rendering depends on nothing but the template and today's date,
+        so it is produced once and its bytes are reused for later requests.
+        """
+        today = datetime.now().strftime("%B %d, %Y")
+        base = self._load_template(document_type, template_path)
+        key = (document_type, template_path)
+        cached = self._DEFAULT_CACHE.get(key)
+        if cached is None or cached[0] is not base or cached[1] != today:
+            rendered = io.BytesIO()
+            generate = getattr(self, f'_generate_{document_type}')
+            generate(template_path, {'date': today}, rendered)
+            cached = (base, today, rendered.getvalue())
+            self._DEFAULT_CACHE[key] = cached
+
+        Path(output_path).write_bytes(cached[2])
+
     def _generate_proposal(self, template_path, data, output_path):
         """Generate a project proposal document"""
         # Read template
-        reader = PdfReader(template_path)
-        writer = PdfWriter()
+        base = self._load_template('proposal', template_path)
 
         # Create overlay with user data
         packet = io.BytesIO()
@@ -109,7 +297,7 @@ class DocumentGenerator:
 
         # Page 1 - Cover page
         can.setFont("Helvetica-Bold", 16)
-        can.setFillColor(HexColor("#1e3a5f"))
+        can.setFillColor(_color("#1e3a5f"))
 
         # Title
         title = data.get('title', 'Project Proposal Title Here')
@@ -120,17 +308,12 @@ class DocumentGenerator:
         subtitle = data.get('subtitle', 'A Comprehensive Plan')
         can.drawCentredString(306, 625, subtitle)
 
-        # Prepared For
-        can.setFont("Helvetica-Bold", 12)
-        can.drawCentredString(306, 520, "Prepared For:")
+        # Prepared For (label is part of the static layer)
         can.setFont("Helvetica", 11)
         can.drawCentredString(306, 500, data.get('client_org', 'Client/Organization Name'))
         can.drawCentredString(306, 485, data.get('client_contact', "Contact Person's Name"))
 
-        # Prepared By
-        can.setFont("Helvetica-Bold", 12)
-        can.drawCentredString(306, 440, "Prepared By:")
-        can.setFont("Helvetica", 11)
+        # Prepared By (label is part of the static layer)
         can.drawCentredString(306, 420, data.get('company_name', 'Your Company/Name'))
         can.drawCentredString(306, 405, data.get('contact_info', 'Contact Email or Phone'))
 
@@ -142,31 +325,20 @@ class DocumentGenerator:
         can.showPage()
         can.save()
 
-        # Merge with template
-        packet.seek(0)
-        overlay = PdfReader(packet)
-
-        for i, page in enumerate(reader.pages):
-            if i < len(overlay.pages):
-                page.merge_page(overlay.pages[i])
-            writer.add_page(page)
-
-        # Write output
-        with open(output_path, 'wb') as output_file:
-            writer.write(output_file)
+        # Merge with template and write output
+        self._merge_overlay(base, packet.getvalue(), output_path)
 
     def _generate_business_plan(self, template_path, data, output_path):
         """Generate a business plan document"""
         # Similar approach - overlay data on template
-        reader = PdfReader(template_path)
-        writer = PdfWriter()
+        base = self._load_template('business_plan', template_path)
 
         packet = io.BytesIO()
         can = canvas.Canvas(packet, pagesize=letter)
 
         # Page 1 - Cover page
         can.setFont("Helvetica-Bold", 18)
-        can.setFillColor(HexColor("#000000"))
+        can.setFillColor(_color("#000000"))
 
         company_name = data.get('company_name', 'Your Company Name')
         can.drawCentredString(306, 650, company_name)
@@ -178,34 +350,18 @@ class DocumentGenerator:
         can.showPage()
         can.save()
 
-        packet.seek(0)
-        overlay = PdfReader(packet)
-
-        for i, page in enumerate(reader.pages):
-            if i < len(overlay.pages):
-                page.merge_page(overlay.pages[i])
-            writer.add_page(page)
-
-        with open(output_path, 'wb') as output_file:
-            writer.write(output_file)
+        self._merge_overlay(base, packet.getvalue(), output_path)
 
     def _generate_budget(self, template_path, data, output_path):
         """Generate a budget plan document"""
-        reader = PdfReader(template_path)
-        writer = PdfWriter()
+        base = self._load_template('budget', template_path)
 
         packet = io.BytesIO()
         can = canvas.Canvas(packet, pagesize=letter)
 
         # Page 1 - Cover page
-        # Draw white rectangles to cover template text
-        can.setFillColor(HexColor("#FFFFFF"))
-        can.rect(200, 655, 220, 30, fill=1, stroke=0)  # Cover "Fiscal Year [YYYY]"
-        can.rect(200, 625, 220, 25, fill=1, stroke=0)  # Cover "Your Company Name"
-        can.rect(200, 595, 220, 25, fill=1, stroke=0)  # Cover date
-
-        # Add new text
-        can.setFillColor(HexColor("#000000"))
+        # (white rectangles covering the template text are in the static layer)
+        can.setFillColor(_color("#000000"))
         can.setFont("Helvetica-Bold", 16)
 
         fiscal_year = data.get('fiscal_year', 'YYYY')
@@ -221,16 +377,7 @@ class DocumentGenerator:
         can.showPage()
         can.save()
 
-        packet.seek(0)
-        overlay = PdfReader(packet)
-
-        for i, page in enumerate(reader.pages):
-            if i < len(overlay.pages):
-                page.merge_page(overlay.pages[i])
-            writer.add_page(page)
-
-        with open(output_path, 'wb') as output_file:
-            writer.write(output_file)
+        self._merge_overlay(base, packet.getvalue(), output_path)
 
 
 def main():
@@ -7,27 +7,68 @@ Generates comprehensive reports about CSV data quality and statistics
 import pandas as pd
 import numpy as np
 import argparse
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import json
 from datetime import datetime
+from html import escape
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 class DataProfiler:
     """Automatic data profiling for CSV files"""
 
+    # Per-column work runs on a thread pool once a frame has this many columns
+    PARALLEL_MIN_COLUMNS = 16
+
     def __init__(self, csv_path):
         """Initialize with CSV file path"""
         try:
-            self.df = pd.read_csv(csv_path)
+            self.df = self._read_csv(csv_path)
             self.csv_path = Path(csv_path)
+            self._file_size = self.csv_path.stat().st_size
             print(f"✓ Loaded CSV: {csv_path}")
         except Exception as e:
             print(f"✗ Error loading CSV: {e}", file=sys.stderr)
             sys.exit(1)
 
+    @staticmethod
+    def _read_csv(csv_path):
+        """Read the CSV with Arrow's multithreaded reader, typed like the C parser"""
+        try:
+            df = pd.read_csv(csv_path, engine='pyarrow')
+        except (ImportError, ValueError):
+            # pyarrow not installed, or the file needs the C parser
+            return pd.read_csv(csv_path)
+
+        # Arrow parses ISO dates and times, which the C parser leaves as text
+        temporal = [
+            col for col in df.columns
+            if pd.api.types.is_datetime64_any_dtype(df[col])
+            or (df[col].dtype == object
+                and pd.api.types.infer_dtype(df[col], skipna=True) in ('date', 'time', 'datetime'))
+        ]
+        if temporal:
+            df[temporal] = pd.read_csv(csv_path, usecols=temporal)[temporal]
+        return df
+
     def generate_profile(self, output_format='text'):
         """Generate comprehensive data profile"""
+        # Frame-wide scans shared by several sections, computed once
+        self._isna_mask = self.df.isna()
+        self._missing = self._isna_mask.sum()
+        self._duplicates = int(self.df.duplicated().sum())
+        self._nunique = self.df.nunique()
+        self._value_counts = {}
+        self._numeric_cols = self.df.select_dtypes(include=['number']).columns
+        self._object_cols = self.df.select_dtypes(include=['object']).columns
+
         profile = {
             'file_info': self._file_info(),
             'overview': self._overview(),
@@ -39,129 +80,218 @@ class DataProfiler:
         }
 
         if output_format == 'json':
-            return json.dumps(profile, indent=2, default=str)
+            return self._to_json(profile)
         elif output_format == 'html':
             return self._generate_html_report(profile)
         else:
             return self._generate_text_report(profile)
 
+    @staticmethod
+    def _to_json(profile):
+        """Serialize the profile as indented JSON, using orjson when available"""
+        if orjson is not None:
+            return orjson.dumps(
+                profile,
+                default=str,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+            ).decode()
+        return json.dumps(profile, indent=2, default=str)
+
     def _file_info(self):
         """Basic file information"""
         return {
             'filename': self.csv_path.name,
-            'file_size': f"{self.csv_path.stat().st_size / 1024:.2f} KB",
+            'file_size': f"{self._file_size / 1024:.2f} KB",
             'rows': len(self.df),
             'columns': len(self.df.columns)
         }
 
     def _overview(self):
         """Dataset overview"""
-        memory_usage = self.df.memory_usage(deep=True).sum() / 1024 / 1024
+        memory_usage, approximate = self._memory_usage()
+        memory_usage = memory_usage / 1024 / 1024
         return {
             'shape': f"{self.df.shape[0]} rows × {self.df.shape[1]} columns",
-            'memory_usage': f"{memory_usage:.2f} MB",
-            'duplicate_rows': int(self.df.duplicated().sum()),
+            'memory_usage': f"{'~' if approximate else ''}{memory_usage:.2f} MB",
+            'duplicate_rows': self._duplicates,
             'column_names': list(self.df.columns)
         }
 
+    def _memory_usage(self, sample_rows=10_000):
+        """
+        Memory usage in bytes, and whether it is an estimate
+
+        Deep usage has to visit every Python string, so for large frames it
+        is extrapolated from a fixed-size row sample instead.
+        """
+        n_rows = len(self.df)
+        if n_rows <= sample_rows:
+            return self.df.memory_usage(deep=True).sum(), False
+
+        sample = self.df.sample(sample_rows, random_state=0)
+        per_row = sample.memory_usage(deep=True, index=False).sum() / sample_rows
+        return per_row * n_rows + self.df.index.memory_usage(), True
+
     def _column_analysis(self):
         """Detailed column-by-column analysis"""
         columns_info = {}
+        n_rows = len(self.df)
 
-        for col in self.df.columns:
+        # Frame-wide reductions, computed once instead of per column
+        non_null = n_rows - self._missing
+        unique = self._nunique
+        numeric_cols = [col for col in self.df.columns
+                        if pd.api.types.is_numeric_dtype(self.df[col])]
+        numeric_stats = (self.df[numeric_cols].agg(['min', 'max', 'mean', 'median', 'std'])
+                         if numeric_cols else pd.DataFrame())
+
+        def analyze(col):
             col_data = self.df[col]
+            null_count = int(self._missing[col])
             info = {
                 'dtype': str(col_data.dtype),
-                'non_null_count': int(col_data.notna().sum()),
-                'null_count': int(col_data.isna().sum()),
-                'null_percentage': f"{(col_data.isna().sum() / len(col_data) * 100):.2f}%",
-                'unique_values': int(col_data.nunique()),
-                'unique_percentage': f"{(col_data.nunique() / len(col_data) * 100):.2f}%"
+                'non_null_count': int(non_null[col]),
+                'null_count': null_count,
+                'null_percentage': f"{(null_count / n_rows * 100):.2f}%",
+                'unique_values': int(unique[col]),
+                'unique_percentage': f"{(unique[col] / n_rows * 100):.2f}%"
             }
 
             # Add type-specific info
-            if pd.api.types.is_numeric_dtype(col_data):
-                info['min'] = float(col_data.min()) if not pd.isna(col_data.min()) else None
-                info['max'] = float(col_data.max()) if not pd.isna(col_data.max()) else None
-                info['mean'] = float(col_data.mean()) if not pd.isna(col_data.mean()) else None
-                info['median'] = float(col_data.median()) if not pd.isna(col_data.median()) else None
-                info['std'] = float(col_data.std()) if not pd.isna(col_data.std()) else None
+            if col in numeric_stats.columns:
+                for stat, value in numeric_stats[col].items():
+                    info[stat] = float(value) if not pd.isna(value) else None
             elif pd.api.types.is_object_dtype(col_data):
                 # String/categorical analysis
-                if col_data.notna().sum() > 0:
-                    info['most_common'] = col_data.value_counts().head(5).to_dict()
+                if non_null[col] > 0:
+                    info['most_common'] = self._text_value_counts(col).nlargest(5).to_dict()
                     info['avg_length'] = float(col_data.astype(str).str.len().mean())
 
+            return info
+
+        for col, info in zip(self.df.columns, self._map_columns(analyze, self.df.columns)):
             columns_info[col] = info
 
         return columns_info
 
+    def _map_columns(self, func, columns):
+        """
+        Apply func to each column, in order
+
+        Columns are independent and pandas/NumPy release the GIL in most
+        reductions, so wide frames are processed on a thread pool.
+        """
+        columns = list(columns)
+        if len(columns) < self.PARALLEL_MIN_COLUMNS:
+            return [func(col) for col in columns]
+
+        with ThreadPoolExecutor(max_workers=min(len(columns), os.cpu_count() or 1)) as pool:
+            return list(pool.map(func, columns))
+
+    def _text_value_counts(self, col):
+        """
+        Value frequencies of a text column, in first-appearance order
+
+        The column is factorized to integer codes once and counted with
+        bincount; the result is cached for the other profile sections.
+        Callers select with nlargest/nsmallest rather than fully sorting,
+        which keeps value_counts() tie order (first appearance).
+        """
+        counts = self._value_counts.get(col)
+        if counts is None:
+            codes, uniques = pd.factorize(self.df[col])
+            counts = pd.Series(np.bincount(codes[codes >= 0], minlength=len(uniques)),
+                               index=uniques)
+            self._value_counts[col] = counts
+        return counts
+
     def _missing_data_analysis(self):
         """Analyze missing data patterns"""
-        missing = self.df.isna().sum()
+        missing = self._missing
         missing_pct = (missing / len(self.df)) * 100
 
-        missing_data = {}
-        for col in missing[missing > 0].index:
-            missing_data[col] = {
-                'count': int(missing[col]),
-                'percentage': f"{missing_pct[col]:.2f}%"
-            }
+        # Convert the affected columns' counts to Python ints in one go
+        has_missing = missing > 0
+        missing_data = {
+            col: {'count': count, 'percentage': f"{pct:.2f}%"}
+            for col, count, pct in zip(missing.index[has_missing],
+                                       missing[has_missing].tolist(),
+                                       missing_pct[has_missing].tolist())
+        }
+
+        # One row-wise reduction over the cached mask gives both row counts
+        rows_with_any_missing = int(self._isna_mask.to_numpy().any(axis=1).sum())
 
         return {
-            'total_missing_values': int(self.df.isna().sum().sum()),
+            'total_missing_values': int(missing.sum()),
             'columns_with_missing': missing_data,
-            'complete_rows': int(self.df.notna().all(axis=1).sum()),
-            'rows_with_any_missing': int(self.df.isna().any(axis=1).sum())
+            'complete_rows': len(self.df) - rows_with_any_missing,
+            'rows_with_any_missing': rows_with_any_missing
         }
 
     def _numeric_summary(self):
         """Statistical summary for numeric columns"""
-        numeric_cols = self.df.select_dtypes(include=['number']).columns
+        numeric_cols = self._numeric_cols
 
         if len(numeric_cols) == 0:
             return {}
 
+        # Whole-frame reductions (NaN-skipping, like the per-column dropna),
+        # converted to Python floats per statistic with tolist()
+        numeric = self.df[numeric_cols]
+        counts = (len(self.df) - self._missing[numeric_cols]).tolist()
+        stats = numeric.agg(['mean', 'std', 'min', 'max', 'skew', 'kurt'])
+        quartiles = numeric.quantile([0.25, 0.50, 0.75])
+
+        rows = zip(numeric_cols, counts,
+                   *(stats.loc[stat].tolist() for stat in stats.index),
+                   *(quartiles.loc[q].tolist() for q in quartiles.index))
+
         summary = {}
-        for col in numeric_cols:
-            col_data = self.df[col].dropna()
-            if len(col_data) > 0:
+        for col, count, mean, std, lo, hi, skew, kurt, q25, q50, q75 in rows:
+            if count > 0:
                 summary[col] = {
-                    'count': int(len(col_data)),
-                    'mean': float(col_data.mean()),
-                    'std': float(col_data.std()),
-                    'min': float(col_data.min()),
-                    '25%': float(col_data.quantile(0.25)),
-                    '50%': float(col_data.quantile(0.50)),
-                    '75%': float(col_data.quantile(0.75)),
-                    'max': float(col_data.max()),
-                    'skewness': float(col_data.skew()),
-                    'kurtosis': float(col_data.kurtosis())
+                    'count': count,
+                    'mean': mean,
+                    'std': std,
+                    'min': lo,
+                    '25%': q25,
+                    '50%': q50,
+                    '75%': q75,
+                    'max': hi,
+                    'skewness': skew,
+                    'kurtosis': kurt
                 }
 
         return summary
 
     def _categorical_summary(self):
         """Summary for categorical/text columns"""
-        categorical_cols = self.df.select_dtypes(include=['object']).columns
+        categorical_cols = self._object_cols
 
         if len(categorical_cols) == 0:
             return {}
 
-        summary = {}
-        for col in categorical_cols:
-            col_data = self.df[col].dropna()
-            if len(col_data) > 0:
-                value_counts = col_data.value_counts()
-                summary[col] = {
-                    'unique_values': int(col_data.nunique()),
-                    'most_frequent': str(value_counts.index[0]) if len(value_counts) > 0 else None,
-                    'most_frequent_count': int(value_counts.iloc[0]) if len(value_counts) > 0 else None,
-                    'least_frequent': str(value_counts.index[-1]) if len(value_counts) > 0 else None,
-                    'least_frequent_count': int(value_counts.iloc[-1]) if len(value_counts) > 0 else None,
-                    'top_5_values': value_counts.head(5).to_dict()
+        def summarize(col):
+            if self._missing[col] < len(self.df):
+                value_counts = self._text_value_counts(col)
+                top = value_counts.nlargest(5)
+                # The last of the least frequent values, as in a sorted value_counts()
+                least = value_counts.nsmallest(1, keep='last')
+                return {
+                    'unique_values': int(self._nunique[col]),
+                    'most_frequent': str(top.index[0]) if len(top) > 0 else None,
+                    'most_frequent_count': int(top.iloc[0]) if len(top) > 0 else None,
+                    'least_frequent': str(least.index[0]) if len(least) > 0 else None,
+                    'least_frequent_count': int(least.iloc[0]) if len(least) > 0 else None,
+                    'top_5_values': top.to_dict()
                 }
 
+        summary = {}
+        for col, stats in zip(categorical_cols, self._map_columns(summarize, categorical_cols)):
+            if stats is not None:
+                summary[col] = stats
+
         return summary
 
     def _data_quality_checks(self):
@@ -169,7 +299,7 @@ class DataProfiler:
         issues = []
 
         # Check for high missing data
-        missing_pct = (self.df.isna().sum() / len(self.df)) * 100
+        missing_pct = (self._missing / len(self.df)) * 100
         high_missing = missing_pct[missing_pct > 50]
         if len(high_missing) > 0:
             issues.append({
@@ -180,7 +310,7 @@ class DataProfiler:
             })
 
         # Check for duplicate rows
-        duplicates = self.df.duplicated().sum()
+        duplicates = self._duplicates
         if duplicates > 0:
             issues.append({
                 'type': 'DUPLICATE_ROWS',
@@ -190,7 +320,7 @@ class DataProfiler:
             })
 
         # Check for constant columns
-        constant_cols = [col for col in self.df.columns if self.df[col].nunique() == 1]
+        constant_cols = list(self._nunique.index[self._nunique == 1])
         if len(constant_cols) > 0:
             issues.append({
                 'type': 'CONSTANT_COLUMNS',
@@ -200,8 +330,8 @@ class DataProfiler:
             })
 
         # Check for high cardinality
-        for col in self.df.select_dtypes(include=['object']).columns:
-            unique_ratio = self.df[col].nunique() / len(self.df)
+        for col in self._object_cols:
+            unique_ratio = self._nunique[col] / len(self.df)
             if unique_ratio > 0.95:
                 issues.append({
                     'type': 'HIGH_CARDINALITY',
@@ -284,7 +414,7 @@ class DataProfiler:
 
     def _generate_html_report(self, profile):
         """Generate HTML report"""
-        html = f"""
+        parts = [f"""
 <!DOCTYPE html>
 <html>
 <head>
@@ -315,7 +445,7 @@ class DataProfiler:
 
         <h2>File Information</h2>
         <div class="info-grid">
-            <div class="info-card"><strong>Filename</strong><span>{profile['file_info']['filename']}</span></div>
+            <div class="info-card"><strong>Filename</strong><span>{escape(profile['file_info']['filename'], quote=False)}</span></div>
             <div class="info-card"><strong>File Size</strong><span>{profile['file_info']['file_size']}</span></div>
             <div class="info-card"><strong>Rows</strong><span>{profile['file_info']['rows']:,}</span></div>
             <div class="info-card"><strong>Columns</strong><span>{profile['file_info']['columns']}</span></div>
@@ -336,12 +466,21 @@ class DataProfiler:
         </div>
 
         <h2>Data Quality Issues</h2>
-        {''.join([f'<div class="issue {issue["severity"]}">[{issue["severity"]}] {issue["message"]}</div>' for issue in profile['data_quality']]) if profile['data_quality'] else '<p>No issues detected</p>'}
+        """]
+
+        # Issue messages embed column names, so escape them
+        for issue in profile['data_quality']:
+            severity = escape(issue['severity'])
+            parts.append(f'<div class="issue {severity}">[{severity}] {escape(issue["message"], quote=False)}</div>')
+        if not profile['data_quality']:
+            parts.append('<p>No issues detected</p>')
+
+        parts.append("""
     </div>
 </body>
 </html>
-"""
-        return html
+""")
+        return ''.join(parts)
 
 
 def main():
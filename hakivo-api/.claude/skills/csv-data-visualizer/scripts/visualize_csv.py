@@ -5,31 +5,352 @@ Supports statistical plots, relationships, time series, and categorical data
 """
 
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
+import numpy as np
 import argparse
+import os
 import sys
+import warnings
 from pathlib import Path
 import json
+from functools import lru_cache
+
+# Plotly (and numba, when used) are imported inside the functions that
+# need them, so a CLI run only pays for the modules its plot touches
+
+
+HTML_TEMPLATE = """<html>
+<head><meta charset="utf-8" /></head>
+<body>
+    <div id="plot" class="plotly-graph-div" style="height:100%; width:100%;"></div>
+    <script type="text/javascript">{plotly_js}</script>
+    <script type="text/javascript">
+        var figure = {figure_json};
+        Plotly.newPlot("plot", figure.data, figure.layout, {{"responsive": true}});
+    </script>
+</body>
+</html>
+"""
+
+
+@lru_cache(maxsize=1)
+def _plotly_js():
+    """The bundled plotly.js source, read once per process"""
+    from plotly.offline import get_plotlyjs
+    return get_plotlyjs()
+
+
+def _figure_html(fig):
+    """Standalone HTML page for a figure, serializing it exactly once"""
+    import plotly.io as pio
+
+    # Escape "</" so figure text cannot close the script tag early
+    figure_json = pio.to_json(fig, validate=False).replace('</', '<\\/')
+    return HTML_TEMPLATE.format(plotly_js=_plotly_js(), figure_json=figure_json)
+
+
+@lru_cache(maxsize=1)
+def _rank_columns_jit():
+    """Parallel numba column ranker, built on first use; None without numba"""
+    try:
+        from numba import njit, prange
+    except ImportError:
+        return None
+
+    @njit(parallel=True, cache=True)
+    def rank_columns(X):
+        """Average ranks (ties share their mean rank) of each column of X"""
+        n, m = X.shape
+        ranks = np.empty((n, m))
+        for j in prange(m):
+            col = X[:, j]
+            order = np.argsort(col, kind='mergesort')
+            i = 0
+            while i < n:
+                k = i
+                while k + 1 < n and col[order[k + 1]] == col[order[i]]:
+                    k += 1
+                for t in range(i, k + 1):
+                    ranks[order[t], j] = (i + k) / 2 + 1
+                i = k + 1
+        return ranks
+
+    return rank_columns
+
+
+def _pairwise_sums(X, shift):
+    """Pairwise-complete counts, sums, squares and cross products of X"""
+    present = ~np.isnan(X)
+    M = present.astype(np.float64)
+    X0 = np.where(present, X - shift, 0.0)
+    return M.T @ M, X0.T @ M, (X0 * X0).T @ M, X0.T @ X0
+
+
+def _corr_from_sums(n, sx, sxx, sxy):
+    """Pearson correlation from the output of _pairwise_sums"""
+    # sx[i, j] is the sum of column i over rows where j is also present
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cov = sxy - sx * sx.T / n
+        var_i = sxx - sx * sx / n
+        corr = cov / np.sqrt(var_i * var_i.T)
+    corr[n < 2] = np.nan
+    return np.clip(corr, -1, 1)
+
+
+def _lttb(x, y, n_out):
+    """
+    Indices of a Largest-Triangle-Three-Buckets subsample of (x, y)
+
+    Keeps the first and last points and, from each of n_out - 2 buckets,
+    the point forming the largest triangle with the previously kept point
+    and the mean of the next bucket.
+    """
+    n = len(y)
+    if n_out < 3 or n <= n_out:
+        return np.arange(n)
+
+    edges = np.append(np.linspace(1, n - 1, n_out - 1).astype(np.int64), n)
+    keep = np.empty(n_out, dtype=np.int64)
+    keep[0], keep[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        avg_x = x[hi:edges[i + 2]].mean()
+        avg_y = y[hi:edges[i + 2]].mean()
+        area = np.abs((x[a] - avg_x) * (y[lo:hi] - y[a])
+                      - (x[a] - x[lo:hi]) * (avg_y - y[a]))
+        a = lo + int(area.argmax())
+        keep[i + 1] = a
+    return keep
 
 
 class CSVVisualizer:
     """Main visualization class for CSV data"""
 
-    def __init__(self, csv_path):
-        """Initialize with CSV file path"""
+    # Above this many rows, point traces render with WebGL instead of SVG
+    WEBGL_THRESHOLD = 5000
+    # Points kept per line chart trace when downsampling
+    LTTB_POINTS = 2000
+    # Spearman ranks use the parallel numba kernel only for frames with at
+    # least this many cells (and more than one core); below that, loading
+    # the compiled kernel costs more than pandas' rank()
+    SPEARMAN_JIT_MIN_CELLS = 5_000_000
+
+    def __init__(self, csv_path, usecols=None, chunksize=None):
+        """
+        Initialize with CSV file path
+
+        usecols limits parsing to the columns a plot needs. With chunksize,
+        histograms, category counts and correlations are aggregated chunk
+        by chunk without loading the whole file; other plots load it on
+        first use.
+        """
+        self.csv_path = Path(csv_path)
+        self.usecols = usecols
+        self.chunksize = chunksize
+        self._df = None
+        self._downsampled = {}
         try:
-            self.df = pd.read_csv(csv_path)
-            self.csv_path = Path(csv_path)
-            print(f"✓ Loaded CSV: {csv_path}")
-            print(f"  Rows: {len(self.df)}, Columns: {len(self.df.columns)}")
+            if chunksize:
+                # Only validate the header now; data is streamed per plot
+                columns = pd.read_csv(csv_path, usecols=usecols, nrows=0).columns
+                print(f"✓ Streaming CSV: {csv_path}")
+                print(f"  Columns: {len(columns)}, Chunk size: {chunksize}")
+            else:
+                self._df = self._read_csv()
+                print(f"✓ Loaded CSV: {csv_path}")
+                print(f"  Rows: {len(self._df)}, Columns: {len(self._df.columns)}")
         except Exception as e:
             print(f"✗ Error loading CSV: {e}", file=sys.stderr)
             sys.exit(1)
 
+    @property
+    def df(self):
+        """The full DataFrame, loaded on first access in streaming mode"""
+        if self._df is None:
+            self._df = self._read_csv()
+        return self._df
+
+    def _read_csv(self):
+        """Read the (projected) CSV, preferring Arrow's multithreaded parser"""
+        try:
+            return pd.read_csv(self.csv_path, engine='pyarrow', usecols=self.usecols)
+        except (ImportError, ValueError):
+            # pyarrow not installed, or the file needs the C parser
+            return pd.read_csv(self.csv_path, usecols=self.usecols)
+
+    def _iter_chunks(self, columns=None):
+        """Yield DataFrame chunks of the CSV restricted to columns"""
+        return pd.read_csv(self.csv_path, usecols=columns or self.usecols,
+                           chunksize=self.chunksize)
+
+    def _value_counts(self, column):
+        """Category counts for a column, most frequent first"""
+        if self._df is not None or not self.chunksize:
+            # Integer codes + bincount; a stable sort keeps value_counts() tie order
+            codes, uniques = pd.factorize(self.df[column])
+            counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+            order = np.argsort(-counts, kind='stable')
+            return pd.Series(counts[order], index=pd.Index(uniques.take(order), name=column),
+                             name='count')
+
+        counts = None
+        for chunk in self._iter_chunks([column]):
+            chunk_counts = chunk[column].value_counts()
+            counts = chunk_counts if counts is None else counts.add(chunk_counts, fill_value=0)
+        counts = counts.astype('int64').sort_values(ascending=False, kind='stable')
+        counts.index.name = column
+        return counts.rename('count')
+
+    def _histogram_counts(self, column, bins):
+        """
+        Equal-width bin counts and edges for a numeric column
+
+        In streaming mode this takes two passes over the chunks: the value
+        range, then merged per-chunk counts. Returns None if a chunk turns
+        out not to be numeric.
+        """
+        if self._df is not None or not self.chunksize:
+            values = self.df[column].to_numpy(dtype=np.float64, na_value=np.nan)
+            return np.histogram(values[~np.isnan(values)], bins=bins)
+
+        lo, hi = np.inf, -np.inf
+        for chunk in self._iter_chunks([column]):
+            if not pd.api.types.is_numeric_dtype(chunk[column]):
+                return None
+            values = chunk[column].to_numpy(dtype=np.float64, na_value=np.nan)
+            if np.isfinite(values).any():
+                lo = min(lo, np.nanmin(values))
+                hi = max(hi, np.nanmax(values))
+        if lo > hi:
+            lo, hi = 0.0, 1.0
+
+        edges = np.histogram_bin_edges([lo, hi], bins=bins, range=(lo, hi))
+        counts = np.zeros(bins, dtype=np.int64)
+        for chunk in self._iter_chunks([column]):
+            values = pd.to_numeric(chunk[column], errors='coerce').to_numpy(dtype=np.float64)
+            counts += np.histogram(values[~np.isnan(values)], bins=edges)[0]
+        return counts, edges
+
+    def _streamed_category_counts(self, column):
+        """Counts of a column's values in order of first appearance, over chunks"""
+        counts = {}
+        chunks = pd.read_csv(self.csv_path, usecols=[column], dtype={column: str},
+                             chunksize=self.chunksize)
+        for chunk in chunks:
+            for value, count in chunk[column].value_counts(sort=False).items():
+                counts[value] = counts.get(value, 0) + int(count)
+        return counts
+
+    def _downsample(self, x_col, y_col, n_out):
+        """LTTB-downsampled (x, y) of a line trace, cached per column pair"""
+        key = (x_col, y_col, n_out)
+        if key not in self._downsampled:
+            pair = self.df[[x_col, y_col]].dropna()
+            x, y = pair[x_col], pair[y_col]
+            if pd.api.types.is_datetime64_any_dtype(x):
+                x_num = x.to_numpy(dtype='datetime64[ns]').astype(np.int64).astype(np.float64)
+            elif pd.api.types.is_numeric_dtype(x):
+                x_num = x.to_numpy(dtype=np.float64)
+            else:
+                # Categorical x: space points by position
+                x_num = np.arange(len(x), dtype=np.float64)
+            keep = _lttb(x_num, y.to_numpy(dtype=np.float64), n_out)
+            self._downsampled[key] = (x.iloc[keep], y.iloc[keep])
+        return self._downsampled[key]
+
+    def _streamed_corr(self, columns=None):
+        """
+        Pairwise-complete Pearson correlation accumulated over chunks
+
+        Per chunk, only column-pair sums are kept (counts, sums, sums of
+        squares and cross products, each via a matrix product), so the
+        result matches DataFrame.corr() without holding the frame.
+        """
+        names = shift = None
+        n = sx = sxx = sxy = None
+        for chunk in self._iter_chunks(columns):
+            if names is None:
+                names = list(columns or chunk.select_dtypes(include=['number']).columns)
+            X = chunk[names].apply(pd.to_numeric, errors='coerce').to_numpy(dtype=np.float64)
+            if shift is None:
+                # Shifting by a rough mean keeps the raw sums well conditioned
+                with warnings.catch_warnings():
+                    warnings.simplefilter('ignore', RuntimeWarning)
+                    shift = np.nan_to_num(np.nanmean(X, axis=0)) if len(X) else np.zeros(len(names))
+            parts = _pairwise_sums(X, shift)
+            if n is None:
+                n, sx, sxx, sxy = parts
+            else:
+                n, sx, sxx, sxy = (a + b for a, b in zip((n, sx, sxx, sxy), parts))
+
+        if names is None:
+            return pd.DataFrame()
+
+        return pd.DataFrame(_corr_from_sums(n, sx, sxx, sxy), index=names, columns=names)
+
+    @staticmethod
+    def _matmul_corr(numeric_df):
+        """
+        Pearson correlation of an in-memory frame as matrix products
+
+        Complete data is standardized in a column-major copy and reduced
+        with a single X.T @ X; columns with gaps go through the same
+        pairwise sums as the streamed path so NaN handling matches
+        DataFrame.corr().
+        """
+        names = list(numeric_df.columns)
+        X = np.asfortranarray(numeric_df.to_numpy(dtype=np.float64))
+        if len(X) and not np.isnan(X).any():
+            X = X - X.mean(axis=0)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                X /= X.std(axis=0, ddof=1)
+                corr = np.clip((X.T @ X) / (len(X) - 1), -1, 1)
+        else:
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore', RuntimeWarning)
+                shift = np.nan_to_num(np.nanmean(X, axis=0)) if len(X) else np.zeros(len(names))
+            corr = _corr_from_sums(*_pairwise_sums(X, shift))
+        return pd.DataFrame(corr, index=names, columns=names)
+
     def histogram(self, column, bins=30, output=None):
         """Create histogram for a numeric column"""
+        import plotly.express as px
+        import plotly.graph_objects as go
+
+        # Bin with NumPy and hand plotly only the bar heights, not every value
+        streaming = self._df is None and self.chunksize
+        binned = None
+        if streaming or pd.api.types.is_numeric_dtype(self.df[column]):
+            binned = self._histogram_counts(column, bins)
+
+        if binned is not None:
+            counts, edges = binned
+            fig = go.Figure(go.Bar(
+                x=(edges[:-1] + edges[1:]) / 2,
+                y=counts,
+                width=np.diff(edges)
+            ))
+            fig.update_layout(
+                title=f"Distribution of {column}",
+                xaxis_title=column,
+                yaxis_title='Frequency',
+                bargap=0,
+                showlegend=False
+            )
+            return self._save_figure(fig, output, f"histogram_{column}")
+
+        if streaming:
+            # Non-numeric column: one bar per value, as px.histogram draws it
+            counts = self._streamed_category_counts(column)
+            fig = go.Figure(go.Bar(x=list(counts), y=list(counts.values())))
+            fig.update_layout(
+                title=f"Distribution of {column}",
+                xaxis_title=column,
+                yaxis_title='Frequency',
+                showlegend=False
+            )
+            return self._save_figure(fig, output, f"histogram_{column}")
+
         fig = px.histogram(
             self.df,
             x=column,
@@ -42,6 +363,8 @@ class CSVVisualizer:
 
     def box_plot(self, column, group_by=None, output=None):
         """Create box plot for numeric column, optionally grouped"""
+        import plotly.express as px
+
         if group_by:
             fig = px.box(
                 self.df,
@@ -59,6 +382,15 @@ class CSVVisualizer:
 
     def scatter_plot(self, x_col, y_col, color=None, size=None, output=None):
         """Create scatter plot showing relationship between two variables"""
+        import plotly.express as px
+        import plotly.graph_objects as go
+
+        large = len(self.df) > self.WEBGL_THRESHOLD
+        # For large numeric data the trend line is a direct least-squares fit
+        # instead of a statsmodels OLS run
+        fit_line = (large and color is None
+                    and pd.api.types.is_numeric_dtype(self.df[x_col])
+                    and pd.api.types.is_numeric_dtype(self.df[y_col]))
         fig = px.scatter(
             self.df,
             x=x_col,
@@ -66,38 +398,99 @@ class CSVVisualizer:
             color=color,
             size=size,
             title=f"{y_col} vs {x_col}",
-            trendline="ols" if color is None else None
+            trendline="ols" if color is None and not fit_line else None,
+            render_mode='webgl' if large else 'auto'
         )
+        if fit_line:
+            x = self.df[x_col].to_numpy(dtype=np.float64, na_value=np.nan)
+            y = self.df[y_col].to_numpy(dtype=np.float64, na_value=np.nan)
+            valid = np.isfinite(x) & np.isfinite(y)
+            if valid.sum() > 1:
+                slope, intercept = np.polyfit(x[valid], y[valid], 1)
+                ends = np.array([x[valid].min(), x[valid].max()])
+                fig.add_trace(go.Scattergl(
+                    x=ends,
+                    y=slope * ends + intercept,
+                    mode='lines',
+                    name='OLS trendline',
+                    showlegend=False
+                ))
         return self._save_figure(fig, output, f"scatter_{x_col}_{y_col}")
 
-    def correlation_heatmap(self, columns=None, output=None):
-        """Create correlation heatmap for numeric columns"""
-        if columns:
-            numeric_df = self.df[columns]
+    @staticmethod
+    def _spearman_corr(numeric_df):
+        """
+        Spearman correlation as the Pearson correlation of column ranks
+
+        Complete data is ranked once per column (in parallel with numba for
+        large frames) and reduced with the matrix-product path. With gaps,
+        pandas re-ranks each pair over its shared rows, so that case stays
+        with DataFrame.corr().
+        """
+        if numeric_df.isna().to_numpy().any():
+            return numeric_df.corr(method='spearman')
+        rank_columns = None
+        if numeric_df.size >= CSVVisualizer.SPEARMAN_JIT_MIN_CELLS and (os.cpu_count() or 1) > 1:
+            rank_columns = _rank_columns_jit()
+        if rank_columns is not None:
+            ranks = rank_columns(numeric_df.to_numpy(dtype=np.float64))
+            ranked = pd.DataFrame(ranks, index=numeric_df.index, columns=numeric_df.columns)
         else:
-            numeric_df = self.df.select_dtypes(include=['number'])
+            ranked = numeric_df.rank()
+        return CSVVisualizer._matmul_corr(ranked)
 
-        corr_matrix = numeric_df.corr()
+    def correlation_heatmap(self, columns=None, output=None, method='pearson'):
+        """Create correlation heatmap for numeric columns (pearson, spearman or kendall)"""
+        import plotly.express as px
 
+        if method == 'pearson' and self._df is None and self.chunksize:
+            corr_matrix = self._streamed_corr(columns)
+        else:
+            if columns:
+                numeric_df = self.df[columns]
+            else:
+                numeric_df = self.df.select_dtypes(include=['number'])
+
+            if method == 'pearson':
+                corr_matrix = self._matmul_corr(numeric_df)
+            elif method == 'spearman':
+                corr_matrix = self._spearman_corr(numeric_df)
+            else:
+                corr_matrix = numeric_df.corr(method=method)
+
+        title = "Correlation Heatmap" if method == 'pearson' else f"{method.title()} Correlation Heatmap"
         fig = px.imshow(
             corr_matrix,
             text_auto='.2f',
             aspect="auto",
             color_continuous_scale='RdBu_r',
-            title="Correlation Heatmap"
+            title=title
         )
         return self._save_figure(fig, output, "correlation_heatmap")
 
-    def line_chart(self, x_col, y_cols, output=None):
-        """Create line chart for time series or sequential data"""
+    def line_chart(self, x_col, y_cols, output=None, downsample=True):
+        """
+        Create line chart for time series or sequential data
+
+        Series longer than twice LTTB_POINTS are downsampled with LTTB
+        unless downsample is False.
+        """
+        import plotly.graph_objects as go
+
         if isinstance(y_cols, str):
             y_cols = [y_cols]
 
+        trace = go.Scattergl if len(self.df) > self.WEBGL_THRESHOLD else go.Scatter
+        reduce = downsample and len(self.df) > 2 * self.LTTB_POINTS
         fig = go.Figure()
         for y_col in y_cols:
-            fig.add_trace(go.Scatter(
-                x=self.df[x_col],
-                y=self.df[y_col],
+            if reduce:
+                x, y = self._downsample(x_col, y_col, self.LTTB_POINTS)
+            else:
+                x, y = self.df[x_col], self.df[y_col]
+            fig.add_trace(trace(
+                x=x,
+                y=y,
                 mode='lines+markers',
                 name=y_col
             ))
@@ -111,9 +504,11 @@ class CSVVisualizer:
 
     def bar_chart(self, x_col, y_col=None, output=None):
         """Create bar chart for categorical data"""
+        import plotly.express as px
+
         if y_col is None:
             # Count occurrences
-            value_counts = self.df[x_col].value_counts().reset_index()
+            value_counts = self._value_counts(x_col).reset_index()
             value_counts.columns = [x_col, 'count']
             fig = px.bar(
                 value_counts,
@@ -132,7 +527,9 @@ class CSVVisualizer:
 
     def pie_chart(self, column, output=None):
         """Create pie chart for categorical data"""
-        value_counts = self.df[column].value_counts().reset_index()
+        import plotly.express as px
+
+        value_counts = self._value_counts(column).reset_index()
         value_counts.columns = [column, 'count']
 
         fig = px.pie(
@@ -145,6 +542,8 @@ class CSVVisualizer:
 
     def violin_plot(self, column, group_by=None, output=None):
         """Create violin plot showing distribution with probability density"""
+        import plotly.express as px
+
         if group_by:
             fig = px.violin(
                 self.df,
@@ -172,14 +571,13 @@ class CSVVisualizer:
         # Determine format from extension
         suffix = output_path.suffix.lower()
 
-        if suffix == '.html':
-            fig.write_html(str(output_path))
-        elif suffix in ['.png', '.jpg', '.jpeg', '.svg', '.pdf']:
+        if suffix in ['.png', '.jpg', '.jpeg', '.svg', '.pdf']:
             fig.write_image(str(output_path))
         else:
             # Default to HTML
-            output_path = output_path.with_suffix('.html')
-            fig.write_html(str(output_path))
+            if suffix != '.html':
+                output_path = output_path.with_suffix('.html')
+            output_path.write_text(_figure_html(fig), encoding='utf-8')
 
         print(f"✓ Saved: {output_path}")
         return str(output_path)
@@ -227,16 +625,38 @@ Examples:
     parser.add_argument('--bar', metavar='COLUMN', help='Create bar chart')
     parser.add_argument('--pie', metavar='COLUMN', help='Create pie chart')
     parser.add_argument('--correlation', action='store_true', help='Create correlation heatmap')
+    parser.add_argument('--method', choices=['pearson', 'spearman', 'kendall'], default='pearson',
+                        help='Correlation coefficient for the heatmap')
 
     # Optional parameters
     parser.add_argument('--group-by', help='Column to group by (for box/violin plots)')
     parser.add_argument('--color', help='Column for color encoding (scatter plot)')
     parser.add_argument('--size', help='Column for size encoding (scatter plot)')
+    parser.add_argument('--no-downsample', action='store_true',
+                        help='Plot every point in line charts instead of an LTTB subsample')
+    parser.add_argument('--chunksize', type=int,
+                        help='Stream the CSV in chunks of this many rows '
+                             '(histogram, bar, pie and correlation plots)')
 
     args = parser.parse_args()
 
+    # Only parse the columns the requested plot uses
+    if args.histogram:
+        needed = [args.histogram]
+    elif args.boxplot or args.violin:
+        needed = [args.boxplot or args.violin, args.group_by]
+    elif args.scatter:
+        needed = [*args.scatter, args.color, args.size]
+    elif args.line:
+        needed = [args.line[0], *args.line[1].split(',')]
+    elif args.bar or args.pie:
+        needed = [args.bar or args.pie]
+    else:
+        needed = []
+    usecols = list(dict.fromkeys(col for col in needed if col)) or None
+
     # Initialize visualizer
-    viz = CSVVisualizer(args.csv_file)
+    viz = CSVVisualizer(args.csv_file, usecols=usecols, chunksize=args.chunksize)
 
     # Create requested visualization
     if args.histogram:
@@ -250,13 +670,14 @@ Examples:
                         color=args.color, size=args.size, output=args.output)
     elif args.line:
         y_cols = args.line[1].split(',')
-        viz.line_chart(args.line[0], y_cols, output=args.output)
+        viz.line_chart(args.line[0], y_cols, output=args.output,
+                       downsample=not args.no_downsample)
     elif args.bar:
         viz.bar_chart(args.bar, output=args.output)
     elif args.pie:
         viz.pie_chart(args.pie, output=args.output)
     elif args.correlation:
-        viz.correlation_heatmap(output=args.output)
+        viz.correlation_heatmap(output=args.output, method=args.method)
     else:
         parser.print_help()
         sys.exit(1)
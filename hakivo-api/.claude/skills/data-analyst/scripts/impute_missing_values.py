@@ -8,10 +8,30 @@ import numpy as np
 import json
 import sys
 from pathlib import Path
+from collections import defaultdict
+from dataclasses import dataclass, asdict
+from typing import Optional
 from sklearn.impute import KNNImputer
 from sklearn.preprocessing import LabelEncoder
 
 
+@dataclass(slots=True)
+class ColumnLog:
+    """Imputation record for one column."""
+    method: str
+    missing_before: int
+    reasoning: str
+    action: str = ''
+    missing_after: Optional[int] = None
+
+    def to_dict(self):
+        """Report form; missing_after is only present once a column was imputed."""
+        entry = asdict(self)
+        if self.missing_after is None:
+            del entry['missing_after']
+        return entry
+
+
 def impute_column(df, col, method, params=None):
     """
     Impute missing values in a specific column using the specified method.
@@ -25,7 +45,8 @@ def impute_column(df, col, method, params=None):
     Returns:
         Series with imputed values
     """
-    series = df[col].copy()
+    # Every fill below returns a new Series, so no upfront copy is needed
+    series = df[col]
     params = params or {}
 
     if method == 'mean':
@@ -41,9 +62,13 @@ def impute_column(df, col, method, params=None):
         return series
 
     elif method == 'most_frequent':
-        # Same as mode but explicitly for categorical
-        most_frequent = series.value_counts().idxmax() if len(series.value_counts()) > 0 else None
-        return series.fillna(most_frequent)
+        # Same as mode but explicitly for categorical; one factorize pass,
+        # ties go to the value seen first as with value_counts().idxmax()
+        codes, uniques = pd.factorize(series)
+        codes = codes[codes >= 0]
+        if len(codes) > 0:
+            return series.fillna(uniques[np.bincount(codes).argmax()])
+        return series
 
     elif method == 'constant':
         fill_value = params.get('fill_value', 'Unknown')
@@ -82,6 +107,50 @@ def impute_column(df, col, method, params=None):
         return series
 
 
+def impute_columns(df, cols, method, params=None):
+    """
+    Impute missing values in several columns that share one method.
+
+    Fill values are computed for the whole column group at once and the
+    group is filled in a single pass; methods without a frame-level
+    equivalent fall back to impute_column per column.
+
+    Args:
+        df: DataFrame
+        cols: List of column names
+        method: Imputation method
+        params: Additional parameters for the method
+
+    Returns:
+        DataFrame with the imputed columns
+    """
+    frame = df[cols]
+    params = params or {}
+
+    if method == 'mean':
+        return frame.fillna(frame.mean())
+
+    elif method == 'median':
+        return frame.fillna(frame.median())
+
+    elif method == 'mode':
+        modes = frame.mode()
+        if len(modes) > 0:
+            return frame.fillna(modes.iloc[0])
+        return frame
+
+    elif method == 'constant':
+        return frame.fillna(params.get('fill_value', 'Unknown'))
+
+    elif method == 'forward_fill':
+        return frame.ffill()
+
+    elif method == 'backward_fill':
+        return frame.bfill()
+
+    return pd.DataFrame({col: impute_column(df, col, method, params) for col in cols}, index=df.index)
+
+
 def batch_knn_imputation(df, columns_for_knn, n_neighbors=5):
     """
     Perform KNN imputation on multiple numeric columns simultaneously.
@@ -103,9 +172,17 @@ def batch_knn_imputation(df, columns_for_knn, n_neighbors=5):
     if not numeric_cols:
         return df
 
-    # Perform KNN imputation
-    imputer = KNNImputer(n_neighbors=n_neighbors)
-    df[numeric_cols] = imputer.fit_transform(df[numeric_cols])
+    # Neighbour search runs on a contiguous float32 copy (half the memory
+    # traffic of float64); only the missing cells take the imputed values,
+    # so observed data keeps its full precision
+    X = np.ascontiguousarray(df[numeric_cols].to_numpy(dtype=np.float32, na_value=np.nan))
+    missing = np.isnan(X)
+    imputer = KNNImputer(n_neighbors=n_neighbors, copy=False)
+    imputed = imputer.fit_transform(X)
+
+    values = df[numeric_cols].to_numpy(dtype=np.float64, na_value=np.nan)
+    values[missing] = imputed[missing]
+    df[numeric_cols] = values
 
     return df
 
@@ -139,8 +216,11 @@ def impute_missing_values(filepath, analysis_json=None, output_file=None, create
     # Track imputation actions
     imputation_log = {}
     columns_to_drop = []
-    rows_to_drop_mask = pd.Series([False] * len(df))
+    row_drop_columns = []
     knn_columns = []
+    # Columns sharing a method (and constant) are imputed together below
+    method_groups = defaultdict(list)
+    columns_imputed = 0
 
     # Create missing indicators if requested
     if create_missing_indicators:
@@ -148,53 +228,66 @@ def impute_missing_values(filepath, analysis_json=None, output_file=None, create
             indicator_col = f'{col}_was_missing'
             df[indicator_col] = df[col].isna().astype(int)
 
-    # Process each column with missing values
+    # Classify each column with missing values in a single pass
     for col, col_analysis in analysis['column_analysis'].items():
         strategy = col_analysis['imputation_strategy']
         method = strategy['method']
 
-        imputation_log[col] = {
-            'method': method,
-            'missing_before': col_analysis['missing_count'],
-            'reasoning': strategy['reasoning']
-        }
+        imputation_log[col] = log = ColumnLog(
+            method=method,
+            missing_before=col_analysis['missing_count'],
+            reasoning=strategy['reasoning']
+        )
 
         if method == 'drop_or_flag':
             if col_analysis['missing_percentage'] > 70:
                 columns_to_drop.append(col)
-                imputation_log[col]['action'] = f"Dropped column ({col_analysis['missing_percentage']:.1f}% missing)"
+                log.action = f"Dropped column ({col_analysis['missing_percentage']:.1f}% missing)"
             else:
                 # Keep column, user can decide
-                imputation_log[col]['action'] = f"Flagged for review ({col_analysis['missing_percentage']:.1f}% missing)"
+                log.action = f"Flagged for review ({col_analysis['missing_percentage']:.1f}% missing)"
 
         elif method == 'drop_rows':
-            rows_to_drop_mask |= df[col].isna()
-            imputation_log[col]['action'] = "Marked rows for deletion"
+            row_drop_columns.append(col)
+            log.action = "Marked rows for deletion"
 
         elif method == 'knn':
             knn_columns.append(col)
-            imputation_log[col]['action'] = "Queued for KNN imputation"
+            columns_imputed += 1
+            log.action = "Queued for KNN imputation"
 
         elif method.startswith('constant:'):
             # Extract the constant value
             fill_value = method.split(':', 1)[1]
-            df[col] = impute_column(df, col, 'constant', {'fill_value': fill_value})
-            imputation_log[col]['action'] = f"Filled with constant: {fill_value}"
-            imputation_log[col]['missing_after'] = df[col].isna().sum()
+            method_groups[('constant', fill_value)].append(col)
+            columns_imputed += 1
+            log.action = f"Filled with constant: {fill_value}"
 
         else:
             # Standard imputation methods
-            df[col] = impute_column(df, col, method)
-            imputation_log[col]['action'] = f"Imputed using {method}"
-            imputation_log[col]['missing_after'] = df[col].isna().sum()
+            method_groups[(method, None)].append(col)
+            columns_imputed += 1
+            log.action = f"Imputed using {method}"
+
+    # Rows with gaps in any drop_rows column, in one reduction
+    if row_drop_columns:
+        rows_to_drop_mask = df[row_drop_columns].isna().to_numpy().any(axis=1)
+    else:
+        rows_to_drop_mask = np.zeros(len(df), dtype=bool)
+
+    for (method, fill_value), cols in method_groups.items():
+        params = {'fill_value': fill_value} if method == 'constant' else None
+        df[cols] = impute_columns(df, cols, method, params)
+        for col, missing_after in df[cols].isna().sum().items():
+            imputation_log[col].missing_after = int(missing_after)
 
     # Perform batch KNN imputation
     if knn_columns:
         print(f"Performing KNN imputation on {len(knn_columns)} columns...")
         df = batch_knn_imputation(df, knn_columns)
         for col in knn_columns:
-            imputation_log[col]['action'] = "Imputed using KNN"
-            imputation_log[col]['missing_after'] = df[col].isna().sum()
+            imputation_log[col].action = "Imputed using KNN"
+            imputation_log[col].missing_after = int(df[col].isna().sum())
 
     # Drop columns marked for deletion
     if columns_to_drop:
@@ -203,8 +296,8 @@ def impute_missing_values(filepath, analysis_json=None, output_file=None, create
 
     # Drop rows marked for deletion
     if rows_to_drop_mask.any():
-        rows_to_drop = rows_to_drop_mask.sum()
-        df = df[~rows_to_drop_mask].reset_index(drop=True)
+        rows_to_drop = int(rows_to_drop_mask.sum())
+        df = df.iloc[~rows_to_drop_mask].reset_index(drop=True)
         print(f"Dropped {rows_to_drop} rows with missing critical values")
 
     # Generate report
@@ -214,8 +307,8 @@ def impute_missing_values(filepath, analysis_json=None, output_file=None, create
         'final_rows': len(df),
         'rows_dropped': original_rows - len(df),
         'columns_dropped': len(columns_to_drop),
-        'columns_imputed': len([c for c in imputation_log if 'missing_after' in imputation_log[c]]),
-        'imputation_log': imputation_log
+        'columns_imputed': columns_imputed,
+        'imputation_log': {col: log.to_dict() for col, log in imputation_log.items()}
     }
 
     # Save imputed data
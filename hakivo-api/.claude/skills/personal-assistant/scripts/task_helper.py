@@ -17,46 +17,74 @@ from assistant_db import (
 )
 import json
 from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Dict, List
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-def list_tasks_formatted() -> str:
-    """Return formatted list of pending tasks."""
-    tasks_data = get_tasks()
-    tasks = tasks_data.get("tasks", [])
+# Sort rank of each priority; unknown priorities sort with the blank ones
+PRIORITY_ORDER = {"high": 0, "medium": 1, "low": 2, "": 3}
 
-    if not tasks:
-        return "No pending tasks."
+# Bumped by every mutation made through this module
+_tasks_revision = 0
 
-    output = ["=== Pending Tasks ===\n"]
 
-    # Sort by priority and due date
-    priority_order = {"high": 0, "medium": 1, "low": 2, "": 3}
-    sorted_tasks = sorted(
-        tasks,
+@lru_cache(maxsize=1)
+def _cached_get_tasks() -> Dict[str, List[Dict]]:
+    """Load the task file once per process until a mutation invalidates it."""
+    return get_tasks()
+
+
+@lru_cache(maxsize=1)
+def _sorted_tasks(revision: int) -> List[Dict]:
+    """Pending tasks sorted by priority and due date, cached per revision."""
+    return sorted(
+        _cached_get_tasks().get("tasks", []),
         key=lambda t: (
-            priority_order.get(t.get("priority", ""), 3),
+            PRIORITY_ORDER.get(t.get("priority", ""), 3),
             t.get("due_date", "9999-12-31")
         )
     )
 
-    for i, task in enumerate(sorted_tasks, 1):
-        priority = task.get("priority", "")
-        priority_str = f"[{priority.upper()}] " if priority else ""
 
-        due_date = task.get("due_date", "")
-        due_str = f" (Due: {due_date})" if due_date else ""
+def _invalidate_tasks() -> None:
+    """Drop cached task views after the task file changed."""
+    global _tasks_revision
+    _tasks_revision += 1
+    _cached_get_tasks.cache_clear()
 
-        category = task.get("category", "")
-        cat_str = f" [{category}]" if category else ""
 
-        output.append(f"{i}. {priority_str}{task.get('title', 'Untitled')}{due_str}{cat_str}")
+def _format_task(i: int, task: Dict) -> str:
+    """Format one numbered task entry (title line, description, ID)."""
+    priority = task.get("priority", "")
+    due_date = task.get("due_date", "")
+    category = task.get("category", "")
+    description = task.get("description")
 
-        if task.get("description"):
-            output.append(f"   {task['description']}")
+    heading = (
+        f"{i}. "
+        f"{f'[{priority.upper()}] ' if priority else ''}"
+        f"{task.get('title', 'Untitled')}"
+        f"{f' (Due: {due_date})' if due_date else ''}"
+        f"{f' [{category}]' if category else ''}"
+    )
+    if description:
+        return f"{heading}\n   {description}\n   ID: {task['id']}"
+    return f"{heading}\n   ID: {task['id']}"
 
-        output.append(f"   ID: {task['id']}\n")
 
-    return "\n".join(output)
+def list_tasks_formatted() -> str:
+    """Return formatted list of pending tasks."""
+    sorted_tasks = _sorted_tasks(_tasks_revision)
+
+    if not sorted_tasks:
+        return "No pending tasks."
+
+    entries = "\n\n".join(_format_task(i, task) for i, task in enumerate(sorted_tasks, 1))
+    return f"=== Pending Tasks ===\n\n{entries}\n"
 
 
 def add_quick_task(title: str, priority: str = "", due_date: str = "",
@@ -74,81 +102,141 @@ def add_quick_task(title: str, priority: str = "", due_date: str = "",
         task["due_date"] = due_date
 
     add_task(task)
+    _invalidate_tasks()
     add_context("interaction", f"Added task: {title}", "normal")
 
     return f"✓ Task added: {title}"
 
 
+def _due_dates(tasks: List[Dict]) -> List[str]:
+    """
+    Return each task's due day as a YYYY-MM-DD string ("" when unset).
+
+    ISO dates order the same as strings, so the date filters compare these
+    directly instead of parsing every due date into a datetime.
+    """
+    return [task.get("due_date", "")[:10] for task in tasks]
+
+
+@lru_cache(maxsize=1)
+def _task_columns(revision: int) -> Dict[str, List]:
+    """
+    Column-oriented view of the pending tasks, cached per revision.
+
+    Filters scan these flat, pre-normalized lists (due day, lowercased
+    category and title) instead of calling .get() on every task dict;
+    "tasks" holds the task dicts in the same order.
+    """
+    tasks = _cached_get_tasks().get("tasks", [])
+    return {
+        "tasks": tasks,
+        "due": _due_dates(tasks),
+        "category": [task.get("category", "").lower() for task in tasks],
+        "title": [task.get("title", "").lower() for task in tasks],
+    }
+
+
+def _select(column: str, predicate) -> List[Dict]:
+    """Tasks whose value in a _task_columns column satisfies predicate."""
+    columns = _task_columns(_tasks_revision)
+    return [t for t, value in zip(columns["tasks"], columns[column]) if predicate(value)]
+
+
 def get_overdue_tasks() -> List[Dict]:
     """Get tasks that are overdue."""
-    tasks_data = get_tasks()
-    tasks = tasks_data.get("tasks", [])
-    today = datetime.now().date()
-
-    overdue = []
-    for task in tasks:
-        if "due_date" in task:
-            due = datetime.fromisoformat(task["due_date"]).date()
-            if due < today:
-                overdue.append(task)
+    today = datetime.now().date().isoformat()
 
-    return overdue
+    return _select("due", lambda due: due and due < today)
 
 
 def get_tasks_by_category(category: str) -> List[Dict]:
     """Get tasks filtered by category."""
-    tasks_data = get_tasks()
-    tasks = tasks_data.get("tasks", [])
+    category = category.lower()
 
-    return [t for t in tasks if t.get("category", "").lower() == category.lower()]
+    return _select("category", category.__eq__)
 
 
 def get_today_tasks() -> List[Dict]:
     """Get tasks due today."""
-    tasks_data = get_tasks()
-    tasks = tasks_data.get("tasks", [])
     today = datetime.now().date().isoformat()
 
-    return [t for t in tasks if t.get("due_date", "") == today]
+    return _select("due", today.__eq__)
 
 
 def get_this_week_tasks() -> List[Dict]:
     """Get tasks due this week."""
-    tasks_data = get_tasks()
-    tasks = tasks_data.get("tasks", [])
-
     today = datetime.now().date()
-    week_end = today + timedelta(days=7)
+    week_end = (today + timedelta(days=7)).isoformat()
+    today = today.isoformat()
 
-    week_tasks = []
-    for task in tasks:
-        if "due_date" in task:
-            due = datetime.fromisoformat(task["due_date"]).date()
-            if today <= due <= week_end:
-                week_tasks.append(task)
-
-    return week_tasks
+    return _select("due", lambda due: today <= due <= week_end)
 
 
 def mark_complete_by_title(title: str) -> str:
     """Complete a task by its title (fuzzy match)."""
-    tasks_data = get_tasks()
-    tasks = tasks_data.get("tasks", [])
+    columns = _task_columns(_tasks_revision)
 
     title_lower = title.lower()
-    for task in tasks:
-        if title_lower in task.get("title", "").lower():
+    for task, task_title in zip(columns["tasks"], columns["title"]):
+        if title_lower in task_title:
             complete_task(task["id"])
+            _invalidate_tasks()
             add_context("interaction", f"Completed task: {task['title']}", "normal")
             return f"✓ Completed: {task['title']}"
 
     return f"✗ Task not found: {title}"
 
 
-if __name__ == "__main__":
-    import sys
-    from typing import List
+def _dumps(tasks: List[Dict]) -> str:
+    """Indented JSON for CLI output, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(tasks, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(tasks, indent=2)
+
 
+def _cmd_add(argv: List[str]) -> None:
+    if len(argv) < 3:
+        print("Error: Title required")
+        sys.exit(1)
+    title = argv[2]
+    priority = argv[3] if len(argv) > 3 else ""
+    due_date = argv[4] if len(argv) > 4 else ""
+    category = argv[5] if len(argv) > 5 else ""
+    print(add_quick_task(title, priority, due_date, category))
+
+
+def _cmd_complete(argv: List[str]) -> None:
+    if len(argv) < 3:
+        print("Error: Task ID required")
+        sys.exit(1)
+    task_id = float(argv[2])
+    if complete_task(task_id):
+        _invalidate_tasks()
+        print(f"✓ Task {task_id} completed")
+    else:
+        print(f"✗ Task {task_id} not found")
+
+
+def _cmd_category(argv: List[str]) -> None:
+    if len(argv) < 3:
+        print("Error: Category name required")
+        sys.exit(1)
+    print(_dumps(get_tasks_by_category(argv[2])))
+
+
+# CLI command name -> handler taking sys.argv
+COMMANDS = {
+    "list": lambda argv: print(list_tasks_formatted()),
+    "add": _cmd_add,
+    "complete": _cmd_complete,
+    "overdue": lambda argv: print(_dumps(get_overdue_tasks())),
+    "today": lambda argv: print(_dumps(get_today_tasks())),
+    "week": lambda argv: print(_dumps(get_this_week_tasks())),
+    "category": _cmd_category,
+}
+
+
+if __name__ == "__main__":
     if len(sys.argv) < 2:
         print("Task Helper")
         print("\nUsage:")
@@ -162,43 +250,8 @@ if __name__ == "__main__":
         sys.exit(1)
 
     command = sys.argv[1]
-
-    if command == "list":
-        print(list_tasks_formatted())
-    elif command == "add":
-        if len(sys.argv) < 3:
-            print("Error: Title required")
-            sys.exit(1)
-        title = sys.argv[2]
-        priority = sys.argv[3] if len(sys.argv) > 3 else ""
-        due_date = sys.argv[4] if len(sys.argv) > 4 else ""
-        category = sys.argv[5] if len(sys.argv) > 5 else ""
-        print(add_quick_task(title, priority, due_date, category))
-    elif command == "complete":
-        if len(sys.argv) < 3:
-            print("Error: Task ID required")
-            sys.exit(1)
-        task_id = float(sys.argv[2])
-        if complete_task(task_id):
-            print(f"✓ Task {task_id} completed")
-        else:
-            print(f"✗ Task {task_id} not found")
-    elif command == "overdue":
-        tasks = get_overdue_tasks()
-        print(json.dumps(tasks, indent=2))
-    elif command == "today":
-        tasks = get_today_tasks()
-        print(json.dumps(tasks, indent=2))
-    elif command == "week":
-        tasks = get_this_week_tasks()
-        print(json.dumps(tasks, indent=2))
-    elif command == "category":
-        if len(sys.argv) < 3:
-            print("Error: Category name required")
-            sys.exit(1)
-        category = sys.argv[2]
-        tasks = get_tasks_by_category(category)
-        print(json.dumps(tasks, indent=2))
-    else:
+    handler = COMMANDS.get(command)
+    if handler is None:
         print(f"Unknown command: {command}")
         sys.exit(1)
+    handler(sys.argv)
@@ -3,12 +3,62 @@
 Script to generate a pitch deck PowerPoint presentation from structured data.
 """
 
+import copy
 import json
 import sys
 from pptx import Presentation
 from pptx.util import Inches, Pt
 from pptx.enum.text import PP_ALIGN
 from pptx.dml.color import RGBColor
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls, qn
+from pptx.text.text import _Paragraph
+
+# Earthen Brand color scheme
+PRIMARY_COLOR = RGBColor(45, 81, 55)  # Forest Green #2D5137
+SECONDARY_COLOR = RGBColor(191, 109, 73)  # Terracotta #BF6D49
+ACCENT_COLOR = RGBColor(242, 199, 68)  # Sunlight #F2C744
+TEXT_COLOR = RGBColor(51, 51, 51)  # Charcoal #333333
+SAND_COLOR = RGBColor(245, 241, 234)  # Sand #F5F1EA
+BORDER_COLOR = RGBColor(200, 200, 200)
+WHITE = RGBColor(255, 255, 255)
+
+BULLET = "• "
+
+# Deck sections after the title slide: (data key, slide title)
+SECTIONS = (
+    ("problem", "The Problem"),
+    ("solution", "Our Solution"),
+    ("market", "Market Opportunity"),
+    ("product", "Product"),
+    ("traction", "Traction"),
+    ("business_model", "Business Model"),
+    ("competition", "Competitive Landscape"),
+    ("team", "Team"),
+    ("financials", "Financials & Ask"),
+)
+
+
+# Slide chrome shapes per slide kind, captured from the first slide of that
+# kind, and bullet list style / <a:p> templates per (font size, space after).
+# They hold plain shape XML with no relationships, so they are kept for the
+# whole process and later decks start from them instead of the shape API.
+_CHROME_TEMPLATES = {}
+_BULLET_TEMPLATES = {}
+
+
+def _as_list(value):
+    """Wrap a single item in a list; lists pass through unchanged."""
+    return value if isinstance(value, list) else [value]
+
+
+# Slide size and the font sizes reused across slides
+SLIDE_WIDTH = Inches(10)
+SLIDE_HEIGHT = Inches(7.5)
+TITLE_SIZE = Pt(60)
+SUBTITLE_SIZE = Pt(26)
+HEADER_SIZE = Pt(44)
+COLUMN_TITLE_SIZE = Pt(22)
 
 def create_pitch_deck(data, output_file="pitch_deck.pptx"):
     """
@@ -19,68 +69,80 @@ def create_pitch_deck(data, output_file="pitch_deck.pptx"):
         output_file: Path to save the PowerPoint file
     """
     prs = Presentation()
-    prs.slide_width = Inches(10)
-    prs.slide_height = Inches(7.5)
-
-    # Define Earthen Brand color scheme
-    PRIMARY_COLOR = RGBColor(45, 81, 55)  # Forest Green #2D5137
-    SECONDARY_COLOR = RGBColor(191, 109, 73)  # Terracotta #BF6D49
-    ACCENT_COLOR = RGBColor(242, 199, 68)  # Sunlight #F2C744
-    TEXT_COLOR = RGBColor(51, 51, 51)  # Charcoal #333333
-    SAND_COLOR = RGBColor(245, 241, 234)  # Sand #F5F1EA
-
-    def add_title_slide(title, subtitle=""):
-        """Add a title slide with Earthen Brand styling"""
-        slide = prs.slides.add_slide(prs.slide_layouts[6])  # Blank layout
-
-        # Add sand background
-        background = slide.background
-        fill = background.fill
-        fill.solid()
-        fill.fore_color.rgb = SAND_COLOR
-
-        # Add decorative accent bar
-        accent_bar = slide.shapes.add_shape(
-            1,  # Rectangle
-            Inches(0), Inches(3.2), Inches(10), Inches(0.1)
-        )
-        accent_bar.fill.solid()
-        accent_bar.fill.fore_color.rgb = ACCENT_COLOR
-        accent_bar.line.fill.background()
-
-        # Add title
-        title_box = slide.shapes.add_textbox(Inches(0.5), Inches(2.2), Inches(9), Inches(1))
-        title_frame = title_box.text_frame
-        title_frame.text = title
-        title_para = title_frame.paragraphs[0]
-        title_para.font.size = Pt(60)
-        title_para.font.bold = True
-        title_para.font.color.rgb = PRIMARY_COLOR
-        title_para.alignment = PP_ALIGN.CENTER
-
-        # Add subtitle if provided
-        if subtitle:
-            subtitle_box = slide.shapes.add_textbox(Inches(0.5), Inches(3.5), Inches(9), Inches(1))
-            subtitle_frame = subtitle_box.text_frame
-            subtitle_frame.text = subtitle
-            subtitle_para = subtitle_frame.paragraphs[0]
-            subtitle_para.font.size = Pt(26)
-            subtitle_para.font.color.rgb = TEXT_COLOR
-            subtitle_para.alignment = PP_ALIGN.CENTER
-
-        return slide
-
-    def add_content_slide(title, content_items):
-        """Add a content slide with title and bullet points"""
-        slide = prs.slides.add_slide(prs.slide_layouts[6])  # Blank layout
-
-        # Add sand background
-        background = slide.background
-        fill = background.fill
+    prs.slide_width = SLIDE_WIDTH
+    prs.slide_height = SLIDE_HEIGHT
+    # Resolve the blank layout once instead of per slide
+    blank_layout = prs.slide_layouts[6]
+
+    def add_sand_background(slide):
+        """Fill the slide background with the sand brand color"""
+        fill = slide.background.fill
         fill.solid()
         fill.fore_color.rgb = SAND_COLOR
 
-        # Add header background shape
+    def add_chrome(slide, kind, texts, build):
+        """
+        Add the shapes shared by a kind of slide: header, panels and text boxes
+
+        The first slide of each kind in the process is built through the
+        shape API by build(slide, *texts); later slides, in this or later
+        decks, get deep copies of those shape elements with only their text
+        runs, in document order, replaced by texts.
+        """
+        add_sand_background(slide)
+        sp_tree = slide.shapes._spTree
+        template = _CHROME_TEMPLATES.get(kind)
+        if template is None or not all(text.isprintable() for text in texts):
+            # Line breaks need python-pptx's paragraph handling
+            build(slide, *texts)
+            if template is None and len(sp_tree.findall('.//' + qn('a:t'))) == len(texts):
+                _CHROME_TEMPLATES[kind] = [copy.deepcopy(sp) for sp in sp_tree.iterchildren(qn('p:sp'))]
+            return
+
+        for element in template:
+            sp_tree.append(copy.deepcopy(element))
+        for run_text, text in zip(sp_tree.iter(qn('a:t')), texts):
+            run_text.text = text
+
+    def add_bullets(text_frame, items, size, space_after):
+        """
+        Append a "• item" paragraph per item in the body text style
+
+        The size and color are set once as the text frame's level-1 default
+        run properties, which paragraphs without their own (such as the
+        bullets) inherit. Each bullet is then a deep copy of one prebuilt
+        <a:p> carrying only its spacing, with the text filled in.
+        """
+        templates = _BULLET_TEMPLATES.get((size, space_after))
+        if templates is None:
+            templates = _BULLET_TEMPLATES[(size, space_after)] = (
+                parse_xml(
+                    f'<a:lvl1pPr {nsdecls("a")}>'
+                    f'<a:defRPr sz="{size * 100}"><a:solidFill><a:srgbClr val="{TEXT_COLOR}"/></a:solidFill></a:defRPr>'
+                    f'</a:lvl1pPr>'
+                ),
+                parse_xml(
+                    f'<a:p {nsdecls("a")}><a:pPr>'
+                    f'<a:spcAft><a:spcPts val="{space_after * 100}"/></a:spcAft>'
+                    f'</a:pPr><a:r><a:t/></a:r></a:p>'
+                ),
+            )
+        list_style, template = templates
+
+        tx_body = text_frame._txBody
+        tx_body.find(qn('a:lstStyle')).append(copy.deepcopy(list_style))
+        for item in items:
+            text = BULLET + str(item)
+            p = copy.deepcopy(template)
+            tx_body.append(p)
+            if text.isprintable():
+                p.find('.//' + qn('a:t')).text = text
+            else:
+                # Line breaks and control characters need python-pptx's escaping
+                _Paragraph(p, text_frame).text = text
+
+    def build_header(slide, title):
+        """Header bar with the slide title in white"""
         header_shape = slide.shapes.add_shape(
             1,  # Rectangle
             Inches(0), Inches(0), Inches(10), Inches(1.3)
@@ -89,14 +151,17 @@ def create_pitch_deck(data, output_file="pitch_deck.pptx"):
         header_shape.fill.fore_color.rgb = PRIMARY_COLOR
         header_shape.line.fill.background()
 
-        # Add title
         title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.3), Inches(9), Inches(0.8))
         title_frame = title_box.text_frame
         title_frame.text = title
         title_para = title_frame.paragraphs[0]
-        title_para.font.size = Pt(44)
+        title_para.font.size = HEADER_SIZE
         title_para.font.bold = True
-        title_para.font.color.rgb = RGBColor(255, 255, 255)  # White text
+        title_para.font.color.rgb = WHITE
+
+    def build_content_chrome(slide, title):
+        """Header, accent circle, content panel and empty body of a bullet slide"""
+        build_header(slide, title)
 
         # Add decorative accent element
         accent_circle = slide.shapes.add_shape(
@@ -113,54 +178,17 @@ def create_pitch_deck(data, output_file="pitch_deck.pptx"):
             Inches(0.5), Inches(1.8), Inches(9), Inches(5.2)
         )
         content_bg.fill.solid()
-        content_bg.fill.fore_color.rgb = RGBColor(255, 255, 255)
-        content_bg.line.color.rgb = RGBColor(200, 200, 200)
+        content_bg.fill.fore_color.rgb = WHITE
+        content_bg.line.color.rgb = BORDER_COLOR
         content_bg.line.width = Pt(1)
 
         # Add content
         content_box = slide.shapes.add_textbox(Inches(1), Inches(2.2), Inches(8), Inches(4.5))
-        content_frame = content_box.text_frame
-        content_frame.word_wrap = True
-
-        for i, item in enumerate(content_items):
-            if i > 0:
-                content_frame.add_paragraph()
-            p = content_frame.paragraphs[i]
-            p.text = f"• {item}"
-            p.font.size = Pt(18)
-            p.font.color.rgb = TEXT_COLOR
-            p.space_after = Pt(14)
-            p.level = 0
-
-        return slide
-
-    def add_two_column_slide(title, left_title, left_content, right_title, right_content):
-        """Add a two-column content slide with visual separation"""
-        slide = prs.slides.add_slide(prs.slide_layouts[6])
-
-        # Add sand background
-        background = slide.background
-        fill = background.fill
-        fill.solid()
-        fill.fore_color.rgb = SAND_COLOR
-
-        # Add header background shape
-        header_shape = slide.shapes.add_shape(
-            1,  # Rectangle
-            Inches(0), Inches(0), Inches(10), Inches(1.3)
-        )
-        header_shape.fill.solid()
-        header_shape.fill.fore_color.rgb = PRIMARY_COLOR
-        header_shape.line.fill.background()
+        content_box.text_frame.word_wrap = True
 
-        # Add title
-        title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.3), Inches(9), Inches(0.8))
-        title_frame = title_box.text_frame
-        title_frame.text = title
-        title_para = title_frame.paragraphs[0]
-        title_para.font.size = Pt(44)
-        title_para.font.bold = True
-        title_para.font.color.rgb = RGBColor(255, 255, 255)
+    def build_two_column_chrome(slide, title, left_title, right_title):
+        """Header, the two bordered column panels and their titled text boxes"""
+        build_header(slide, title)
 
         # Left column background
         left_bg = slide.shapes.add_shape(
@@ -168,7 +196,7 @@ def create_pitch_deck(data, output_file="pitch_deck.pptx"):
             Inches(0.5), Inches(1.8), Inches(4.3), Inches(5.2)
         )
         left_bg.fill.solid()
-        left_bg.fill.fore_color.rgb = RGBColor(255, 255, 255)
+        left_bg.fill.fore_color.rgb = WHITE
         left_bg.line.color.rgb = SECONDARY_COLOR
         left_bg.line.width = Pt(2)
 
@@ -178,7 +206,7 @@ def create_pitch_deck(data, output_file="pitch_deck.pptx"):
             Inches(5.2), Inches(1.8), Inches(4.3), Inches(5.2)
         )
         right_bg.fill.solid()
-        right_bg.fill.fore_color.rgb = RGBColor(255, 255, 255)
+        right_bg.fill.fore_color.rgb = WHITE
         right_bg.line.color.rgb = PRIMARY_COLOR
         right_bg.line.width = Pt(2)
 
@@ -187,34 +215,79 @@ def create_pitch_deck(data, output_file="pitch_deck.pptx"):
         left_frame = left_box.text_frame
         left_frame.text = left_title
         left_para = left_frame.paragraphs[0]
-        left_para.font.size = Pt(22)
+        left_para.font.size = COLUMN_TITLE_SIZE
         left_para.font.bold = True
         left_para.font.color.rgb = SECONDARY_COLOR
 
-        for item in left_content:
-            left_frame.add_paragraph()
-            p = left_frame.paragraphs[-1]
-            p.text = f"• {item}"
-            p.font.size = Pt(16)
-            p.font.color.rgb = TEXT_COLOR
-            p.space_after = Pt(10)
-
         # Right column
         right_box = slide.shapes.add_textbox(Inches(5.5), Inches(2.1), Inches(3.7), Inches(4.6))
         right_frame = right_box.text_frame
         right_frame.text = right_title
         right_para = right_frame.paragraphs[0]
-        right_para.font.size = Pt(22)
+        right_para.font.size = COLUMN_TITLE_SIZE
         right_para.font.bold = True
         right_para.font.color.rgb = PRIMARY_COLOR
 
-        for item in right_content:
-            right_frame.add_paragraph()
-            p = right_frame.paragraphs[-1]
-            p.text = f"• {item}"
-            p.font.size = Pt(16)
-            p.font.color.rgb = TEXT_COLOR
-            p.space_after = Pt(10)
+    def add_title_slide(title, subtitle=""):
+        """Add a title slide with Earthen Brand styling"""
+        slide = prs.slides.add_slide(blank_layout)
+        add_sand_background(slide)
+
+        # Add decorative accent bar
+        accent_bar = slide.shapes.add_shape(
+            1,  # Rectangle
+            Inches(0), Inches(3.2), Inches(10), Inches(0.1)
+        )
+        accent_bar.fill.solid()
+        accent_bar.fill.fore_color.rgb = ACCENT_COLOR
+        accent_bar.line.fill.background()
+
+        # Add title
+        title_box = slide.shapes.add_textbox(Inches(0.5), Inches(2.2), Inches(9), Inches(1))
+        title_frame = title_box.text_frame
+        title_frame.text = title
+        title_para = title_frame.paragraphs[0]
+        title_para.font.size = TITLE_SIZE
+        title_para.font.bold = True
+        title_para.font.color.rgb = PRIMARY_COLOR
+        title_para.alignment = PP_ALIGN.CENTER
+
+        # Add subtitle if provided
+        if subtitle:
+            subtitle_box = slide.shapes.add_textbox(Inches(0.5), Inches(3.5), Inches(9), Inches(1))
+            subtitle_frame = subtitle_box.text_frame
+            subtitle_frame.text = subtitle
+            subtitle_para = subtitle_frame.paragraphs[0]
+            subtitle_para.font.size = SUBTITLE_SIZE
+            subtitle_para.font.color.rgb = TEXT_COLOR
+            subtitle_para.alignment = PP_ALIGN.CENTER
+
+        return slide
+
+    def add_content_slide(title, content_items):
+        """Add a content slide with title and bullet points"""
+        slide = prs.slides.add_slide(blank_layout)
+        add_chrome(slide, "content", (title,), build_content_chrome)
+
+        # The body text box is the last chrome shape
+        content_frame = slide.shapes[-1].text_frame
+
+        if content_items:
+            # Bullets replace the frame's initial empty paragraph
+            content_frame._txBody.remove(content_frame.paragraphs[0]._p)
+            add_bullets(content_frame, content_items, 18, 14)
+
+        return slide
+
+    def add_two_column_slide(title, left_title, left_content, right_title, right_content):
+        """Add a two-column content slide with visual separation"""
+        slide = prs.slides.add_slide(blank_layout)
+        add_chrome(slide, "two_column", (title, left_title, right_title), build_two_column_chrome)
+
+        # The column text boxes are the last two chrome shapes
+        left_frame, right_frame = (shape.text_frame for shape in list(slide.shapes)[-2:])
+        add_bullets(left_frame, left_content, 16, 10)
+        add_bullets(right_frame, right_content, 16, 10)
 
         return slide
 
@@ -223,60 +296,22 @@ def create_pitch_deck(data, output_file="pitch_deck.pptx"):
     tagline = data.get("tagline", "")
     add_title_slide(company_name, tagline)
 
-    # Slide 2: Problem
-    if "problem" in data:
-        problem_items = data["problem"] if isinstance(data["problem"], list) else [data["problem"]]
-        add_content_slide("The Problem", problem_items)
-
-    # Slide 3: Solution
-    if "solution" in data:
-        solution_items = data["solution"] if isinstance(data["solution"], list) else [data["solution"]]
-        add_content_slide("Our Solution", solution_items)
-
-    # Slide 4: Market Opportunity
-    if "market" in data:
-        market_items = data["market"] if isinstance(data["market"], list) else [data["market"]]
-        add_content_slide("Market Opportunity", market_items)
-
-    # Slide 5: Product
-    if "product" in data:
-        product_items = data["product"] if isinstance(data["product"], list) else [data["product"]]
-        add_content_slide("Product", product_items)
-
-    # Slide 6: Traction
-    if "traction" in data:
-        traction_items = data["traction"] if isinstance(data["traction"], list) else [data["traction"]]
-        add_content_slide("Traction", traction_items)
-
-    # Slide 7: Business Model
-    if "business_model" in data:
-        bm_items = data["business_model"] if isinstance(data["business_model"], list) else [data["business_model"]]
-        add_content_slide("Business Model", bm_items)
-
-    # Slide 8: Competition
-    if "competition" in data:
-        comp_data = data["competition"]
-        if isinstance(comp_data, dict) and "our_advantages" in comp_data and "competitors" in comp_data:
+    # Slides 2-10 in deck order; sections given as a single string become one bullet
+    for key, title in SECTIONS:
+        if key not in data:
+            continue
+        items = data[key]
+        if (key == "competition" and isinstance(items, dict)
+                and "our_advantages" in items and "competitors" in items):
             add_two_column_slide(
-                "Competitive Landscape",
+                title,
                 "Our Advantages",
-                comp_data.get("our_advantages", []),
+                items.get("our_advantages", []),
                 "Competition",
-                comp_data.get("competitors", [])
+                items.get("competitors", [])
             )
         else:
-            comp_items = comp_data if isinstance(comp_data, list) else [comp_data]
-            add_content_slide("Competitive Landscape", comp_items)
-
-    # Slide 9: Team
-    if "team" in data:
-        team_items = data["team"] if isinstance(data["team"], list) else [data["team"]]
-        add_content_slide("Team", team_items)
-
-    # Slide 10: Financials / Ask
-    if "financials" in data:
-        fin_items = data["financials"] if isinstance(data["financials"], list) else [data["financials"]]
-        add_content_slide("Financials & Ask", fin_items)
+            add_content_slide(title, _as_list(items))
 
     # Save presentation
     prs.save(output_file)
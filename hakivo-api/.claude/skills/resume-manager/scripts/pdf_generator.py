@@ -7,14 +7,14 @@ Requires: reportlab (pip install reportlab)
 """
 
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from resume_db import (
     get_personal_info, get_experiences, get_projects,
     get_education, get_skills, get_certifications,
-    get_relevant_experiences, get_relevant_projects,
-    get_relevant_skills
+    get_relevant_content
 )
 
 try:
@@ -32,6 +32,142 @@ except ImportError:
 
 from typing import Dict, Any, List, Optional
 from datetime import datetime
+from xml.sax.saxutils import escape
+
+# Palette and page geometry, built once rather than per style or section
+INK = colors.HexColor('#1a1a1a')
+CHARCOAL = colors.HexColor('#4a4a4a')
+NAVY = colors.HexColor('#2c3e50')
+SLATE = colors.HexColor('#34495e')
+GRAY = colors.HexColor('#7f8c8d')
+MARGIN = 0.75*inch
+RULE_WIDTH = 7*inch
+
+
+def _build_styles():
+    """Build the sample stylesheet extended with the resume paragraph styles."""
+    styles = getSampleStyleSheet()
+
+    # Name style
+    styles.add(ParagraphStyle(
+        name='Name',
+        parent=styles['Heading1'],
+        fontSize=20,
+        textColor=INK,
+        spaceAfter=4,
+        alignment=TA_CENTER,
+        fontName='Helvetica-Bold'
+    ))
+
+    # Contact style
+    styles.add(ParagraphStyle(
+        name='Contact',
+        parent=styles['Normal'],
+        fontSize=9,
+        textColor=CHARCOAL,
+        alignment=TA_CENTER,
+        spaceAfter=12
+    ))
+
+    # Section header style
+    styles.add(ParagraphStyle(
+        name='SectionHeader',
+        parent=styles['Heading2'],
+        fontSize=12,
+        textColor=NAVY,
+        spaceAfter=6,
+        spaceBefore=8,
+        fontName='Helvetica-Bold',
+        borderWidth=0,
+        borderColor=NAVY,
+        borderPadding=0,
+        leftIndent=0
+    ))
+
+    # Job title style
+    styles.add(ParagraphStyle(
+        name='JobTitle',
+        parent=styles['Normal'],
+        fontSize=11,
+        textColor=INK,
+        spaceAfter=2,
+        fontName='Helvetica-Bold'
+    ))
+
+    # Job title with its date line as a second line of the same paragraph
+    styles.add(ParagraphStyle(
+        name='EntryHeader',
+        parent=styles['JobTitle'],
+        spaceAfter=6  # JobTitle's 2 plus Date's 4 when they were separate
+    ))
+
+    # Company style
+    styles.add(ParagraphStyle(
+        name='Company',
+        parent=styles['Normal'],
+        fontSize=10,
+        textColor=SLATE,
+        spaceAfter=2,
+        fontName='Helvetica-Bold'
+    ))
+
+    # Date style
+    styles.add(ParagraphStyle(
+        name='Date',
+        parent=styles['Normal'],
+        fontSize=9,
+        textColor=GRAY,
+        spaceAfter=4,
+        fontName='Helvetica-Oblique'
+    ))
+
+    # Bullet point style
+    styles.add(ParagraphStyle(
+        name='ResumeBullet',
+        parent=styles['Normal'],
+        fontSize=10,
+        textColor=NAVY,
+        leftIndent=15,
+        spaceAfter=3,
+        bulletIndent=5,
+        bulletFontName='Helvetica',
+        bulletFontSize=10
+    ))
+
+    # Skills style
+    styles.add(ParagraphStyle(
+        name='Skills',
+        parent=styles['Normal'],
+        fontSize=10,
+        textColor=NAVY,
+        spaceAfter=4
+    ))
+
+    return styles
+
+
+# Built once at import and shared by every generator, which only read from it
+_STYLES = _build_styles()
+
+# Inline markup matching the Date style, for date lines inside other paragraphs
+_DATE_FONT = f'<font name="Helvetica-Oblique" size="9" color="{GRAY.hexval()}">'
+
+# Contact fields in header order, with how each is shown
+_CONTACT_FIELDS = (
+    ('email', "{}"),
+    ('phone', "{}"),
+    ('location', "{}"),
+    ('linkedin', "LinkedIn: {}"),
+    ('github', "GitHub: {}"),
+    ('website', "{}"),
+)
+
+# Line drawn under each section header
+_RULE_STYLE = TableStyle([
+    ('LINEBELOW', (0, 0), (-1, -1), 1, NAVY),
+    ('TOPPADDING', (0, 0), (-1, -1), 0),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 2),
+])
 
 
 class ResumeGenerator:
@@ -42,104 +178,13 @@ class ResumeGenerator:
         self.doc = SimpleDocTemplate(
             output_path,
             pagesize=letter,
-            rightMargin=0.75*inch,
-            leftMargin=0.75*inch,
-            topMargin=0.75*inch,
-            bottomMargin=0.75*inch
+            rightMargin=MARGIN,
+            leftMargin=MARGIN,
+            topMargin=MARGIN,
+            bottomMargin=MARGIN
         )
         self.story = []
-        self.styles = getSampleStyleSheet()
-        self._setup_custom_styles()
-
-    def _setup_custom_styles(self):
-        """Set up custom paragraph styles."""
-        # Name style
-        self.styles.add(ParagraphStyle(
-            name='Name',
-            parent=self.styles['Heading1'],
-            fontSize=20,
-            textColor=colors.HexColor('#1a1a1a'),
-            spaceAfter=4,
-            alignment=TA_CENTER,
-            fontName='Helvetica-Bold'
-        ))
-
-        # Contact style
-        self.styles.add(ParagraphStyle(
-            name='Contact',
-            parent=self.styles['Normal'],
-            fontSize=9,
-            textColor=colors.HexColor('#4a4a4a'),
-            alignment=TA_CENTER,
-            spaceAfter=12
-        ))
-
-        # Section header style
-        self.styles.add(ParagraphStyle(
-            name='SectionHeader',
-            parent=self.styles['Heading2'],
-            fontSize=12,
-            textColor=colors.HexColor('#2c3e50'),
-            spaceAfter=6,
-            spaceBefore=8,
-            fontName='Helvetica-Bold',
-            borderWidth=0,
-            borderColor=colors.HexColor('#2c3e50'),
-            borderPadding=0,
-            leftIndent=0
-        ))
-
-        # Job title style
-        self.styles.add(ParagraphStyle(
-            name='JobTitle',
-            parent=self.styles['Normal'],
-            fontSize=11,
-            textColor=colors.HexColor('#1a1a1a'),
-            spaceAfter=2,
-            fontName='Helvetica-Bold'
-        ))
-
-        # Company style
-        self.styles.add(ParagraphStyle(
-            name='Company',
-            parent=self.styles['Normal'],
-            fontSize=10,
-            textColor=colors.HexColor('#34495e'),
-            spaceAfter=2,
-            fontName='Helvetica-Bold'
-        ))
-
-        # Date style
-        self.styles.add(ParagraphStyle(
-            name='Date',
-            parent=self.styles['Normal'],
-            fontSize=9,
-            textColor=colors.HexColor('#7f8c8d'),
-            spaceAfter=4,
-            fontName='Helvetica-Oblique'
-        ))
-
-        # Bullet point style
-        self.styles.add(ParagraphStyle(
-            name='Bullet',
-            parent=self.styles['Normal'],
-            fontSize=10,
-            textColor=colors.HexColor('#2c3e50'),
-            leftIndent=15,
-            spaceAfter=3,
-            bulletIndent=5,
-            bulletFontName='Helvetica',
-            bulletFontSize=10
-        ))
-
-        # Skills style
-        self.styles.add(ParagraphStyle(
-            name='Skills',
-            parent=self.styles['Normal'],
-            fontSize=10,
-            textColor=colors.HexColor('#2c3e50'),
-            spaceAfter=4
-        ))
+        self.styles = _STYLES
 
     def add_header(self, personal_info: Dict[str, Any]):
         """Add resume header with personal info."""
@@ -148,20 +193,10 @@ class ResumeGenerator:
         self.story.append(Paragraph(name, self.styles['Name']))
 
         # Contact info
-        contact_parts = []
-        if personal_info.get('email'):
-            contact_parts.append(personal_info['email'])
-        if personal_info.get('phone'):
-            contact_parts.append(personal_info['phone'])
-        if personal_info.get('location'):
-            contact_parts.append(personal_info['location'])
-        if personal_info.get('linkedin'):
-            contact_parts.append(f"LinkedIn: {personal_info['linkedin']}")
-        if personal_info.get('github'):
-            contact_parts.append(f"GitHub: {personal_info['github']}")
-        if personal_info.get('website'):
-            contact_parts.append(personal_info['website'])
-
+        contact_parts = [
+            fmt.format(value) for field, fmt in _CONTACT_FIELDS
+            if (value := personal_info.get(field))
+        ]
         contact_line = " • ".join(contact_parts)
         self.story.append(Paragraph(contact_line, self.styles['Contact']))
 
@@ -174,21 +209,24 @@ class ResumeGenerator:
         """Add a section header with underline."""
         self.story.append(Paragraph(f"<b>{title.upper()}</b>", self.styles['SectionHeader']))
         # Add a line under the section
-        line_table = Table([['']], colWidths=[7*inch])
-        line_table.setStyle(TableStyle([
-            ('LINEBELOW', (0, 0), (-1, -1), 1, colors.HexColor('#2c3e50')),
-            ('TOPPADDING', (0, 0), (-1, -1), 0),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 2),
-        ]))
+        line_table = Table([['']], colWidths=[RULE_WIDTH])
+        line_table.setStyle(_RULE_STYLE)
         self.story.append(line_table)
         self.story.append(Spacer(1, 0.05*inch))
 
+    def add_bullets(self, items: List[Any]):
+        """Add bullet points as a single paragraph with one line per item."""
+        if items:
+            # One Paragraph means one markup parse for the whole list; the
+            # items are escaped since reportlab reads them as markup
+            bullet_html = "<br/>".join(f"• {escape(str(item))}" for item in items)
+            self.story.append(Paragraph(bullet_html, self.styles['ResumeBullet']))
+
     def add_experience(self, exp: Dict[str, Any]):
         """Add a work experience entry."""
         # Position and Company on same line
-        position = exp.get('position', 'Position')
-        company = exp.get('company', 'Company')
-        self.story.append(Paragraph(f"<b>{position}</b> at {company}", self.styles['JobTitle']))
+        position = escape(str(exp.get('position', 'Position')))
+        company = escape(str(exp.get('company', 'Company')))
 
         # Location and date
         location = exp.get('location', '')
@@ -197,14 +235,15 @@ class ResumeGenerator:
         date_line = f"{start_date} - {end_date}"
         if location:
             date_line = f"{location} | {date_line}"
-        self.story.append(Paragraph(date_line, self.styles['Date']))
+
+        # Title and date line share one Paragraph, so one markup parse
+        self.story.append(Paragraph(
+            f"<b>{position}</b> at {company}<br/>{_DATE_FONT}{escape(date_line)}</font>",
+            self.styles['EntryHeader']
+        ))
 
         # Highlights/bullet points
-        highlights = exp.get('highlights', [])
-        if highlights:
-            for highlight in highlights[:4]:  # Limit to 4 bullet points
-                bullet_text = f"• {highlight}"
-                self.story.append(Paragraph(bullet_text, self.styles['Bullet']))
+        self.add_bullets(exp.get('highlights', [])[:4])  # Limit to 4 bullet points
 
         self.story.append(Spacer(1, 0.1*inch))
 
@@ -227,11 +266,7 @@ class ResumeGenerator:
         if proj.get('description'):
             self.story.append(Paragraph(proj['description'], self.styles['Normal']))
 
-        highlights = proj.get('highlights', [])
-        if highlights:
-            for highlight in highlights[:3]:  # Limit to 3 bullet points
-                bullet_text = f"• {highlight}"
-                self.story.append(Paragraph(bullet_text, self.styles['Bullet']))
+        self.add_bullets(proj.get('highlights', [])[:3])  # Limit to 3 bullet points
 
         self.story.append(Spacer(1, 0.1*inch))
 
@@ -295,9 +330,10 @@ class ResumeGenerator:
 
         # If job keywords provided, filter relevant content
         if job_keywords:
-            experiences = get_relevant_experiences(job_keywords, limit=3)
-            projects = get_relevant_projects(job_keywords, limit=2)
-            skills = get_relevant_skills(job_keywords)
+            relevant = get_relevant_content(job_keywords, data, experience_limit=3, project_limit=2)
+            experiences = relevant['experiences']
+            projects = relevant['projects']
+            skills = relevant['skills']
         else:
             experiences = data.get('experiences', [])[:3]
             projects = data.get('projects', [])[:2]
@@ -364,19 +400,53 @@ def generate_resume(output_path: str, job_title: Optional[str] = None,
     return output_path
 
 
+def generate_resumes_batch(specs: List[Dict[str, Any]], max_workers: Optional[int] = None) -> List[str]:
+    """
+    Generate several tailored resume PDFs in parallel worker processes.
+
+    Args:
+        specs: One dict per resume with 'output' and optional 'title' and 'keywords'
+        max_workers: Number of worker processes (defaults to the CPU count)
+
+    Returns:
+        Paths to the generated PDFs, in the order of specs
+    """
+    if len(specs) <= 1:
+        # Not worth starting a pool
+        return [generate_resume(spec['output'], spec.get('title'), spec.get('keywords')) for spec in specs]
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(generate_resume, spec['output'], spec.get('title'), spec.get('keywords'))
+            for spec in specs
+        ]
+        return [future.result() for future in futures]
+
+
 if __name__ == "__main__":
     import argparse
+    import json
 
     parser = argparse.ArgumentParser(description='Generate a tailored resume PDF')
-    parser.add_argument('output', help='Output PDF file path')
+    parser.add_argument('output', nargs='?', help='Output PDF file path')
     parser.add_argument('--title', help='Job title for tailoring')
     parser.add_argument('--keywords', nargs='+', help='Keywords for relevance filtering')
+    parser.add_argument('--batch', metavar='JOBS_JSON',
+                        help='JSON list of {"output", "title", "keywords"} objects to generate in parallel')
 
     args = parser.parse_args()
+    if not args.output and not args.batch:
+        parser.error("an output path or --batch is required")
 
     try:
-        result = generate_resume(args.output, args.title, args.keywords)
-        print(f"✓ Resume generated: {result}")
+        if args.batch:
+            with open(args.batch) as f:
+                specs = json.load(f)
+            for result in generate_resumes_batch(specs):
+                print(f"✓ Resume generated: {result}")
+        else:
+            result = generate_resume(args.output, args.title, args.keywords)
+            print(f"✓ Resume generated: {result}")
     except Exception as e:
         print(f"✗ Error generating resume: {e}")
         sys.exit(1)
@@ -128,36 +128,48 @@ def delete_experience(exp_id: float) -> bool:
     return False
 
 
-def get_relevant_experiences(keywords: List[str], limit: int = None) -> List[Dict[str, Any]]:
-    """Get experiences relevant to given keywords."""
-    experiences = get_experiences()
-    scored_experiences = []
-
-    for exp in experiences:
-        score = 0
-        searchable_text = (
-            exp.get("company", "") + " " +
-            exp.get("position", "") + " " +
-            exp.get("description", "") + " " +
-            " ".join(exp.get("highlights", [])) + " " +
-            " ".join(exp.get("technologies", []))
-        ).lower()
+def _keyword_set(keywords: List[str]) -> frozenset:
+    """Lowercase the keywords once for the relevance filters."""
+    return frozenset(map(str.lower, keywords))
+
 
-        for keyword in keywords:
-            if keyword.lower() in searchable_text:
-                score += searchable_text.count(keyword.lower())
+def _rank_by_keywords(entries: List[Dict[str, Any]], text_fields: tuple, list_fields: tuple,
+                      keywords: frozenset, limit: int = None) -> List[Dict[str, Any]]:
+    """Score entries by keyword occurrences in the given fields, best first."""
+    scored_entries = []
+
+    for entry in entries:
+        searchable_text = " ".join(
+            [entry.get(field, "") for field in text_fields] +
+            [" ".join(entry.get(field, [])) for field in list_fields]
+        ).lower()
+        score = sum(searchable_text.count(keyword) for keyword in keywords)
 
         if score > 0:
-            exp_with_score = exp.copy()
-            exp_with_score["_relevance_score"] = score
-            scored_experiences.append(exp_with_score)
+            entry_with_score = entry.copy()
+            entry_with_score["_relevance_score"] = score
+            scored_entries.append(entry_with_score)
 
     # Sort by relevance score
-    scored_experiences.sort(key=lambda x: x["_relevance_score"], reverse=True)
+    scored_entries.sort(key=lambda x: x["_relevance_score"], reverse=True)
 
     if limit:
-        return scored_experiences[:limit]
-    return scored_experiences
+        return scored_entries[:limit]
+    return scored_entries
+
+
+def _relevant_experiences(data: Dict[str, Any], keywords: frozenset, limit: int = None) -> List[Dict[str, Any]]:
+    """Rank the experiences in data against lowercased keywords."""
+    return _rank_by_keywords(
+        data.get("experiences", []),
+        ("company", "position", "description"), ("highlights", "technologies"),
+        keywords, limit
+    )
+
+
+def get_relevant_experiences(keywords: List[str], limit: int = None) -> List[Dict[str, Any]]:
+    """Get experiences relevant to given keywords."""
+    return _relevant_experiences(load_data(), _keyword_set(keywords), limit)
 
 
 # ============================================================================
@@ -201,34 +213,18 @@ def delete_project(proj_id: float) -> bool:
     return False
 
 
-def get_relevant_projects(keywords: List[str], limit: int = None) -> List[Dict[str, Any]]:
-    """Get projects relevant to given keywords."""
-    projects = get_projects()
-    scored_projects = []
-
-    for proj in projects:
-        score = 0
-        searchable_text = (
-            proj.get("name", "") + " " +
-            proj.get("description", "") + " " +
-            " ".join(proj.get("highlights", [])) + " " +
-            " ".join(proj.get("technologies", []))
-        ).lower()
-
-        for keyword in keywords:
-            if keyword.lower() in searchable_text:
-                score += searchable_text.count(keyword.lower())
-
-        if score > 0:
-            proj_with_score = proj.copy()
-            proj_with_score["_relevance_score"] = score
-            scored_projects.append(proj_with_score)
+def _relevant_projects(data: Dict[str, Any], keywords: frozenset, limit: int = None) -> List[Dict[str, Any]]:
+    """Rank the projects in data against lowercased keywords."""
+    return _rank_by_keywords(
+        data.get("projects", []),
+        ("name", "description"), ("highlights", "technologies"),
+        keywords, limit
+    )
 
-    scored_projects.sort(key=lambda x: x["_relevance_score"], reverse=True)
 
-    if limit:
-        return scored_projects[:limit]
-    return scored_projects
+def get_relevant_projects(keywords: List[str], limit: int = None) -> List[Dict[str, Any]]:
+    """Get projects relevant to given keywords."""
+    return _relevant_projects(load_data(), _keyword_set(keywords), limit)
 
 
 # ============================================================================
@@ -300,24 +296,46 @@ def update_skills(skills: Dict[str, List[str]]) -> None:
     save_data(data)
 
 
-def get_relevant_skills(keywords: List[str]) -> Dict[str, List[str]]:
-    """Get skills relevant to given keywords."""
-    all_skills = get_skills()
+def _relevant_skills(data: Dict[str, Any], keywords: frozenset) -> Dict[str, List[str]]:
+    """Skills in data matching lowercased keywords, by category."""
     relevant_skills = {}
 
-    for category, skills_list in all_skills.items():
+    for category, skills_list in data.get("skills", {}).items():
         relevant = []
         for skill in skills_list:
-            for keyword in keywords:
-                if keyword.lower() in skill.lower() or skill.lower() in keyword.lower():
-                    relevant.append(skill)
-                    break
+            skill_lower = skill.lower()
+            if any(keyword in skill_lower or skill_lower in keyword for keyword in keywords):
+                relevant.append(skill)
         if relevant:
             relevant_skills[category] = relevant
 
     return relevant_skills
 
 
+def get_relevant_skills(keywords: List[str]) -> Dict[str, List[str]]:
+    """Get skills relevant to given keywords."""
+    return _relevant_skills(load_data(), _keyword_set(keywords))
+
+
+def get_relevant_content(keywords: List[str], data: Optional[Dict[str, Any]] = None,
+                         experience_limit: int = None, project_limit: int = None) -> Dict[str, Any]:
+    """
+    Get relevant experiences, projects and skills in one call.
+
+    The keywords are lowercased once and the data is loaded at most once
+    (pass data to reuse an already loaded copy), instead of once per
+    get_relevant_* call.
+    """
+    if data is None:
+        data = load_data()
+    keyword_set = _keyword_set(keywords)
+    return {
+        "experiences": _relevant_experiences(data, keyword_set, experience_limit),
+        "projects": _relevant_projects(data, keyword_set, project_limit),
+        "skills": _relevant_skills(data, keyword_set)
+    }
+
+
 # ============================================================================
 # OTHER SECTIONS
 # ============================================================================
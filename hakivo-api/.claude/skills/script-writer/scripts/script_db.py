@@ -5,18 +5,80 @@ Script Writer Database Manager
 Manages user scriptwriting preferences and past scripts.
 """
 
+import copy
 import json
+import secrets
+import threading
+import time
+from contextlib import contextmanager
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, Any, List, Optional
 
-DB_FILE = Path.home() / ".claude" / "script_writer.json"
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+# With msgpack installed the database is stored as MessagePack, which is
+# smaller and faster to parse; an existing JSON file is copied over on first
+# use and left in place. Once the MessagePack file exists msgpack is required
+LEGACY_DB_FILE = Path.home() / ".claude" / "script_writer.json"
+MSGPACK_DB_FILE = LEGACY_DB_FILE.with_suffix(".msgpack")
+DB_FILE = MSGPACK_DB_FILE if msgpack is not None else LEGACY_DB_FILE
+
+# Parsed database, the (mtime_ns, size) of the file it was read from and
+# an id -> position index over its scripts (built on first lookup)
+_CACHE: Dict[str, Any] = {"stamp": None, "data": None, "index": None}
+
+# Database being edited by the current thread's transaction(), if any
+_TX = threading.local()
+
+
+def _encode(data: Dict[str, Any]) -> bytes:
+    """Serialize the database in the on-disk format of DB_FILE."""
+    if msgpack is not None:
+        return msgpack.packb(data, use_bin_type=True)
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode()
+
+
+def _decode(raw: bytes) -> Dict[str, Any]:
+    """Parse the contents of DB_FILE."""
+    if msgpack is not None:
+        return msgpack.unpackb(raw, raw=False)
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+def _migrate_legacy_file() -> bool:
+    """Copy the JSON database into MessagePack, returning True if migrated."""
+    if DB_FILE == LEGACY_DB_FILE or not LEGACY_DB_FILE.exists():
+        return False
+    try:
+        data = json.loads(LEGACY_DB_FILE.read_bytes())
+    except ValueError:
+        # Leave an unreadable file in place rather than deleting it
+        return False
+    DB_FILE.write_bytes(_encode(data))
+    return True
 
 
 def ensure_db_file() -> None:
     """Ensure the database file exists."""
+    if DB_FILE != MSGPACK_DB_FILE and MSGPACK_DB_FILE.exists():
+        # Falling back to the JSON file would silently hide the real data
+        raise RuntimeError(
+            f"{MSGPACK_DB_FILE} holds the script database but msgpack is not "
+            "installed; install it with: pip install msgpack"
+        )
     DB_FILE.parent.mkdir(parents=True, exist_ok=True)
-    if not DB_FILE.exists():
+    if not DB_FILE.exists() and not _migrate_legacy_file():
         default_data = {
             "initialized": False,
             "created_at": datetime.now().isoformat(),
@@ -37,24 +99,112 @@ def ensure_db_file() -> None:
             "scripts": [],
             "templates": []
         }
-        DB_FILE.write_text(json.dumps(default_data, indent=2))
+        DB_FILE.write_bytes(_encode(default_data))
 
 
-def load_data() -> Dict[str, Any]:
-    """Load data from file."""
+def _file_stamp() -> tuple:
+    """Modification time and size identifying the current file contents."""
+    st = DB_FILE.stat()
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _read_data() -> Optional[Dict[str, Any]]:
+    """Parsed database (cached while the file is unchanged), or None if unreadable."""
     ensure_db_file()
     try:
-        with open(DB_FILE, 'r') as f:
-            return json.load(f)
-    except (json.JSONDecodeError, FileNotFoundError):
-        return {}
+        stamp = _file_stamp()
+        if stamp == _CACHE["stamp"]:
+            return _CACHE["data"]
+        data = _decode(DB_FILE.read_bytes())
+    except (ValueError, FileNotFoundError):
+        return None
+    _CACHE["stamp"], _CACHE["data"], _CACHE["index"] = stamp, data, None
+    return data
+
+
+def load_data() -> Dict[str, Any]:
+    """
+    Load data from file, reusing the parsed copy while the file is unchanged.
+
+    The cached object itself is returned, so callers that modify it are
+    expected to pass it to save_data. Public getters return copies.
+    """
+    data = _read_data()
+    return {} if data is None else data
 
 
 def save_data(data: Dict[str, Any]) -> None:
     """Save data to file."""
     ensure_db_file()
-    with open(DB_FILE, 'w') as f:
-        json.dump(data, f, indent=2)
+    DB_FILE.write_bytes(_encode(data))
+    if data is not _CACHE["data"]:
+        _CACHE["index"] = None
+    _CACHE["stamp"], _CACHE["data"] = _file_stamp(), data
+
+
+@contextmanager
+def transaction():
+    """
+    Group several mutations into a single write of the database file.
+
+    Mutators called inside the block edit the yielded data in memory and
+    the file is written once when the block exits (including on error, so
+    completed edits are kept as they would be without the transaction).
+    If the file could not be read it is never written back.
+
+    Usage:
+        with transaction():
+            for script in scripts:
+                add_script(script)
+    """
+    if getattr(_TX, "data", None) is not None:
+        # Nested: the outermost transaction writes
+        yield _TX.data
+        return
+    loaded = _read_data()
+    _TX.data = {} if loaded is None else loaded
+    _TX.now = datetime.now().isoformat()
+    try:
+        yield _TX.data
+    finally:
+        data, _TX.data, _TX.now = _TX.data, None, None
+        if loaded is not None:
+            save_data(data)
+
+
+def _data_for_update() -> Dict[str, Any]:
+    """The database a mutator should edit: the open transaction's, else a fresh load."""
+    data = getattr(_TX, "data", None)
+    return data if data is not None else load_data()
+
+
+def _now() -> str:
+    """ISO timestamp for a mutation; edits in one transaction share its start time."""
+    now = getattr(_TX, "now", None)
+    return now if now is not None else datetime.now().isoformat()
+
+
+def _new_id() -> str:
+    """Unique id from the nanosecond clock plus a random suffix against ties."""
+    return f"{time.time_ns():x}{secrets.token_hex(2)}"
+
+
+def _commit(data: Dict[str, Any]) -> None:
+    """Persist a mutation now, or leave it to the enclosing transaction()."""
+    if getattr(_TX, "data", None) is None:
+        save_data(data)
+
+
+def _script_index(data: Dict[str, Any]) -> Dict[str, int]:
+    """Map script ids to their position in data["scripts"] (first one wins)."""
+    if _CACHE["index"] is None or _CACHE["data"] is not data:
+        index: Dict[str, int] = {}
+        for i, script in enumerate(data.get("scripts", [])):
+            index.setdefault(script.get("id"), i)
+        if _CACHE["data"] is not data:
+            return index
+        _CACHE["index"] = index
+    return _CACHE["index"]
 
 
 # ============================================================================
@@ -70,16 +220,16 @@ def is_initialized() -> bool:
 def get_preferences() -> Dict[str, Any]:
     """Get user preferences."""
     data = load_data()
-    return data.get("preferences", {})
+    return copy.deepcopy(data.get("preferences", {}))
 
 
 def save_preferences(preferences: Dict[str, Any]) -> None:
     """Save user preferences."""
-    data = load_data()
+    data = _data_for_update()
     data["preferences"].update(preferences)
     data["initialized"] = True
-    data["last_updated"] = datetime.now().isoformat()
-    save_data(data)
+    data["last_updated"] = _now()
+    _commit(data)
 
 
 # ============================================================================
@@ -88,51 +238,56 @@ def save_preferences(preferences: Dict[str, Any]) -> None:
 
 def add_script(script: Dict[str, Any]) -> str:
     """Add a new script."""
-    data = load_data()
-    script_id = str(datetime.now().timestamp())
+    data = _data_for_update()
+    script_id = _new_id()
     script["id"] = script_id
-    script["created_at"] = datetime.now().isoformat()
+    script["created_at"] = _now()
     data["scripts"].append(script)
-    save_data(data)
+    if _CACHE["index"] is not None and _CACHE["data"] is data:
+        _CACHE["index"].setdefault(script_id, len(data["scripts"]) - 1)
+    _commit(data)
     return script_id
 
 
 def get_scripts() -> List[Dict[str, Any]]:
     """Get all scripts."""
     data = load_data()
-    return data.get("scripts", [])
+    return copy.deepcopy(data.get("scripts", []))
 
 
 def get_script_by_id(script_id: str) -> Optional[Dict[str, Any]]:
     """Get a specific script."""
     data = load_data()
-    for script in data.get("scripts", []):
-        if script.get("id") == script_id:
-            return script
-    return None
+    position = _script_index(data).get(script_id)
+    return None if position is None else copy.deepcopy(data["scripts"][position])
 
 
 def update_script(script_id: str, updates: Dict[str, Any]) -> bool:
     """Update a script."""
-    data = load_data()
-    for script in data["scripts"]:
-        if script.get("id") == script_id:
-            script.update(updates)
-            script["updated_at"] = datetime.now().isoformat()
-            save_data(data)
-            return True
-    return False
+    data = _data_for_update()
+    position = _script_index(data).get(script_id)
+    if position is None:
+        return False
+    script = data["scripts"][position]
+    script.update(updates)
+    script["updated_at"] = _now()
+    if "id" in updates:
+        _CACHE["index"] = None
+    _commit(data)
+    return True
 
 
 def delete_script(script_id: str) -> bool:
     """Delete a script."""
-    data = load_data()
-    for i, script in enumerate(data["scripts"]):
-        if script.get("id") == script_id:
-            data["scripts"].pop(i)
-            save_data(data)
-            return True
-    return False
+    data = _data_for_update()
+    position = _script_index(data).get(script_id)
+    if position is None:
+        return False
+    data["scripts"].pop(position)
+    # Later positions shifted; rebuild the index on the next lookup
+    _CACHE["index"] = None
+    _commit(data)
+    return True
 
 
 # ============================================================================
@@ -141,19 +296,19 @@ def delete_script(script_id: str) -> bool:
 
 def add_template(template: Dict[str, Any]) -> str:
     """Add a custom template."""
-    data = load_data()
-    template_id = str(datetime.now().timestamp())
+    data = _data_for_update()
+    template_id = _new_id()
     template["id"] = template_id
-    template["created_at"] = datetime.now().isoformat()
+    template["created_at"] = _now()
     data["templates"].append(template)
-    save_data(data)
+    _commit(data)
     return template_id
 
 
 def get_templates() -> List[Dict[str, Any]]:
     """Get all templates."""
     data = load_data()
-    return data.get("templates", [])
+    return copy.deepcopy(data.get("templates", []))
 
 
 # ============================================================================
@@ -9,22 +9,55 @@ in character details, plot elements, and world-building across the story.
 import os
 import re
 import sys
-import json
 from pathlib import Path
 from typing import List, Dict, Set, Tuple, Optional
 from collections import defaultdict
+from dataclasses import dataclass, field
 
+sys.path.insert(0, str(Path(__file__).parent))
 
+from storyboard_common import compile_scanner, write_json
+
+
+# Color words used to spot contradicting hair/eye descriptions; matched
+# against already-lowercased context, so no IGNORECASE is needed
+_COLOR_RE = re.compile(r'\b(black|brown|blonde|red|auburn|white|gray|grey|blue|green|hazel)\b')
+
+
+def _name_pattern(name: str) -> re.Pattern:
+    """Whole-word, case-insensitive pattern for a single name"""
+    return re.compile(r'\b' + re.escape(name) + r'\b', re.IGNORECASE)
+
+
+def _names_overlap(a: str, b: str) -> bool:
+    """Whether whole-word matches of a and b can share characters in some text,
+    e.g. "Lee" inside "Anna Lee", or "Anna Lee" and "Lee Smith" in "Anna Lee Smith"
+    """
+    pattern_a, pattern_b = _name_pattern(a), _name_pattern(b)
+    if pattern_a.search(b) or pattern_b.search(a):
+        return True
+    for first, second, pattern_first, pattern_second in (
+            (a, b, pattern_a, pattern_b), (b, a, pattern_b, pattern_a)):
+        first_lower, second_lower = first.lower(), second.lower()
+        for k in range(1, min(len(first), len(second))):
+            if first_lower[-k:] != second_lower[:k]:
+                continue
+            # first followed by the rest of second, sharing k characters
+            text = first + second[k:]
+            if pattern_first.match(text) and pattern_second.match(text, len(first) - k):
+                return True
+    return False
+
+
+@dataclass(slots=True)
 class ConsistencyIssue:
     """Represents a consistency issue found in the story"""
 
-    def __init__(self, issue_type: str, severity: str, description: str,
-                 locations: List[str], details: Dict = None):
-        self.issue_type = issue_type  # character, plot, world, timeline
-        self.severity = severity  # critical, warning, info
-        self.description = description
-        self.locations = locations
-        self.details = details or {}
+    issue_type: str  # character, plot, world, timeline
+    severity: str  # critical, warning, info
+    description: str
+    locations: List[str]
+    details: Dict = field(default_factory=dict)
 
     def __repr__(self):
         return f"ConsistencyIssue({self.severity}: {self.description})"
@@ -71,27 +104,73 @@ class ConsistencyChecker:
         'role': r'\*\*Role:\*\*\s*(.+?)(?:\n|$)',
     }
 
+    # Directories holding character profiles and story content
+    CHARACTER_DIRS = ('characters', 'Characters', 'cast', 'Cast')
+    CONTENT_DIRS = ('chapters', 'Chapters', 'scenes', 'Scenes', 'story')
+
+    # Files larger than this are assumed not to be hand-written story content
+    MAX_FILE_BYTES = 10 * 1024 * 1024
+
     def __init__(self, project_root: str):
         self.project_root = Path(project_root)
         self.characters: Dict[str, CharacterProfile] = {}
         self.issues: List[ConsistencyIssue] = []
         self.world_facts: Dict[str, Tuple[str, str]] = {}  # fact -> (value, location)
-
-    def scan_directory(self, directory: Path) -> List[Path]:
-        """Recursively find all markdown files in directory"""
+        self._alias_to_canonical: Dict[str, str] = {}  # casefolded name/alias -> canonical name
+        self._name_scan_re = None  # combined name/alias scanner (re or re2)
+        self._overlapping_name_scans: List[Tuple[object, List[str]]] = []  # (scanner, canonical names)
+        self._name_patterns: Dict[str, str] = {}  # canonical name -> name/alias alternation
+        self._name_needles: Optional[List[bytes]] = None  # lowercase UTF-8 names for prefiltering
+        self._skipped_files: Set[Path] = set()
+
+    def scan_directory(self, directory: Path,
+                       rel_dir: Optional[str] = None) -> List[Tuple[Path, str]]:
+        """Recursively find all markdown files in directory.
+
+        Returns (path, project-relative path) pairs so the relative location
+        is computed once at discovery instead of in every check.
+        """
         md_files = []
-        if not directory.exists():
+        if rel_dir is None:
+            rel_dir = str(directory.relative_to(self.project_root))
+
+        try:
+            entries = os.scandir(directory)
+        except (FileNotFoundError, NotADirectoryError):
             return md_files
 
-        for item in directory.iterdir():
-            if item.is_file() and item.suffix == '.md':
-                md_files.append(item)
-            elif item.is_dir() and not item.name.startswith('.'):
-                md_files.extend(self.scan_directory(item))
+        with entries:
+            for entry in entries:
+                if entry.is_file() and os.path.splitext(entry.name)[1] == '.md':
+                    md_files.append((Path(entry.path), os.path.join(rel_dir, entry.name)))
+                elif entry.is_dir() and not entry.name.startswith('.'):
+                    md_files.extend(self.scan_directory(
+                        Path(entry.path), os.path.join(rel_dir, entry.name)))
 
         return md_files
 
-    def load_character_profile(self, file_path: Path) -> Optional[CharacterProfile]:
+    def discover_files(self) -> Tuple[List[Tuple[Path, str]], List[Tuple[Path, str]]]:
+        """Find character profile and content files with a single walk of the project"""
+        try:
+            with os.scandir(self.project_root) as entries:
+                top_dirs = {entry.name: Path(entry.path) for entry in entries if entry.is_dir()}
+        except (FileNotFoundError, NotADirectoryError):
+            top_dirs = {}
+
+        char_files = []
+        for dirname in self.CHARACTER_DIRS:
+            if dirname in top_dirs:
+                char_files.extend(self.scan_directory(top_dirs[dirname], dirname))
+
+        content_files = []
+        for dirname in self.CONTENT_DIRS:
+            if dirname in top_dirs:
+                content_files.extend(self.scan_directory(top_dirs[dirname], dirname))
+
+        return char_files, content_files
+
+    def load_character_profile(self, file_path: Path,
+                               location: Optional[str] = None) -> Optional[CharacterProfile]:
         """Load character information from a profile file"""
         try:
             content = file_path.read_text(encoding='utf-8')
@@ -101,8 +180,10 @@ class ConsistencyChecker:
             if not name_match:
                 return None
 
-            name = name_match.group(1).strip()
-            profile = CharacterProfile(name, str(file_path.relative_to(self.project_root)))
+            name = sys.intern(name_match.group(1).strip())
+            if location is None:
+                location = str(file_path.relative_to(self.project_root))
+            profile = CharacterProfile(name, location)
 
             # Extract attributes
             for attr_name, pattern in self.ATTRIBUTE_PATTERNS.items():
@@ -117,7 +198,7 @@ class ConsistencyChecker:
             )
             if alias_match:
                 aliases = re.split(r'[,;]', alias_match.group(1))
-                profile.aliases = [a.strip() for a in aliases if a.strip()]
+                profile.aliases = [sys.intern(a.strip()) for a in aliases if a.strip()]
 
             return profile
 
@@ -126,35 +207,145 @@ class ConsistencyChecker:
                   file=sys.stderr)
             return None
 
-    def load_all_characters(self):
+    def load_all_characters(self, char_files: Optional[List[Tuple[Path, str]]] = None):
         """Load all character profiles from the project"""
-        char_dirs = ['characters', 'Characters', 'cast', 'Cast']
+        if char_files is None:
+            char_files, _ = self.discover_files()
+
+        for char_file, location in char_files:
+            profile = self.load_character_profile(char_file, location)
+            if profile:
+                self.characters[profile.name] = profile
+
+        self._build_name_index()
+
+    def _build_name_index(self):
+        """Build the alias -> canonical name index and the name scanners"""
+        self._alias_to_canonical = {}
+        self._name_patterns = {}
+        all_names: Dict[str, List[str]] = {}  # every name/alias as written -> its characters
+        for canonical, profile in self.characters.items():
+            self._alias_to_canonical[canonical.casefold()] = canonical
+            for alias in profile.aliases:
+                self._alias_to_canonical.setdefault(alias.casefold(), canonical)
+
+            names = sorted([canonical] + profile.aliases, key=len, reverse=True)
+            for name in dict.fromkeys(names):
+                all_names.setdefault(name, []).append(canonical)
+            self._name_patterns[canonical] = (
+                r'\b(?:' + '|'.join(re.escape(n) for n in names) + r')\b'
+            )
 
-        for dirname in char_dirs:
-            char_dir = self.project_root / dirname
-            if char_dir.exists():
-                for char_file in self.scan_directory(char_dir):
-                    profile = self.load_character_profile(char_file)
-                    if profile:
-                        self.characters[profile.name] = profile
+        # bytes.lower() only folds ASCII, so the raw-bytes prefilter is only
+        # safe when every name is ASCII; otherwise always decode and scan
+        if all(n.isascii() for n in all_names):
+            self._name_needles = [n.lower().encode('utf-8') for n in all_names]
+        else:
+            self._name_needles = None
+
+        # A name that can overlap another one ("Lee" in "Anna Lee") would be
+        # hidden by the longer match in a combined alternation, and a name
+        # shared by several characters maps to only one of them there, so
+        # both get their own scanner; every name then finds the same matches
+        # as a lone scan
+        names_sorted = sorted(all_names, key=len, reverse=True)
+        overlapping = {name for name, owners in all_names.items() if len(owners) > 1}
+        for i, name in enumerate(names_sorted):
+            for other in names_sorted[i + 1:]:
+                if _names_overlap(name, other):
+                    overlapping.update((name, other))
+        self._overlapping_name_scans = [
+            (compile_scanner(r'\b' + re.escape(n) + r'\b'), all_names[n])
+            for n in names_sorted if n in overlapping
+        ]
+
+        # Names are scanned as written: casefolding could change them ("ß" -> "ss")
+        shared = [n for n in names_sorted if n not in overlapping]
+        if not shared:
+            self._name_scan_re = None
+            return
+        self._name_scan_re = compile_scanner(
+            r'\b(?:' + '|'.join(re.escape(n) for n in shared) + r')\b'
+        )
+
+    def _read_raw(self, file_path: Path) -> Optional[bytes]:
+        """Read a file's bytes, skipping oversized or binary files"""
+        raw = None
+        if file_path.stat().st_size <= self.MAX_FILE_BYTES:
+            raw = file_path.read_bytes()
+        if raw is None or b'\x00' in raw:
+            if file_path not in self._skipped_files:
+                self._skipped_files.add(file_path)
+                print(f"Warning: Skipping {file_path} (binary or larger than "
+                      f"{self.MAX_FILE_BYTES} bytes)", file=sys.stderr)
+            return None
+        return raw
+
+    def read_content(self, file_path: Path) -> Optional[str]:
+        """Read a markdown file as text, or None if it should be skipped"""
+        raw = self._read_raw(file_path)
+        return raw.decode('utf-8') if raw is not None else None
+
+    def read_content_with_characters(self, file_path: Path) -> Optional[str]:
+        """Read a markdown file only if it may mention a known character"""
+        if not self.characters:
+            return None
 
-    def check_character_mentions(self, file_path: Path):
+        raw = self._read_raw(file_path)
+        if raw is None:
+            return None
+
+        # Conservative substring prefilter: false positives are resolved by
+        # the regex pass, but files without any name skip decoding entirely
+        if self._name_needles is not None:
+            lowered = raw.lower()
+            if not any(needle in lowered for needle in self._name_needles):
+                return None
+
+        return raw.decode('utf-8')
+
+    def _iter_name_mentions(self, content: str):
+        """Yield (mention as written, canonical name) for each name/alias match"""
+        if self._name_scan_re is not None:
+            for match in self._name_scan_re.finditer(content):
+                mention = match.group(0)
+                # Case-insensitive matching can fold more than casefold() does,
+                # so an unmapped match is skipped rather than raising
+                char_name = self._alias_to_canonical.get(mention.casefold())
+                if char_name is not None:
+                    yield mention, char_name
+        for scanner, char_names in self._overlapping_name_scans:
+            for match in scanner.finditer(content):
+                for char_name in char_names:
+                    yield match.group(0), char_name
+
+    def find_mentioned_characters(self, content: str) -> Set[str]:
+        """Return canonical names of all characters mentioned by name or alias"""
+        return {char_name for _, char_name in self._iter_name_mentions(content)}
+
+    def check_character_mentions(self, file_path: Path, location: Optional[str] = None):
         """Check character mentions in content for inconsistencies"""
         try:
-            content = file_path.read_text(encoding='utf-8')
-            location = str(file_path.relative_to(self.project_root))
+            content = self.read_content_with_characters(file_path)
+            if content is None:
+                return
+            if location is None:
+                location = str(file_path.relative_to(self.project_root))
+            mentioned = self.find_mentioned_characters(content)
+            content_lower = content.casefold()
 
             for char_name, profile in self.characters.items():
-                # Check if character is mentioned
-                if not re.search(r'\b' + re.escape(char_name) + r'\b', content, re.IGNORECASE):
+                # Check if character is mentioned (by name or alias)
+                if char_name not in mentioned:
                     continue
+                name_pattern = self._name_patterns[char_name]
 
                 # Check for attribute contradictions
                 for attr_name, attr_value in profile.attributes.items():
                     # Look for contradicting descriptions
                     if attr_name == 'age':
                         age_mentions = re.finditer(
-                            r'\b' + re.escape(char_name) + r'\b[^.!?]*\b(\d+)[\s-](?:year|yr)',
+                            name_pattern + r'[^.!?]*\b(\d+)[\s-](?:year|yr)',
                             content, re.IGNORECASE
                         )
                         for match in age_mentions:
@@ -174,18 +365,20 @@ class ConsistencyChecker:
                                 ))
 
                     elif attr_name in ['hair', 'eyes']:
+                        # Skip the descriptive scan if the attribute never appears
+                        if attr_name not in content_lower:
+                            continue
+
                         # Check for contradicting physical descriptions
-                        desc_pattern = rf'\b{re.escape(char_name)}\b[^.!?]*\b({attr_name})\b[^.!?]*'
+                        profile_value_lower = attr_value.lower()
+                        desc_pattern = rf'{name_pattern}[^.!?]*\b({attr_name})\b[^.!?]*'
                         desc_mentions = re.finditer(desc_pattern, content, re.IGNORECASE)
                         for match in desc_mentions:
                             context = match.group(0).lower()
                             # Simple check: if profile says "black hair" but text says "blonde"
-                            profile_value_lower = attr_value.lower()
                             if profile_value_lower not in context:
                                 # Extract the contradicting description
-                                color_pattern = r'\b(black|brown|blonde|red|auburn|white|gray|grey|blue|green|hazel)\b'
-                                colors = re.findall(color_pattern, context, re.IGNORECASE)
-                                if colors:
+                                if _COLOR_RE.search(context):
                                     self.issues.append(ConsistencyIssue(
                                         issue_type='character',
                                         severity='warning',
@@ -215,11 +408,14 @@ class ConsistencyChecker:
             # Flag inconsistencies
             pass
 
-    def check_world_building(self, file_path: Path):
+    def check_world_building(self, file_path: Path, location: Optional[str] = None):
         """Check for world-building inconsistencies"""
         try:
-            content = file_path.read_text(encoding='utf-8')
-            location = str(file_path.relative_to(self.project_root))
+            content = self.read_content(file_path)
+            if content is None:
+                return
+            if location is None:
+                location = str(file_path.relative_to(self.project_root))
 
             # Look for world-building facts (places, magic systems, technology, etc.)
             # This is a simplified version - would need more sophisticated pattern matching
@@ -252,38 +448,34 @@ class ConsistencyChecker:
         # - Locations visited before discovery
         pass
 
-    def check_name_variations(self, file_path: Path):
+    def check_name_variations(self, file_path: Path, location: Optional[str] = None):
         """Check for inconsistent name usage"""
         try:
-            content = file_path.read_text(encoding='utf-8')
-            location = str(file_path.relative_to(self.project_root))
-
-            # Check if character names are spelled consistently
-            for char_name, profile in self.characters.items():
-                # Look for potential misspellings (Levenshtein distance)
-                # This is simplified - would use actual string distance algorithm
-
-                # Check for variations in capitalization
-                variations = re.findall(
-                    r'\b' + re.escape(char_name) + r'\b',
-                    content,
-                    re.IGNORECASE
-                )
-
-                inconsistent_caps = [v for v in variations if v != char_name]
-                if inconsistent_caps:
-                    unique_variations = list(set(inconsistent_caps))
-                    if len(unique_variations) > 0:
-                        self.issues.append(ConsistencyIssue(
-                            issue_type='character',
-                            severity='info',
-                            description=f"Name capitalization variations for {char_name}",
-                            locations=[location],
-                            details={
-                                'character': char_name,
-                                'variations': unique_variations
-                            }
-                        ))
+            content = self.read_content_with_characters(file_path)
+            if content is None:
+                return
+            if location is None:
+                location = str(file_path.relative_to(self.project_root))
+
+            # Collect capitalization variations of each canonical name from
+            # the name scanners' matches
+            variations: Dict[str, Dict[str, None]] = {}
+            for mention, char_name in self._iter_name_mentions(content):
+                if mention != char_name and mention.casefold() == char_name.casefold():
+                    variations.setdefault(char_name, {})[mention] = None
+
+            for char_name in self.characters:
+                if char_name in variations:
+                    self.issues.append(ConsistencyIssue(
+                        issue_type='character',
+                        severity='info',
+                        description=f"Name capitalization variations for {char_name}",
+                        locations=[location],
+                        details={
+                            'character': char_name,
+                            'variations': list(variations[char_name])
+                        }
+                    ))
 
         except Exception as e:
             print(f"Warning: Error checking names in {file_path}: {e}", file=sys.stderr)
@@ -291,32 +483,26 @@ class ConsistencyChecker:
     def analyze_project(self) -> Dict:
         """Run all consistency checks on the project"""
 
-        # Load character profiles
-        self.load_all_characters()
+        # Discover files, then load character profiles
+        char_files, content_files = self.discover_files()
+        self.load_all_characters(char_files)
 
-        # Check all content files
-        content_dirs = ['chapters', 'Chapters', 'scenes', 'Scenes', 'story']
-        content_files = []
-
-        for dirname in content_dirs:
-            content_dir = self.project_root / dirname
-            if content_dir.exists():
-                content_files.extend(self.scan_directory(content_dir))
-
-        # Run checks on each file
-        for content_file in content_files:
-            self.check_character_mentions(content_file)
-            self.check_world_building(content_file)
-            self.check_name_variations(content_file)
+        # Run checks on each content file
+        for content_file, location in content_files:
+            self.check_character_mentions(content_file, location)
+            self.check_world_building(content_file, location)
+            self.check_name_variations(content_file, location)
 
         # Run project-wide checks
         self.check_character_relationships()
         self.check_plot_consistency()
 
         # Organize results
+        # Materialize each issue dict once and share it between both views
+        all_issues = [issue.to_dict() for issue in self.issues]
         issues_by_severity = defaultdict(list)
-        for issue in self.issues:
-            issues_by_severity[issue.severity].append(issue.to_dict())
+        for issue_dict in all_issues:
+            issues_by_severity[issue_dict['severity']].append(issue_dict)
 
         analysis = {
             'total_issues': len(self.issues),
@@ -325,7 +511,7 @@ class ConsistencyChecker:
             'info': len(issues_by_severity['info']),
             'characters_analyzed': len(self.characters),
             'issues_by_severity': dict(issues_by_severity),
-            'all_issues': [issue.to_dict() for issue in self.issues]
+            'all_issues': all_issues
         }
 
         return analysis
@@ -348,18 +534,19 @@ def main():
     analysis = checker.analyze_project()
 
     if output_format == 'json':
-        print(json.dumps(analysis, indent=2))
+        write_json(analysis)
     else:
-        # Markdown output
-        print("# Consistency Analysis\n")
-        print(f"**Total Issues Found:** {analysis['total_issues']}")
-        print(f"- Critical: {analysis['critical_issues']}")
-        print(f"- Warnings: {analysis['warnings']}")
-        print(f"- Info: {analysis['info']}\n")
-        print(f"**Characters Analyzed:** {analysis['characters_analyzed']}\n")
+        # Markdown output, buffered and written with a single call
+        out = []
+        out.append("# Consistency Analysis\n")
+        out.append(f"**Total Issues Found:** {analysis['total_issues']}")
+        out.append(f"- Critical: {analysis['critical_issues']}")
+        out.append(f"- Warnings: {analysis['warnings']}")
+        out.append(f"- Info: {analysis['info']}\n")
+        out.append(f"**Characters Analyzed:** {analysis['characters_analyzed']}\n")
 
         if analysis['total_issues'] == 0:
-            print("✅ No consistency issues found!\n")
+            out.append("✅ No consistency issues found!\n")
         else:
             # Display issues by severity
             for severity in ['critical', 'warning', 'info']:
@@ -370,21 +557,23 @@ def main():
                         'warning': '⚠️',
                         'info': 'ℹ️'
                     }
-                    print(f"\n## {severity_emoji[severity]} {severity.upper()}\n")
+                    out.append(f"\n## {severity_emoji[severity]} {severity.upper()}\n")
 
                     for issue in issues:
-                        print(f"### {issue['description']}")
-                        print(f"**Type:** {issue['type']}")
-                        print(f"**Locations:**")
+                        out.append(f"### {issue['description']}")
+                        out.append(f"**Type:** {issue['type']}")
+                        out.append(f"**Locations:**")
                         for loc in issue['locations']:
-                            print(f"- {loc}")
+                            out.append(f"- {loc}")
 
                         if issue['details']:
-                            print(f"**Details:**")
+                            out.append(f"**Details:**")
                             for key, value in issue['details'].items():
-                                print(f"- {key}: {value}")
+                                out.append(f"- {key}: {value}")
+
+                        out.append('')
 
-                        print()
+        sys.stdout.write('\n'.join(out) + '\n')
 
 
 if __name__ == '__main__':
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Shared helpers for the Storyboard Manager scripts.
+
+Pattern compilation with an optional RE2 backend and JSON output, used by
+both consistency_checker.py and timeline_tracker.py.
+"""
+
+import json
+import re
+import sys
+from typing import Dict
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+
+def compile_scanner(pattern: str):
+    """Compile a case-insensitive multi-pattern scanner.
+
+    Uses google-re2's linear-time automaton when it is installed and the
+    pattern is RE2-compatible; otherwise falls back to the stdlib re engine.
+    Non-ASCII patterns always use re, since RE2's \\b only knows ASCII word
+    characters and would never match around names like "José" or "Zoë".
+    """
+    if re2 is not None and pattern.isascii():
+        try:
+            return re2.compile('(?i)' + pattern)
+        except re2.error:
+            pass
+    return re.compile(pattern, re.IGNORECASE)
+
+
+def write_json(data: Dict):
+    """Stream data to stdout as indented JSON, using orjson when available"""
+    if orjson is not None:
+        sys.stdout.flush()
+        sys.stdout.buffer.write(
+            orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+        )
+        sys.stdout.buffer.flush()
+    else:
+        json.dump(data, sys.stdout, indent=2, ensure_ascii=False)
+        sys.stdout.write('\n')
@@ -8,24 +8,30 @@ timeline events, helping writers maintain chronological consistency.
 
 import os
 import re
-import json
 import sys
 from pathlib import Path
-from typing import List, Dict, Tuple, Optional
+from typing import List, Dict, Tuple, Optional, FrozenSet, Iterable
 from datetime import datetime, timedelta
-from collections import defaultdict
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from storyboard_common import compile_scanner, write_json
 
 
 class TimelineEvent:
     """Represents a single event in the story timeline"""
 
+    __slots__ = ('content', 'preview', 'location', 'chapter', 'timepoint', 'characters')
+
     def __init__(self, content: str, location: str, chapter: str = None,
-                 timepoint: str = None, characters: List[str] = None):
+                 timepoint: str = None, characters: Iterable[str] = None):
         self.content = content
+        self.preview = content[:200]  # Computed once, shared by every grouping
         self.location = location  # File path where event was found
         self.chapter = chapter
         self.timepoint = timepoint  # Relative time (e.g., "Day 1", "3 weeks later")
-        self.characters = characters or []
+        # Interned canonical names; a frozenset dedups and keeps membership O(1)
+        self.characters: FrozenSet[str] = frozenset(characters or ())
 
     def __repr__(self):
         return f"TimelineEvent({self.timepoint}: {self.content[:50]}...)"
@@ -44,31 +50,73 @@ class TimelineTracker:
         r'\*\*Date:\*\*\s*(.+?)(?:\n|$)',
     ]
 
+    # All time patterns as one alternation; each alternative has exactly one
+    # capture group, so match.lastindex identifies which pattern fired
+    _COMBINED_TIME_RE = compile_scanner(
+        '|'.join(f'(?:{pattern})' for pattern in TIME_PATTERNS)
+    )
+
     # Patterns to detect character mentions
     CHARACTER_PATTERNS = [
         r'\*\*Characters?:\*\*\s*(.+?)(?:\n|$)',
         r'\*\*(?:POV|Perspective):\*\*\s*(.+?)(?:\n|$)',
     ]
 
+    # Directories holding character profiles and story content
+    CHARACTER_DIRS = ('characters', 'Characters', 'cast')
+    CONTENT_DIRS = ('chapters', 'Chapters', 'scenes', 'Scenes', 'story')
+
     def __init__(self, project_root: str):
         self.project_root = Path(project_root)
         self.events: List[TimelineEvent] = []
         self.characters: set = set()
 
-    def scan_directory(self, directory: Path) -> List[Path]:
-        """Recursively find all markdown files in directory"""
+    def scan_directory(self, directory: Path,
+                       rel_dir: Optional[str] = None) -> List[Tuple[Path, str]]:
+        """Recursively find all markdown files in directory.
+
+        Returns (path, project-relative path) pairs so the relative location
+        is computed once at discovery instead of once per event.
+        """
         md_files = []
-        if not directory.exists():
+        if rel_dir is None:
+            rel_dir = str(directory.relative_to(self.project_root))
+
+        try:
+            entries = os.scandir(directory)
+        except (FileNotFoundError, NotADirectoryError):
             return md_files
 
-        for item in directory.iterdir():
-            if item.is_file() and item.suffix == '.md':
-                md_files.append(item)
-            elif item.is_dir() and not item.name.startswith('.'):
-                md_files.extend(self.scan_directory(item))
+        with entries:
+            for entry in entries:
+                if entry.is_file() and os.path.splitext(entry.name)[1] == '.md':
+                    md_files.append((Path(entry.path), os.path.join(rel_dir, entry.name)))
+                elif entry.is_dir() and not entry.name.startswith('.'):
+                    md_files.extend(self.scan_directory(
+                        Path(entry.path), os.path.join(rel_dir, entry.name)))
 
         return md_files
 
+    def discover_files(self) -> Tuple[List[Tuple[Path, str]], List[Tuple[Path, str]]]:
+        """Find character profile and content files with a single walk of the project"""
+        try:
+            with os.scandir(self.project_root) as entries:
+                top_dirs = {entry.name: Path(entry.path) for entry in entries if entry.is_dir()}
+        except (FileNotFoundError, NotADirectoryError):
+            top_dirs = {}
+
+        char_files = []
+        for dirname in self.CHARACTER_DIRS:
+            if dirname in top_dirs:
+                char_files.extend(self.scan_directory(top_dirs[dirname], dirname))
+
+        content_files = []
+        for dirname in self.CONTENT_DIRS:
+            if dirname in top_dirs:
+                content_files.extend(self.scan_directory(top_dirs[dirname], dirname))
+
+        return char_files, content_files
+
     def extract_characters_from_file(self, file_path: Path) -> List[str]:
         """Extract character names from character profile files"""
         try:
@@ -77,12 +125,12 @@ class TimelineTracker:
             # Look for character name in title (# Character Name)
             name_match = re.search(r'^#\s+(.+?)$', content, re.MULTILINE)
             if name_match:
-                return [name_match.group(1).strip()]
+                return [sys.intern(name_match.group(1).strip())]
 
             # Look for explicit name field
             name_match = re.search(r'\*\*Name:\*\*\s*(.+?)(?:\n|$)', content)
             if name_match:
-                return [name_match.group(1).strip()]
+                return [sys.intern(name_match.group(1).strip())]
 
         except Exception as e:
             print(f"Warning: Could not read {file_path}: {e}", file=sys.stderr)
@@ -93,12 +141,13 @@ class TimelineTracker:
         """Extract time markers from content, return list of (timepoint, position)"""
         markers = []
 
-        for pattern in self.TIME_PATTERNS:
-            for match in re.finditer(pattern, content, re.IGNORECASE):
-                timepoint = match.group(1) if match.lastindex else match.group(0)
-                markers.append((timepoint.strip(), match.start()))
+        # finditer yields matches left to right, so markers are already in
+        # position order and need no sort
+        for match in self._COMBINED_TIME_RE.finditer(content):
+            timepoint = match.group(match.lastindex) if match.lastindex else match.group(0)
+            markers.append((timepoint.strip(), match.start()))
 
-        return sorted(markers, key=lambda x: x[1])
+        return markers
 
     def extract_character_mentions(self, content: str) -> List[str]:
         """Extract character names from explicit character markers"""
@@ -110,7 +159,7 @@ class TimelineTracker:
                 char_text = match.group(1)
                 # Split by commas, 'and', '&'
                 names = re.split(r'[,&]|\sand\s', char_text)
-                characters.extend([name.strip() for name in names if name.strip()])
+                characters.extend([sys.intern(name.strip()) for name in names if name.strip()])
 
         return characters
 
@@ -123,9 +172,12 @@ class TimelineTracker:
                 found.append(character)
         return found
 
-    def parse_chapter_file(self, file_path: Path) -> List[TimelineEvent]:
+    def parse_chapter_file(self, file_path: Path,
+                           location: Optional[str] = None) -> List[TimelineEvent]:
         """Parse a chapter/scene file for timeline events"""
         events = []
+        if location is None:
+            location = str(file_path.relative_to(self.project_root))
 
         try:
             content = file_path.read_text(encoding='utf-8')
@@ -151,29 +203,28 @@ class TimelineTracker:
                     section_content = content[start_pos:end_pos]
 
                     # Find characters in this section
-                    section_chars = explicit_chars.copy()
-                    section_chars.extend(self.find_character_references(
-                        section_content, self.characters))
+                    section_chars = frozenset(explicit_chars).union(
+                        self.find_character_references(section_content, self.characters))
 
                     event = TimelineEvent(
                         content=section_content[:500],  # First 500 chars as preview
-                        location=str(file_path.relative_to(self.project_root)),
+                        location=location,
                         chapter=chapter,
                         timepoint=timepoint,
-                        characters=list(set(section_chars))
+                        characters=section_chars
                     )
                     events.append(event)
             else:
                 # No explicit markers, treat whole file as one event
-                all_chars = explicit_chars.copy()
-                all_chars.extend(self.find_character_references(content, self.characters))
+                all_chars = frozenset(explicit_chars).union(
+                    self.find_character_references(content, self.characters))
 
                 event = TimelineEvent(
                     content=content[:500],
-                    location=str(file_path.relative_to(self.project_root)),
+                    location=location,
                     chapter=chapter,
                     timepoint=None,
-                    characters=list(set(all_chars))
+                    characters=all_chars
                 )
                 events.append(event)
 
@@ -185,82 +236,63 @@ class TimelineTracker:
     def analyze_project(self) -> Dict:
         """Analyze entire project and build timeline"""
 
+        char_files, content_files = self.discover_files()
+
         # First, find all characters
-        char_dirs = ['characters', 'Characters', 'cast']
-        for dirname in char_dirs:
-            char_dir = self.project_root / dirname
-            if char_dir.exists():
-                for char_file in self.scan_directory(char_dir):
-                    names = self.extract_characters_from_file(char_file)
-                    self.characters.update(names)
+        for char_file, _ in char_files:
+            self.characters.update(self.extract_characters_from_file(char_file))
 
         # Then scan chapters/scenes
-        content_dirs = ['chapters', 'Chapters', 'scenes', 'Scenes', 'story']
-        for dirname in content_dirs:
-            content_dir = self.project_root / dirname
-            if content_dir.exists():
-                for content_file in self.scan_directory(content_dir):
-                    events = self.parse_chapter_file(content_file)
-                    self.events.extend(events)
+        for content_file, location in content_files:
+            self.events.extend(self.parse_chapter_file(content_file, location))
 
         # Build analysis
+        by_time, by_character, by_chapter = self._build_groupings()
         analysis = {
             'total_events': len(self.events),
             'total_characters': len(self.characters),
             'characters': sorted(list(self.characters)),
-            'events_by_timepoint': self._group_events_by_time(),
-            'events_by_character': self._group_events_by_character(),
-            'events_by_chapter': self._group_events_by_chapter(),
+            'events_by_timepoint': by_time,
+            'events_by_character': by_character,
+            'events_by_chapter': by_chapter,
             'timeline': self._build_timeline(),
             'warnings': self._check_consistency()
         }
 
         return analysis
 
-    def _group_events_by_time(self) -> Dict[str, List[Dict]]:
-        """Group events by their timepoint"""
-        grouped = defaultdict(list)
+    def _build_groupings(self) -> Tuple[Dict[str, List[Dict]], Dict[str, List[Dict]],
+                                         Dict[str, List[Dict]]]:
+        """Group events by timepoint, character and chapter in a single pass"""
+        by_time: Dict[str, List[Dict]] = {}
+        by_character: Dict[str, List[Dict]] = {}
+        by_chapter: Dict[str, List[Dict]] = {}
 
         for event in self.events:
-            timepoint = event.timepoint or "Unspecified"
-            grouped[timepoint].append({
+            characters = sorted(event.characters)
+            by_time.setdefault(event.timepoint or "Unspecified", []).append({
                 'location': event.location,
                 'chapter': event.chapter,
-                'characters': event.characters,
-                'preview': event.content[:200]
+                'characters': characters,
+                'preview': event.preview
             })
 
-        return dict(grouped)
-
-    def _group_events_by_character(self) -> Dict[str, List[Dict]]:
-        """Group events by character appearance"""
-        grouped = defaultdict(list)
-
-        for event in self.events:
             for character in event.characters:
-                grouped[character].append({
+                by_character.setdefault(character, []).append({
                     'location': event.location,
                     'chapter': event.chapter,
                     'timepoint': event.timepoint,
-                    'preview': event.content[:200]
+                    'preview': event.preview
                 })
 
-        return dict(grouped)
-
-    def _group_events_by_chapter(self) -> Dict[str, List[Dict]]:
-        """Group events by chapter"""
-        grouped = defaultdict(list)
-
-        for event in self.events:
-            chapter = event.chapter or "Unknown"
-            grouped[chapter].append({
+            by_chapter.setdefault(event.chapter or "Unknown", []).append({
                 'location': event.location,
                 'timepoint': event.timepoint,
-                'characters': event.characters,
-                'preview': event.content[:200]
+                'characters': characters,
+                'preview': event.preview
             })
 
-        return dict(grouped)
+        return by_time, by_character, by_chapter
 
     def _build_timeline(self) -> List[Dict]:
         """Build chronological timeline of events"""
@@ -273,8 +305,8 @@ class TimelineTracker:
                 'timepoint': event.timepoint or "Unknown",
                 'chapter': event.chapter,
                 'location': event.location,
-                'characters': event.characters,
-                'preview': event.content[:200]
+                'characters': sorted(event.characters),
+                'preview': event.preview
             })
 
         return timeline
@@ -321,31 +353,34 @@ def main():
     analysis = tracker.analyze_project()
 
     if output_format == 'json':
-        print(json.dumps(analysis, indent=2))
+        write_json(analysis)
     else:
-        # Markdown output
-        print("# Timeline Analysis\n")
-        print(f"**Total Events:** {analysis['total_events']}")
-        print(f"**Total Characters:** {analysis['total_characters']}\n")
+        # Markdown output, buffered and written with a single call
+        out = []
+        out.append("# Timeline Analysis\n")
+        out.append(f"**Total Events:** {analysis['total_events']}")
+        out.append(f"**Total Characters:** {analysis['total_characters']}\n")
 
-        print("## Characters")
+        out.append("## Characters")
         for char in analysis['characters']:
             appearances = len(analysis['events_by_character'].get(char, []))
-            print(f"- {char} ({appearances} appearances)")
+            out.append(f"- {char} ({appearances} appearances)")
 
-        print("\n## Timeline")
+        out.append("\n## Timeline")
         for event in analysis['timeline']:
-            print(f"\n### {event['timepoint']} - {event['chapter']}")
-            print(f"**Location:** {event['location']}")
+            out.append(f"\n### {event['timepoint']} - {event['chapter']}")
+            out.append(f"**Location:** {event['location']}")
             if event['characters']:
-                print(f"**Characters:** {', '.join(event['characters'])}")
-            print(f"\n{event['preview']}...\n")
-            print("---")
+                out.append(f"**Characters:** {', '.join(event['characters'])}")
+            out.append(f"\n{event['preview']}...\n")
+            out.append("---")
 
         if analysis['warnings']:
-            print("\n## Warnings")
+            out.append("\n## Warnings")
             for warning in analysis['warnings']:
-                print(f"- ⚠️  {warning}")
+                out.append(f"- ⚠️  {warning}")
+
+        sys.stdout.write('\n'.join(out) + '\n')
 
 
 if __name__ == '__main__':
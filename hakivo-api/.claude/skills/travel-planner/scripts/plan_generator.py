@@ -11,8 +11,152 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from travel_db import get_preferences, add_trip
 import json
+import re
 from datetime import datetime, timedelta
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
+
+
+# Per-slot itinerary templates; each day copies these and fills in "activity"
+_MORNING_TEMPLATE = {
+    "time": "9:00 AM - 12:00 PM",
+    "activity": "",
+    "type": "sightseeing",
+    "duration": "3 hours",
+    "notes": "Based on user interests"
+}
+_AFTERNOON_TEMPLATE = {
+    "time": "2:00 PM - 5:00 PM",
+    "activity": "",
+    "type": "experience",
+    "duration": "3 hours",
+    "notes": ""
+}
+_EVENING_TEMPLATE = {
+    "time": "7:00 PM - 10:00 PM",
+    "activity": "",
+    "type": "dining",
+    "duration": "2-3 hours",
+    "notes": ""
+}
+_MEALS_TEMPLATE = {
+    "breakfast": "Hotel/Local cafe",
+    "lunch": "Near afternoon activity",
+    "dinner": "Local restaurant recommendation"
+}
+
+# Default budget share per category for each accommodation level
+_BUDGET_SHARES = {
+    "budget": {
+        "accommodation": 0.40,
+        "food": 0.25,
+        "activities": 0.20,
+        "transportation": 0.10,
+        "miscellaneous": 0.05
+    },
+    "mid-range": {
+        "accommodation": 0.35,
+        "food": 0.25,
+        "activities": 0.25,
+        "transportation": 0.10,
+        "miscellaneous": 0.05
+    },
+    "luxury": {
+        "accommodation": 0.45,
+        "food": 0.20,
+        "activities": 0.20,
+        "transportation": 0.10,
+        "miscellaneous": 0.05
+    }
+}
+
+# Shares flattened to (category, share, percentage) tuples once at import
+_BUDGET_ALLOCATIONS = {
+    level: tuple((category, share, share * 100) for category, share in shares.items())
+    for level, shares in _BUDGET_SHARES.items()
+}
+
+# Activity keyword -> extra packing items
+_ACTIVITY_ITEMS = {
+    "hiking": ("Hiking boots", "Backpack", "Water bottle", "Trail snacks"),
+    "beach": ("Swimsuit", "Beach towel", "Snorkel gear", "Waterproof bag"),
+    "formal": ("Dress clothes", "Dress shoes", "Nice accessories"),
+    "adventure": ("Athletic wear", "Action camera", "First aid kit"),
+    "business": ("Business attire", "Laptop", "Business cards", "Portfolio")
+}
+
+# All activity keywords as one alternation, so each activity is scanned once
+_ACTIVITY_KEYWORD_RE = re.compile("|".join(map(re.escape, _ACTIVITY_ITEMS)))
+
+# Pre-trip timeline as (entry, minimum days before departure). Task lists are
+# tuples so the shared entries can't be changed; plans get list copies.
+_PRE_TRIP_TIMELINE = (
+    ({
+        "timeline": "3 months before",
+        "tasks": (
+            "Research destination and create wish list",
+            "Check passport expiration (needs 6+ months validity)",
+            "Research visa requirements",
+            "Set up travel alerts for flights",
+            "Start saving/budgeting for trip"
+        )
+    }, 90),
+    ({
+        "timeline": "2 months before",
+        "tasks": (
+            "Book flights",
+            "Book accommodation",
+            "Apply for visa if needed",
+            "Purchase travel insurance",
+            "Check vaccination requirements",
+            "Research local customs and etiquette"
+        )
+    }, 60),
+    ({
+        "timeline": "1 month before",
+        "tasks": (
+            "Book major activities and tours",
+            "Notify bank of travel dates",
+            "Set up international phone plan",
+            "Make restaurant reservations",
+            "Check weather forecasts",
+            "Start gathering packing items"
+        )
+    }, 30),
+    ({
+        "timeline": "2 weeks before",
+        "tasks": (
+            "Confirm all reservations",
+            "Print important documents",
+            "Exchange some currency",
+            "Refill prescriptions",
+            "Arrange pet/plant care",
+            "Hold mail delivery"
+        )
+    }, 14),
+    ({
+        "timeline": "1 week before",
+        "tasks": (
+            "Check in for flights",
+            "Download offline maps",
+            "Pack luggage",
+            "Charge all devices",
+            "Clean out refrigerator",
+            "Set up home security"
+        )
+    }, 7),
+)
+
+_DAY_BEFORE_TASKS = {
+    "timeline": "Day before departure",
+    "tasks": (
+        "Re-check flight times",
+        "Prepare carry-on essentials",
+        "Take out trash",
+        "Check weather at destination",
+        "Get good rest",
+        "Set multiple alarms"
+    )
+}
 
 
 def generate_daily_itinerary(destination: str, num_days: int,
@@ -23,52 +167,21 @@ def generate_daily_itinerary(destination: str, num_days: int,
     This is a template that should be filled with actual attractions and activities
     based on web research or user input.
     """
-    itinerary = []
-
-    activities_per_day = {
-        "relaxed": 2,
-        "moderate": 3,
-        "packed": 4
-    }
-
-    num_activities = activities_per_day.get(pace, 3)
+    # Evening slot is dropped for a relaxed pace (fewer activities per day)
+    include_evening = pace != "relaxed"
 
+    itinerary = []
     for day in range(1, num_days + 1):
         day_plan = {
             "day": day,
             "date": "",  # To be filled with actual dates
-            "morning": {
-                "time": "9:00 AM - 12:00 PM",
-                "activity": f"Activity {day}A (to be customized)",
-                "type": "sightseeing",
-                "duration": "3 hours",
-                "notes": "Based on user interests"
-            },
-            "afternoon": {
-                "time": "2:00 PM - 5:00 PM",
-                "activity": f"Activity {day}B (to be customized)",
-                "type": "experience",
-                "duration": "3 hours",
-                "notes": ""
-            },
-            "evening": {
-                "time": "7:00 PM - 10:00 PM",
-                "activity": f"Activity {day}C (to be customized)",
-                "type": "dining",
-                "duration": "2-3 hours",
-                "notes": ""
-            },
-            "meals": {
-                "breakfast": "Hotel/Local cafe",
-                "lunch": "Near afternoon activity",
-                "dinner": "Local restaurant recommendation"
-            },
-            "accommodation": "Hotel/Accommodation name"
+            "morning": {**_MORNING_TEMPLATE, "activity": f"Activity {day}A (to be customized)"},
+            "afternoon": {**_AFTERNOON_TEMPLATE, "activity": f"Activity {day}B (to be customized)"},
         }
-
-        if pace == "relaxed":
-            day_plan.pop("evening")  # Fewer activities for relaxed pace
-
+        if include_evening:
+            day_plan["evening"] = {**_EVENING_TEMPLATE, "activity": f"Activity {day}C (to be customized)"}
+        day_plan["meals"] = dict(_MEALS_TEMPLATE)
+        day_plan["accommodation"] = "Hotel/Accommodation name"
         itinerary.append(day_plan)
 
     return itinerary
@@ -79,41 +192,30 @@ def calculate_budget_breakdown(total_budget: float, num_days: int,
     """
     Generate budget breakdown by category.
     """
-    # Default percentage allocations
-    allocations = {
-        "budget": {
-            "accommodation": 0.40,
-            "food": 0.25,
-            "activities": 0.20,
-            "transportation": 0.10,
-            "miscellaneous": 0.05
-        },
-        "mid-range": {
-            "accommodation": 0.35,
-            "food": 0.25,
-            "activities": 0.25,
-            "transportation": 0.10,
-            "miscellaneous": 0.05
-        },
-        "luxury": {
-            "accommodation": 0.45,
-            "food": 0.20,
-            "activities": 0.20,
-            "transportation": 0.10,
-            "miscellaneous": 0.05
-        }
-    }
+    allocation = _BUDGET_ALLOCATIONS.get(accommodation_level, _BUDGET_ALLOCATIONS["mid-range"])
+    return _budget_breakdown(total_budget, num_days, allocation)
+
+
+def calculate_budget_breakdowns(total_budgets: List[float], num_days: List[int],
+                                accommodation_level: str = "mid-range") -> List[Dict[str, Any]]:
+    """
+    Generate budget breakdowns for many trips sharing one accommodation level.
+    """
+    allocation = _BUDGET_ALLOCATIONS.get(accommodation_level, _BUDGET_ALLOCATIONS["mid-range"])
+    return [_budget_breakdown(total, days, allocation)
+            for total, days in zip(total_budgets, num_days)]
 
-    allocation = allocations.get(accommodation_level, allocations["mid-range"])
 
+def _budget_breakdown(total_budget: float, num_days: int,
+                      allocation: Tuple[Tuple[str, float, float], ...]) -> Dict[str, Any]:
+    """Apply a precomputed (category, share, percentage) allocation to one budget."""
     breakdown = {}
-    for category, percentage in allocation.items():
-        amount = total_budget * percentage
-        per_day = amount / num_days if num_days > 0 else 0
+    for category, share, percentage in allocation:
+        amount = total_budget * share
         breakdown[category] = {
             "total": round(amount, 2),
-            "per_day": round(per_day, 2),
-            "percentage": percentage * 100
+            "per_day": round(amount / num_days, 2) if num_days > 0 else 0,
+            "percentage": percentage
         }
 
     return {
@@ -192,136 +294,67 @@ def generate_packing_checklist(destination_climate: str, duration_days: int,
             "Sneakers"
         ])
 
-    # Add activity-specific items
-    activity_items = {
-        "hiking": ["Hiking boots", "Backpack", "Water bottle", "Trail snacks"],
-        "beach": ["Swimsuit", "Beach towel", "Snorkel gear", "Waterproof bag"],
-        "formal": ["Dress clothes", "Dress shoes", "Nice accessories"],
-        "adventure": ["Athletic wear", "Action camera", "First aid kit"],
-        "business": ["Business attire", "Laptop", "Business cards", "Portfolio"]
-    }
-
+    # Add activity-specific items. Activities are the only category that can
+    # accrue duplicates; dedupe at insertion with an insertion-ordered dict
+    activity_checklist = {}
     for activity in trip_activities:
-        activity_lower = activity.lower()
-        for key, items in activity_items.items():
-            if key in activity_lower:
-                checklist["activities"].extend(items)
-
-    # Remove duplicates
-    for category in checklist:
-        checklist[category] = list(set(checklist[category]))
+        for key in _ACTIVITY_KEYWORD_RE.findall(activity.lower()):
+            activity_checklist.update(dict.fromkeys(_ACTIVITY_ITEMS[key]))
+    checklist["activities"] = list(activity_checklist)
 
     return checklist
 
 
-def generate_pre_trip_checklist(destination_country: str, departure_date: str) -> List[Dict[str, Any]]:
+def _parse_departure(departure_date: Any) -> Optional[datetime]:
+    """Parse an ISO departure date, or None when it is missing or malformed."""
+    try:
+        return datetime.fromisoformat(departure_date)
+    except (TypeError, ValueError):
+        return None
+
+
+def generate_pre_trip_checklist(destination_country: str, departure_date: str,
+                                today: Optional[datetime] = None) -> List[Dict[str, Any]]:
     """
     Generate pre-trip preparation checklist with timeline.
-    """
-    try:
-        departure = datetime.fromisoformat(departure_date)
-    except:
-        # If date parsing fails, use relative timeline
-        departure = datetime.now() + timedelta(days=30)
-
-    today = datetime.now()
-    days_until = (departure - today).days
-
-    checklist = []
-
-    # 3 months before (90 days)
-    if days_until >= 90:
-        checklist.append({
-            "timeline": "3 months before",
-            "tasks": [
-                "Research destination and create wish list",
-                "Check passport expiration (needs 6+ months validity)",
-                "Research visa requirements",
-                "Set up travel alerts for flights",
-                "Start saving/budgeting for trip"
-            ]
-        })
 
-    # 2 months before (60 days)
-    if days_until >= 60:
-        checklist.append({
-            "timeline": "2 months before",
-            "tasks": [
-                "Book flights",
-                "Book accommodation",
-                "Apply for visa if needed",
-                "Purchase travel insurance",
-                "Check vaccination requirements",
-                "Research local customs and etiquette"
-            ]
-        })
+    Pass ``today`` to pin the reference time (e.g. for batch runs).
+    """
+    if today is None:
+        today = datetime.now()
 
-    # 1 month before (30 days)
-    if days_until >= 30:
-        checklist.append({
-            "timeline": "1 month before",
-            "tasks": [
-                "Book major activities and tours",
-                "Notify bank of travel dates",
-                "Set up international phone plan",
-                "Make restaurant reservations",
-                "Check weather forecasts",
-                "Start gathering packing items"
-            ]
-        })
+    departure = _parse_departure(departure_date)
+    if departure is None:
+        # If the date is missing or invalid, use relative timeline (a departure
+        # 30 days from now, which is just under 30 whole days away)
+        return _pre_trip_checklist_from_days(29)
 
-    # 2 weeks before
-    if days_until >= 14:
-        checklist.append({
-            "timeline": "2 weeks before",
-            "tasks": [
-                "Confirm all reservations",
-                "Print important documents",
-                "Exchange some currency",
-                "Refill prescriptions",
-                "Arrange pet/plant care",
-                "Hold mail delivery"
-            ]
-        })
+    return _pre_trip_checklist_from_days((departure - today).days)
 
-    # 1 week before
-    if days_until >= 7:
-        checklist.append({
-            "timeline": "1 week before",
-            "tasks": [
-                "Check in for flights",
-                "Download offline maps",
-                "Pack luggage",
-                "Charge all devices",
-                "Clean out refrigerator",
-                "Set up home security"
-            ]
-        })
 
-    # Day before
-    checklist.append({
-        "timeline": "Day before departure",
-        "tasks": [
-            "Re-check flight times",
-            "Prepare carry-on essentials",
-            "Take out trash",
-            "Check weather at destination",
-            "Get good rest",
-            "Set multiple alarms"
-        ]
-    })
+def _pre_trip_checklist_from_days(days_until: int) -> List[Dict[str, Any]]:
+    """Build the pre-trip checklist for a departure ``days_until`` days away."""
+    entries = [entry for entry, min_days in _PRE_TRIP_TIMELINE if days_until >= min_days]
+    entries.append(_DAY_BEFORE_TASKS)
 
-    return checklist
+    return [{"timeline": entry["timeline"], "tasks": list(entry["tasks"])} for entry in entries]
 
 
 def generate_trip_plan(trip_data: Dict[str, Any]) -> Dict[str, Any]:
     """
     Generate complete trip plan with all components.
     """
-    destination = trip_data.get("destination", {})
-    duration = trip_data.get("duration_days", 7)
-    budget = trip_data.get("budget", {}).get("total", 0)
-    departure_date = trip_data.get("departure_date", "")
+    return generate_trip_plans([trip_data])[0]
+
+
+def generate_trip_plans(trips: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Generate complete trip plans for many trips at once.
+
+    Preferences, the timestamp and the budget allocation are resolved once
+    for the whole batch instead of once per trip.
+    """
+    now = datetime.now()
 
     # Get user preferences
     prefs = get_preferences()
@@ -329,35 +362,48 @@ def generate_trip_plan(trip_data: Dict[str, Any]) -> Dict[str, Any]:
     pace = prefs.get("pace_preference", "moderate")
     accommodation_level = prefs.get("budget_level", "mid-range")
 
-    # Generate components
-    plan = {
-        "trip_id": trip_data.get("id", ""),
-        "destination": destination,
-        "dates": {
-            "departure": trip_data.get("departure_date", ""),
-            "return": trip_data.get("return_date", ""),
-            "duration_days": duration
-        },
-        "itinerary": generate_daily_itinerary(
-            destination.get("city", ""),
-            duration,
-            interests,
-            pace
-        ),
-        "budget": calculate_budget_breakdown(budget, duration, accommodation_level),
-        "packing_checklist": generate_packing_checklist(
-            trip_data.get("climate", "moderate"),
-            duration,
-            trip_data.get("activities", [])
-        ),
-        "pre_trip_checklist": generate_pre_trip_checklist(
-            destination.get("country", ""),
-            departure_date
-        ),
-        "generated_at": datetime.now().isoformat()
-    }
+    durations = [trip.get("duration_days", 7) for trip in trips]
+    budgets = calculate_budget_breakdowns(
+        [trip.get("budget", {}).get("total", 0) for trip in trips],
+        durations,
+        accommodation_level
+    )
+    generated_at = now.isoformat()
+
+    plans = []
+    for trip_data, duration, budget in zip(trips, durations, budgets):
+        destination = trip_data.get("destination", {})
+
+        # Generate components
+        plans.append({
+            "trip_id": trip_data.get("id", ""),
+            "destination": destination,
+            "dates": {
+                "departure": trip_data.get("departure_date", ""),
+                "return": trip_data.get("return_date", ""),
+                "duration_days": duration
+            },
+            "itinerary": generate_daily_itinerary(
+                destination.get("city", ""),
+                duration,
+                interests,
+                pace
+            ),
+            "budget": budget,
+            "packing_checklist": generate_packing_checklist(
+                trip_data.get("climate", "moderate"),
+                duration,
+                trip_data.get("activities", [])
+            ),
+            "pre_trip_checklist": generate_pre_trip_checklist(
+                destination.get("country", ""),
+                trip_data.get("departure_date", ""),
+                today=now
+            ),
+            "generated_at": generated_at
+        })
 
-    return plan
+    return plans
 
 
 if __name__ == "__main__":
@@ -383,8 +429,9 @@ if __name__ == "__main__":
     plan = generate_trip_plan(trip)
 
     if args.output:
+        payload = json.dumps(plan, indent=2)
         with open(args.output, 'w') as f:
-            json.dump(plan, f, indent=2)
+            f.write(payload)
         print(f"✓ Travel plan generated: {args.output}")
     else:
         print(json.dumps(plan, indent=2))
@@ -5,19 +5,53 @@ Travel Planner Database Manager
 Manages user travel preferences, past trips, and current trip plans.
 """
 
+import bisect
+import copy
 import json
+import mmap
 import os
+import shutil
+import time
+from contextlib import contextmanager
 from pathlib import Path
 from datetime import datetime, timedelta
 from typing import Dict, Any, List, Optional
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 DB_DIR = Path.home() / ".claude" / "travel_planner"
 PREFERENCES_FILE = DB_DIR / "preferences.json"
 TRIPS_FILE = DB_DIR / "trips.json"
+# Per-trip files appended to instead of rewriting trips.json
+TRIP_DATA_DIR = DB_DIR / "trips"
+
+# Parsed file contents by path, with the (mtime_ns, size) they were read at;
+# set TRAVEL_DB_NO_CACHE to always read from disk
+_JSON_CACHE: Dict[Path, tuple] = {}
+
+# Expense totals by expenses file, with the (mtime_ns, size) they cover
+_EXPENSE_TOTALS: Dict[Path, tuple] = {}
+
+# With orjson, files at least this large are parsed from a memory map
+# instead of being copied into a bytes object first
+_MMAP_THRESHOLD = 64 * 1024
+
+# Last id handed out by _new_id()
+_LAST_ID = [0]
+
+# Set once ensure_db_files() has checked the files in this process
+_DB_READY = False
 
 
 def ensure_db_files() -> None:
-    """Ensure all database files exist."""
+    """Ensure all database files exist (checked once per process)."""
+    global _DB_READY
+    if _DB_READY:
+        return
+
     DB_DIR.mkdir(parents=True, exist_ok=True)
 
     if not PREFERENCES_FILE.exists():
@@ -37,7 +71,7 @@ def ensure_db_files() -> None:
             "previous_destinations": [],
             "bucket_list": []
         }
-        PREFERENCES_FILE.write_text(json.dumps(default_prefs, indent=2))
+        _write_json(PREFERENCES_FILE, default_prefs)
 
     if not TRIPS_FILE.exists():
         default_trips = {
@@ -45,24 +79,100 @@ def ensure_db_files() -> None:
             "past_trips": [],
             "trip_ideas": []
         }
-        TRIPS_FILE.write_text(json.dumps(default_trips, indent=2))
+        _write_json(TRIPS_FILE, default_trips)
+
+    _DB_READY = True
+
+
+def _file_stamp(file_path: Path) -> tuple:
+    """Modification time and size identifying the current file contents."""
+    st = file_path.stat()
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _cache_enabled() -> bool:
+    """Whether parsed files may be reused between calls."""
+    return not os.environ.get("TRAVEL_DB_NO_CACHE")
 
 
-def load_json(file_path: Path) -> Dict[str, Any]:
-    """Load JSON from file."""
+def _parse_file(file_path: Path, size: int) -> Any:
+    """Parse a JSON file of the given size."""
+    if orjson is None:
+        return json.loads(file_path.read_bytes())
+    if size < _MMAP_THRESHOLD:
+        return orjson.loads(file_path.read_bytes())
+
+    with open(file_path, 'rb') as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        view = memoryview(mm)
+        try:
+            return orjson.loads(view)
+        finally:
+            view.release()
+
+
+def _new_id() -> int:
+    """Nanosecond timestamp id, bumped so ids made in the same tick differ."""
+    now = time.time_ns()
+    if now <= _LAST_ID[0]:
+        now = _LAST_ID[0] + 1
+    _LAST_ID[0] = now
+    return now
+
+
+def load_json(file_path: Path, _recreate: bool = True) -> Dict[str, Any]:
+    """
+    Load JSON from file, reusing the parsed copy while the file is unchanged.
+
+    The cached object itself is returned, so callers that modify it are
+    expected to pass it to save_json. Public getters return copies.
+    """
     ensure_db_files()
     try:
-        with open(file_path, 'r') as f:
-            return json.load(f)
-    except (json.JSONDecodeError, FileNotFoundError):
+        stamp = _file_stamp(file_path)
+        cached = _JSON_CACHE.get(file_path)
+        if cached is not None and cached[0] == stamp and _cache_enabled():
+            return cached[1]
+        data = _parse_file(file_path, stamp[1])
+    except json.JSONDecodeError:
         return {}
+    except FileNotFoundError:
+        if not _recreate:
+            return {}
+        # Removed since the files were checked: recreate the defaults once
+        global _DB_READY
+        _DB_READY = False
+        return load_json(file_path, _recreate=False)
+    if _cache_enabled():
+        _JSON_CACHE[file_path] = (stamp, data)
+    return data
+
+
+def _write_json(file_path: Path, data: Dict[str, Any]) -> None:
+    """Write data to file as compact JSON, replacing the file atomically."""
+    # Serialize first so the file gets one write instead of one per token.
+    # Written compact; the export command prints an indented copy
+    if orjson is not None:
+        payload = orjson.dumps(data)
+    else:
+        payload = json.dumps(data, separators=(',', ':')).encode()
+
+    # Write a temporary file and rename it over the original, so a crash
+    # mid-write leaves the previous contents rather than a truncated file
+    tmp_path = file_path.with_suffix(file_path.suffix + ".tmp")
+    with open(tmp_path, 'wb') as f:
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, file_path)
 
 
 def save_json(file_path: Path, data: Dict[str, Any]) -> None:
     """Save JSON to file."""
     ensure_db_files()
-    with open(file_path, 'w') as f:
-        json.dump(data, f, indent=2)
+    _write_json(file_path, data)
+    if _cache_enabled():
+        _JSON_CACHE[file_path] = (_file_stamp(file_path), data)
 
 
 # ============================================================================
@@ -77,7 +187,7 @@ def is_initialized() -> bool:
 
 def get_preferences() -> Dict[str, Any]:
     """Get user travel preferences."""
-    return load_json(PREFERENCES_FILE)
+    return copy.deepcopy(load_json(PREFERENCES_FILE))
 
 
 def save_preferences(preferences: Dict[str, Any]) -> None:
@@ -113,12 +223,19 @@ def add_to_bucket_list(destination: str, notes: str = "") -> None:
 
 def add_previous_destination(destination: str) -> None:
     """Add to list of previously visited destinations."""
+    add_previous_destinations([destination])
+
+
+def add_previous_destinations(destinations: List[str]) -> None:
+    """Add several previously visited destinations with a single save."""
     prefs = load_json(PREFERENCES_FILE)
-    if "previous_destinations" not in prefs:
-        prefs["previous_destinations"] = []
+    previous = prefs.setdefault("previous_destinations", [])
 
-    if destination not in prefs["previous_destinations"]:
-        prefs["previous_destinations"].append(destination)
+    seen = set(previous)
+    for destination in destinations:
+        if destination not in seen:
+            seen.add(destination)
+            previous.append(destination)
     save_json(PREFERENCES_FILE, prefs)
 
 
@@ -126,6 +243,76 @@ def add_previous_destination(destination: str) -> None:
 # TRIP MANAGEMENT
 # ============================================================================
 
+TRIP_LISTS = ("current_trips", "past_trips", "trip_ideas")
+
+# id -> (list name, position) over the trips data it was built from
+_TRIP_INDEX: Dict[str, Any] = {"data": None, "index": None}
+
+
+def _trip_index(trips: Dict[str, Any], rebuild: bool = False) -> Dict[str, tuple]:
+    """Map trip ids to their (list name, position) in trips (first one wins)."""
+    if rebuild or _TRIP_INDEX["data"] is not trips or _TRIP_INDEX["index"] is None:
+        index = {}
+        for name in TRIP_LISTS:
+            for i, trip in enumerate(trips.get(name, [])):
+                index.setdefault(trip.get("id"), (name, i))
+        _TRIP_INDEX["data"], _TRIP_INDEX["index"] = trips, index
+    return _TRIP_INDEX["index"]
+
+
+def _find_trip(trips: Dict[str, Any], trip_id: str, lists: tuple = TRIP_LISTS) -> Optional[tuple]:
+    """
+    Locate a trip as (list name, position), or None if it is not in lists.
+
+    Index entries are checked against the data, and a stale or missing entry
+    triggers one rebuild, so edits that bypass the index stay correct.
+    """
+    for rebuild in (False, True):
+        position = _trip_index(trips, rebuild).get(trip_id)
+        if position is not None:
+            name, i = position
+            trip_list = trips[name]
+            if i < len(trip_list) and trip_list[i].get("id") == trip_id:
+                return position if name in lists else None
+    return None
+
+
+class TripsSession(dict):
+    """Trips data yielded by trips_session(); dirty is set once it is modified."""
+    dirty = False
+
+
+@contextmanager
+def trips_session():
+    """
+    Load the trips once for a batch of changes and save them once at the end.
+
+    Pass the yielded data as trips= to add_trip, add_expense and
+    add_itinerary_item; they then use it in memory instead of loading
+    (and, apart from add_expense, saving) the file on every call. Nothing is written if no change was
+    made, and changes made before an error are still saved.
+
+    Usage:
+        with trips_session() as trips:
+            for item in items:
+                add_itinerary_item(trip_id, item, trips=trips)
+    """
+    trips = TripsSession(copy.deepcopy(load_json(TRIPS_FILE)))
+    try:
+        yield trips
+    finally:
+        if trips.dirty:
+            save_json(TRIPS_FILE, trips)
+
+
+def _save_trips(trips: Dict[str, Any], deferred: bool) -> None:
+    """Save trips now, or mark a caller-provided session as needing a save."""
+    if not deferred:
+        save_json(TRIPS_FILE, trips)
+    elif isinstance(trips, TripsSession):
+        trips.dirty = True
+
+
 def get_trips(status: str = "all") -> Dict[str, List[Dict]]:
     """
     Get trips by status.
@@ -136,38 +323,41 @@ def get_trips(status: str = "all") -> Dict[str, List[Dict]]:
     trips = load_json(TRIPS_FILE)
 
     if status == "all":
-        return trips
+        return copy.deepcopy(trips)
     elif status in ["current", "past", "ideas"]:
         key = f"{status}_trips" if status != "ideas" else "trip_ideas"
-        return {key: trips.get(key, [])}
+        return {key: copy.deepcopy(trips.get(key, []))}
     return {}
 
 
-def add_trip(trip: Dict[str, Any], status: str = "current") -> str:
+def add_trip(trip: Dict[str, Any], status: str = "current",
+             trips: Optional[Dict[str, Any]] = None) -> str:
     """
     Add a new trip.
 
     Args:
         trip: Trip data
         status: "current", "past", or "idea"
+        trips: Data from trips_session() to add to instead of the file
 
     Returns:
         Trip ID
     """
-    trips = load_json(TRIPS_FILE)
+    deferred = trips is not None
+    if not deferred:
+        trips = load_json(TRIPS_FILE)
 
-    trip_id = str(datetime.now().timestamp())
+    trip_id = str(_new_id())
     trip["id"] = trip_id
     trip["created_at"] = datetime.now().isoformat()
 
-    if status == "current":
-        trips["current_trips"].append(trip)
-    elif status == "past":
-        trips["past_trips"].append(trip)
-    elif status == "idea":
-        trips["trip_ideas"].append(trip)
+    name = {"current": "current_trips", "past": "past_trips", "idea": "trip_ideas"}.get(status)
+    if name:
+        trips[name].append(trip)
+        if _TRIP_INDEX["data"] is trips and _TRIP_INDEX["index"] is not None:
+            _TRIP_INDEX["index"].setdefault(trip_id, (name, len(trips[name]) - 1))
 
-    save_json(TRIPS_FILE, trips)
+    _save_trips(trips, deferred)
     return trip_id
 
 
@@ -175,110 +365,270 @@ def update_trip(trip_id: str, updates: Dict[str, Any]) -> bool:
     """Update a trip."""
     trips = load_json(TRIPS_FILE)
 
-    for trip_list in [trips["current_trips"], trips["past_trips"], trips["trip_ideas"]]:
-        for trip in trip_list:
-            if trip.get("id") == trip_id:
-                trip.update(updates)
-                trip["updated_at"] = datetime.now().isoformat()
-                save_json(TRIPS_FILE, trips)
-                return True
-    return False
+    position = _find_trip(trips, trip_id)
+    if position is None:
+        return False
+    new_id = updates.get("id", trip_id)
+    if new_id != trip_id and not _valid_new_id(trips, new_id):
+        return False
+    name, i = position
+    trip = trips[name][i]
+    trip.update(updates)
+    trip["updated_at"] = datetime.now().isoformat()
+    if "id" in updates:
+        _TRIP_INDEX["index"] = None
+    save_json(TRIPS_FILE, trips)
+    if new_id != trip_id:
+        _move_trip_data(trip_id, new_id)
+    return True
+
+
+def _valid_new_id(trips: Dict[str, Any], new_id: Any) -> bool:
+    """Check a trip id change: a free id that is a single plain path part."""
+    if not isinstance(new_id, str) or new_id in ("", ".", ".."):
+        return False
+    if Path(new_id).name != new_id:
+        return False
+    return _find_trip(trips, new_id) is None and not (TRIP_DATA_DIR / new_id).exists()
+
+
+def _move_trip_data(old_id: str, new_id: str) -> None:
+    """Move a trip's per-trip files (expenses.jsonl) to follow an id change."""
+    old_dir, new_dir = TRIP_DATA_DIR / old_id, TRIP_DATA_DIR / new_id
+    if not old_dir.exists():
+        return
+    if new_dir.exists():
+        raise FileExistsError(f"Trip data already exists for id {new_id}")
+    old_dir.rename(new_dir)
+    _EXPENSE_TOTALS.pop(old_dir / "expenses.jsonl", None)
+    _EXPENSE_TOTALS.pop(new_dir / "expenses.jsonl", None)
+
+
+def _get_trip(trip_id: str) -> Optional[Dict[str, Any]]:
+    """The cached trip with this ID, for read-only use inside this module."""
+    trips = load_json(TRIPS_FILE)
+
+    position = _find_trip(trips, trip_id)
+    if position is None:
+        return None
+    name, i = position
+    return trips[name][i]
 
 
 def get_trip_by_id(trip_id: str) -> Optional[Dict[str, Any]]:
     """Get a specific trip by ID."""
-    trips = load_json(TRIPS_FILE)
-
-    for trip_list in [trips["current_trips"], trips["past_trips"], trips["trip_ideas"]]:
-        for trip in trip_list:
-            if trip.get("id") == trip_id:
-                return trip
-    return None
+    return copy.deepcopy(_get_trip(trip_id))
 
 
 def move_trip_to_past(trip_id: str) -> bool:
     """Move a current trip to past trips."""
     trips = load_json(TRIPS_FILE)
 
-    for i, trip in enumerate(trips["current_trips"]):
-        if trip.get("id") == trip_id:
-            trip["completed_at"] = datetime.now().isoformat()
-            trips["current_trips"].pop(i)
-            trips["past_trips"].append(trip)
-            save_json(TRIPS_FILE, trips)
-            return True
-    return False
+    position = _find_trip(trips, trip_id, ("current_trips",))
+    if position is None:
+        return False
+    trip = trips["current_trips"].pop(position[1])
+    trip["completed_at"] = datetime.now().isoformat()
+    trips["past_trips"].append(trip)
+    # Later positions shifted; rebuild the index on the next lookup
+    _TRIP_INDEX["index"] = None
+    save_json(TRIPS_FILE, trips)
+    return True
 
 
 def delete_trip(trip_id: str) -> bool:
     """Delete a trip."""
     trips = load_json(TRIPS_FILE)
 
-    for trip_list in [trips["current_trips"], trips["past_trips"], trips["trip_ideas"]]:
-        for i, trip in enumerate(trip_list):
-            if trip.get("id") == trip_id:
-                trip_list.pop(i)
-                save_json(TRIPS_FILE, trips)
-                return True
-    return False
+    position = _find_trip(trips, trip_id)
+    if position is None:
+        return False
+    name, i = position
+    trips[name].pop(i)
+    _TRIP_INDEX["index"] = None
+    save_json(TRIPS_FILE, trips)
+    shutil.rmtree(TRIP_DATA_DIR / trip_id, ignore_errors=True)
+    return True
 
 
 # ============================================================================
 # BUDGET TRACKING
 # ============================================================================
 
-def add_expense(trip_id: str, expense: Dict[str, Any]) -> bool:
-    """Add an expense to a trip."""
-    trips = load_json(TRIPS_FILE)
+def add_expense(trip_id: str, expense: Dict[str, Any],
+                trips: Optional[Dict[str, Any]] = None) -> bool:
+    """
+    Add an expense to a trip (to trips from trips_session() if given).
+
+    The expense is appended to the trip's expenses.jsonl and trips.json is
+    left untouched; totals are computed from the records when they are read.
+    """
+    if trips is None:
+        trips = load_json(TRIPS_FILE)
+
+    if _find_trip(trips, trip_id, ("current_trips", "past_trips")) is None:
+        return False
 
-    for trip_list in [trips["current_trips"], trips["past_trips"]]:
-        for trip in trip_list:
-            if trip.get("id") == trip_id:
-                if "expenses" not in trip:
-                    trip["expenses"] = []
+    expense["id"] = _new_id()
+    if "date" not in expense:
+        expense["date"] = datetime.now().isoformat()
+    _append_expense(trip_id, expense)
+    return True
 
-                expense["id"] = datetime.now().timestamp()
-                expense["date"] = expense.get("date", datetime.now().isoformat())
-                trip["expenses"].append(expense)
 
-                # Update total spent
-                if "budget" not in trip:
-                    trip["budget"] = {}
+def _expenses_path(trip_id: str) -> Path:
+    """JSON Lines file holding a trip's expenses."""
+    return TRIP_DATA_DIR / trip_id / "expenses.jsonl"
 
-                total = sum(e.get("amount", 0) for e in trip["expenses"])
-                trip["budget"]["spent"] = total
 
-                save_json(TRIPS_FILE, trips)
-                return True
-    return False
+def _iter_expenses(trip_id: str):
+    """Stream the expenses stored in a trip's expenses.jsonl."""
+    try:
+        with open(_expenses_path(trip_id), 'rb') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    yield orjson.loads(line) if orjson is not None else json.loads(line)
+                except json.JSONDecodeError:
+                    # A partial line left by an interrupted append
+                    continue
+    except FileNotFoundError:
+        return
+
+
+def _expense_totals(trip_id: str) -> Dict[str, Any]:
+    """Totals over a trip's expenses.jsonl, reused while the file is unchanged."""
+    path = _expenses_path(trip_id)
+    try:
+        stamp = _file_stamp(path)
+    except FileNotFoundError:
+        stamp = None
+    cached = _EXPENSE_TOTALS.get(path)
+    if cached is not None and cached[0] == stamp and _cache_enabled():
+        return cached[1]
+
+    totals = {"spent": 0, "by_category": {}}
+    for expense in _iter_expenses(trip_id):
+        _add_to_totals(totals, expense)
+    if _cache_enabled():
+        _EXPENSE_TOTALS[path] = (stamp, totals)
+    return totals
+
+
+def _append_expense(trip_id: str, expense: Dict[str, Any]) -> None:
+    """Append an expense to the trip's expenses.jsonl and update its totals."""
+    totals = _expense_totals(trip_id) if _cache_enabled() else None
+
+    path = _expenses_path(trip_id)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if orjson is not None:
+        line = orjson.dumps(expense) + b"\n"
+    else:
+        line = (json.dumps(expense) + "\n").encode()
+    with open(path, 'a+b') as f:
+        # Start a new line if an interrupted append left a partial one
+        end = f.seek(0, os.SEEK_END)
+        if end:
+            f.seek(end - 1)
+            if f.read(1) != b"\n":
+                line = b"\n" + line
+        f.write(line)
+
+    if totals is not None:
+        _add_to_totals(totals, expense)
+        _EXPENSE_TOTALS[path] = (_file_stamp(path), totals)
+
+
+def _add_to_totals(totals: Dict[str, Any], expense: Dict[str, Any]) -> None:
+    """Count an expense in a trip's spent and per-category totals."""
+    amount = expense.get("amount", 0)
+    totals["spent"] += amount
+    by_category = totals["by_category"]
+    category = expense.get("category", "Other")
+    by_category[category] = by_category.get(category, 0) + amount
+
+
+def rebuild_budget_cache(trip_id: str) -> Dict[str, Any]:
+    """
+    Recompute a trip's cached expense totals from its expenses file.
+
+    The cache is refreshed automatically when the file changes; this is only
+    needed if the file was edited without changing its mtime or size.
+    """
+    _EXPENSE_TOTALS.pop(_expenses_path(trip_id), None)
+    totals = _expense_totals(trip_id)
+    return {"spent": totals["spent"], "by_category": dict(totals["by_category"])}
+
+
+def _sum_expenses(expenses) -> float:
+    """Total amount of an iterable of expenses."""
+    return sum(e.get("amount", 0) for e in expenses)
+
+
+def _trip_spent(trip: Dict[str, Any]) -> float:
+    """
+    Total spent on a trip, from its stored and appended expenses.
+
+    Trips without any expense records (e.g. imported with only a total)
+    fall back to their budget["spent"].
+    """
+    expenses = trip.get("expenses") or []
+    trip_id = str(trip.get("id", ""))
+    if not expenses and not _expenses_path(trip_id).exists():
+        return (trip.get("budget") or {}).get("spent", 0)
+    return _sum_expenses(expenses) + _expense_totals(trip_id)["spent"]
+
+
+def rebuild_budget_spent(trip_id: str, trips: Optional[Dict[str, Any]] = None) -> bool:
+    """
+    Store a snapshot of a trip's spent total in budget["spent"].
+
+    Summaries and stats compute spent from the expense records, so this is
+    only needed for readers of trips.json that want the total inline.
+    """
+    deferred = trips is not None
+    if not deferred:
+        trips = load_json(TRIPS_FILE)
+
+    position = _find_trip(trips, trip_id, ("current_trips", "past_trips"))
+    if position is None:
+        return False
+    name, i = position
+    trip = trips[name][i]
+    trip.setdefault("budget", {})["spent"] = _trip_spent(trip)
+    _save_trips(trips, deferred)
+    return True
 
 
 def get_trip_expenses(trip_id: str) -> List[Dict[str, Any]]:
     """Get all expenses for a trip."""
-    trip = get_trip_by_id(trip_id)
+    trip = _get_trip(trip_id)
     if trip:
-        return trip.get("expenses", [])
+        return copy.deepcopy(trip.get("expenses", [])) + list(_iter_expenses(trip_id))
     return []
 
 
 def get_budget_summary(trip_id: str) -> Dict[str, Any]:
     """Get budget summary for a trip."""
-    trip = get_trip_by_id(trip_id)
+    trip = _get_trip(trip_id)
     if not trip:
         return {}
 
     budget = trip.get("budget", {})
-    expenses = trip.get("expenses", [])
-
     total_budget = budget.get("total", 0)
-    spent = sum(e.get("amount", 0) for e in expenses)
-    remaining = total_budget - spent
 
-    # Category breakdown
-    categories = {}
-    for expense in expenses:
-        category = expense.get("category", "Other")
-        categories[category] = categories.get(category, 0) + expense.get("amount", 0)
+    # Expenses still stored in trips.json, then the cached appended totals
+    totals = {"spent": 0, "by_category": {}}
+    for expense in trip.get("expenses", []):
+        _add_to_totals(totals, expense)
+    appended = _expense_totals(trip_id)
+    totals["spent"] += appended["spent"]
+    categories = totals["by_category"]
+    for category, amount in appended["by_category"].items():
+        categories[category] = categories.get(category, 0) + amount
+    spent = totals["spent"]
+    remaining = total_budget - spent
 
     return {
         "total_budget": total_budget,
@@ -293,31 +643,35 @@ def get_budget_summary(trip_id: str) -> Dict[str, Any]:
 # ITINERARY MANAGEMENT
 # ============================================================================
 
-def add_itinerary_item(trip_id: str, item: Dict[str, Any]) -> bool:
-    """Add an item to trip itinerary."""
-    trips = load_json(TRIPS_FILE)
+def add_itinerary_item(trip_id: str, item: Dict[str, Any],
+                       trips: Optional[Dict[str, Any]] = None) -> bool:
+    """Add an item to trip itinerary (to trips from trips_session() if given)."""
+    deferred = trips is not None
+    if not deferred:
+        trips = load_json(TRIPS_FILE)
 
-    for trip in trips["current_trips"]:
-        if trip.get("id") == trip_id:
-            if "itinerary" not in trip:
-                trip["itinerary"] = []
+    position = _find_trip(trips, trip_id, ("current_trips",))
+    if position is None:
+        return False
+    trip = trips["current_trips"][position[1]]
 
-            item["id"] = datetime.now().timestamp()
-            trip["itinerary"].append(item)
+    if "itinerary" not in trip:
+        trip["itinerary"] = []
 
-            # Sort by date
-            trip["itinerary"].sort(key=lambda x: x.get("date", ""))
+    item["id"] = _new_id()
 
-            save_json(TRIPS_FILE, trips)
-            return True
-    return False
+    # Insert after any items on the same date to keep the list sorted by date
+    bisect.insort(trip["itinerary"], item, key=lambda entry: entry.get("date", ""))
+
+    _save_trips(trips, deferred)
+    return True
 
 
 def get_itinerary(trip_id: str) -> List[Dict[str, Any]]:
     """Get trip itinerary."""
-    trip = get_trip_by_id(trip_id)
+    trip = _get_trip(trip_id)
     if trip:
-        return trip.get("itinerary", [])
+        return copy.deepcopy(trip.get("itinerary", []))
     return []
 
 
@@ -340,18 +694,17 @@ def get_travel_stats() -> Dict[str, Any]:
     total_spent = 0
 
     for trip in past_trips:
-        if trip.get("destination"):
-            dest = trip["destination"]
-            if dest.get("country"):
-                countries_visited.add(dest["country"])
-            if dest.get("city"):
-                cities_visited.add(dest["city"])
-
-        if trip.get("duration_days"):
-            total_days += trip["duration_days"]
-
-        budget = trip.get("budget", {})
-        total_spent += budget.get("spent", 0)
+        dest = trip.get("destination")
+        if dest:
+            country = dest.get("country")
+            if country:
+                countries_visited.add(country)
+            city = dest.get("city")
+            if city:
+                cities_visited.add(city)
+
+        total_days += trip.get("duration_days") or 0
+        total_spent += _trip_spent(trip)
 
     return {
         "total_trips": len(past_trips),
@@ -361,7 +714,7 @@ def get_travel_stats() -> Dict[str, Any]:
         "total_spent": total_spent,
         "current_trips": len(current_trips),
         "bucket_list_size": len(prefs.get("bucket_list", [])),
-        "countries_list": sorted(list(countries_visited)),
+        "countries_list": sorted(countries_visited),
         "average_trip_duration": total_days / len(past_trips) if past_trips else 0
     }
 
@@ -372,9 +725,15 @@ def get_travel_stats() -> Dict[str, Any]:
 
 def export_all() -> Dict[str, Any]:
     """Export all travel data."""
+    trips = {
+        name: [{**trip, "expenses": get_trip_expenses(trip["id"])}
+               if name != "trip_ideas" and "id" in trip else trip
+               for trip in trip_list]
+        for name, trip_list in get_trips("all").items()
+    }
     return {
         "preferences": get_preferences(),
-        "trips": get_trips("all"),
+        "trips": trips,
         "stats": get_travel_stats(),
         "exported_at": datetime.now().isoformat()
     }
@@ -385,6 +744,11 @@ def reset_all() -> None:
     for file_path in [PREFERENCES_FILE, TRIPS_FILE]:
         if file_path.exists():
             file_path.unlink()
+    shutil.rmtree(TRIP_DATA_DIR, ignore_errors=True)
+    global _DB_READY
+    _DB_READY = False
+    _JSON_CACHE.clear()
+    _EXPENSE_TOTALS.clear()
     ensure_db_files()
 
 